@@ -11,8 +11,19 @@
 from functools import wraps
 from typing import Optional, Dict, Any
 import time
-from habit_engine.habit_visualization import visualize_habit_streak
+import heapq
+from collections import OrderedDict
+import traceback
+from bisect import bisect_right
+from habit_engine.habit_visualization import visualize_habit_streak, visualize_dashboard, warm_up_fonts, LiveHabitChart, get_log_index, CHART_STYLES, DATE_RANGES, RENDER_PROFILES, DEFAULT_RENDER_PROFILE, resolve_date_range, format_custom_range, is_valid_date_range, render_cache, render_cache_key, register_rendered_plot
 from habit_engine.habit_io import DATA_DIR, load_settings, save_settings, get_asset_path, reset_app_data, clear_tracking_data, PLOTS_DIR
+from habit_engine.habit_plots import list_plots, has_plots, delete_plot_file, repair_plot_index, get_thumbnail, THUMBNAIL_SIZE, apply_retention_settings, fit_within, load_plot_image
+from habit_engine.habit_workers import RENDER_BACKENDS
+from habit_engine.habit_tasks import TaskExecutor, current_task
+from habit_engine import habit_metrics
+
+# Date range menu entry that opens the custom start/end dialog
+CUSTOM_RANGE_OPTION = "Custom..."
 
 # Lazy imports
 PIL = None  # Will be imported when needed
@@ -22,6 +33,20 @@
 # Store single customtkinter instance
 _ctk_instance = None
 
+# Named (light, dark) colors shared by the view builders
+COLORS = {
+    "text": ("gray10", "gray90"),
+    "text_secondary": ("gray20", "gray80"),
+    "text_muted": ("gray40", "gray60"),
+    "header_bg": ("gray90", "#2B2B2B"),
+    "panel_bg": ("gray95", "#292929"),
+    "card_bg": ("gray95", "#232323"),
+    "control_bg": ("gray80", "gray20"),
+    "control_button": ("gray60", "gray40"),
+    "control_hover": ("gray50", "gray50"),
+    "streak_active": ("#FF6B6B", "#FFB86B"),
+}
+
 class ResourceManager:
     """Manages resources like images and fonts to prevent memory leaks and improve performance"""
     _instance = None
@@ -32,14 +57,68 @@ def __new__(cls):
             cls._instance._initialize()
         return cls._instance
     
+    # Default cap on the decoded bytes held by the image cache
+    DEFAULT_IMAGE_CACHE_BYTES = 64 * 1024 * 1024
+
     def _initialize(self):
-        self._images: Dict[str, Any] = {}
+        # Least recently used first; sizes tracked so the cache stays under its byte cap
+        self._images: "OrderedDict[Any, Any]" = OrderedDict()
+        self._image_sizes: Dict[Any, int] = {}
+        self._image_bytes = 0
+        self._image_cap = self.DEFAULT_IMAGE_CACHE_BYTES
+        self._image_hits = 0
+        self._image_misses = 0
         self._fonts: Dict[str, Any] = {}
         self._callbacks: Dict[str, Any] = {}
+
+    @staticmethod
+    def _estimate_image_bytes(image: Any) -> int:
+        """Decoded size of a CTkImage: its PIL images plus the Tk photo it is displayed with"""
+        try:
+            total = 0
+            pil_images = {id(img): img for img in (image.cget("light_image"), image.cget("dark_image")) if img is not None}
+            for img in pil_images.values():
+                total += img.width * img.height * len(img.getbands())
+            width, height = image.cget("size")
+            return total + int(width * height * 4)
+        except Exception:
+            return 0
+
+    def set_image_cache_limit(self, max_bytes: int) -> None:
+        """Change the image cache's byte cap, evicting least recently used images if needed"""
+        self._image_cap = max(0, int(max_bytes))
+        self._evict_images()
+
+    def _evict_images(self, keep: Any = None) -> None:
+        while self._image_bytes > self._image_cap and self._images:
+            key = next(iter(self._images))
+            if key == keep:
+                if len(self._images) == 1:
+                    break
+                self._images.move_to_end(key)
+                continue
+            self.release_image(key)
+            habit_metrics.increment("images.evicted")
+
+    def release_image(self, key: Any) -> None:
+        """Drop an image from the cache (widgets still showing it keep their own reference)"""
+        if self._images.pop(key, None) is not None:
+            self._image_bytes -= self._image_sizes.pop(key, 0)
+
+    def _lookup_image(self, key: Any) -> Any:
+        image = self._images.get(key)
+        if image is None:
+            self._image_misses += 1
+            habit_metrics.increment("images.misses")
+            return None
+        self._images.move_to_end(key)
+        self._image_hits += 1
+        habit_metrics.increment("images.hits")
+        return image
         
     def cache_image(self, path: str) -> Any:
         """Cache and return an image, loading it only if not already cached"""
-        if path not in self._images:
+        if self._lookup_image(path) is None:
             global PIL
             if PIL is None:
                 from PIL import Image, ImageTk
@@ -51,8 +130,24 @@ def cache_image(self, path: str) -> Any:
                 dark_image=image,
                 size=image.size
             )
-            self._images[path] = ctk_image
+            self.put_image(path, ctk_image)
+            return ctk_image
         return self._images[path]
+
+    def get_image(self, key: Any) -> Any:
+        """Return a cached image stored with put_image (marking it recently used), or None"""
+        return self._lookup_image(key)
+
+    def put_image(self, key: Any, image: Any) -> None:
+        """Cache an already created image (e.g. a CTkImage of a decoded plot) under key"""
+        self.release_image(key)
+        size = self._estimate_image_bytes(image)
+        if size > self._image_cap:
+            return  # Larger than the whole cache: not worth evicting everything for
+        self._images[key] = image
+        self._image_sizes[key] = size
+        self._image_bytes += size
+        self._evict_images(keep=key)
     
     def cache_font(self, name: str, size: int, weight: str = "normal") -> Any:
         """Cache and return a font, creating it only if not already cached"""
@@ -66,6 +161,16 @@ def cache_font(self, name: str, size: int, weight: str = "normal") -> Any:
                 )
         return self._fonts[key]
     
+    def font(self, size: int, weight: str = "normal", family: Optional[str] = None) -> Any:
+        """
+        Shared CTkFont for a size/weight (theme font family unless given).
+        One Tk font object serves every widget that asks for the same style.
+        """
+        key = f"{family or '_theme'}_{size}_{weight}"
+        if key not in self._fonts:
+            self._fonts[key] = init_customtkinter().CTkFont(family=family, size=size, weight=weight)
+        return self._fonts[key]
+
     def debounce(self, wait_ms: int):
         """Decorator to debounce a function call"""
         def decorator(func):
@@ -77,23 +182,294 @@ def call_func():
                     self._callbacks.pop(key, None)
                     func(*args, **kwargs)
                 
-                # Cancel previous timer if it exists
-                if key in self._callbacks:
-                    # Cancel the previous Tk‐after callback on the main window
-                    args[0].window.after_cancel(self._callbacks[key])
-            
-                # Schedule the new callback on the main window’s event loop
-                self._callbacks[key] = args[0].window.after(wait_ms, call_func)
+                # Scheduling the same name again restarts the wait
+                self._callbacks[key] = TimerService.for_widget(args[0].window).schedule(key, wait_ms, call_func)
             
             return debounced
         return decorator
     
+    def stats(self) -> Dict[str, int]:
+        """Cache sizes (image count and bytes against the cap, fonts, pending debounced callbacks) and image hits/misses"""
+        return {"images": len(self._images), "image_bytes": self._image_bytes, "image_cap": self._image_cap,
+                "image_hits": self._image_hits, "image_misses": self._image_misses,
+                "fonts": len(self._fonts), "callbacks": len(self._callbacks)}
+
     def clear(self):
         """Clear all cached resources"""
         self._images.clear()
+        self._image_sizes.clear()
+        self._image_bytes = 0
         self._fonts.clear()
         self._callbacks.clear()
 
+class TimerService:
+    """
+    Owns the timed work of one Tk root: a heap of named jobs driven by a
+    single after() handle, armed only for the earliest due job (nothing is
+    scheduled while no job is pending).
+
+    - Jobs are named; scheduling an existing name replaces it (its timer
+      restarts), or with coalesce=True keeps the original due time and just
+      takes the newer callback.
+    - A job given an owner widget is dropped if the owner no longer exists
+      when it comes due, so callbacks never run against destroyed views.
+    - pending() lists what is scheduled, for the debug view.
+
+    Main thread only: background threads keep handing results over with
+    window.after(0, ...).
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._jobs = {}   # name -> (due, seq, callback, owner)
+        self._heap = []   # (due, seq, name); stale entries are skipped
+        self._seq = 0
+        self._after_id = None
+        self._armed_due = None
+
+    @classmethod
+    def for_widget(cls, widget):
+        """The TimerService of widget's Tk root, created on first use"""
+        root = widget._root()
+        service = getattr(root, "_timer_service", None)
+        if service is None:
+            service = cls(root)
+            root._timer_service = service
+        return service
+
+    def schedule(self, name, delay_ms, callback, owner=None, coalesce=False):
+        """Run callback in delay_ms under name (see class docstring for replace/coalesce)"""
+        existing = self._jobs.get(name)
+        if coalesce and existing is not None:
+            due, seq, _, _ = existing
+            self._jobs[name] = (due, seq, callback, owner)
+            return name
+        self._seq += 1
+        due = time.monotonic() + max(0, delay_ms) / 1000
+        self._jobs[name] = (due, self._seq, callback, owner)
+        heapq.heappush(self._heap, (due, self._seq, name))
+        self._arm()
+        return name
+
+    def cancel(self, name):
+        """Drop a pending job; unknown names are ignored"""
+        if self._jobs.pop(name, None) is not None and not self._jobs:
+            self._disarm()
+
+    def cancel_all(self):
+        self._jobs.clear()
+        self._heap.clear()
+        self._disarm()
+
+    def is_pending(self, name):
+        return name in self._jobs
+
+    def pending(self):
+        """[(name, due_in_ms, owner_alive), ...] soonest first"""
+        now = time.monotonic()
+        jobs = sorted(self._jobs.items(), key=lambda item: item[1][0])
+        return [(name, max(0.0, (due - now) * 1000), self._owner_alive(owner))
+                for name, (due, _, _, owner) in jobs]
+
+    @staticmethod
+    def _owner_alive(owner):
+        if owner is None:
+            return True
+        try:
+            return bool(owner.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def _disarm(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except (ValueError, tk.TclError):
+                pass
+        self._after_id = None
+        self._armed_due = None
+
+    def _arm(self):
+        """Point the single after() handle at the earliest live job"""
+        while self._heap:
+            due, seq, name = self._heap[0]
+            job = self._jobs.get(name)
+            if job is not None and job[1] == seq:
+                break
+            heapq.heappop(self._heap)  # Cancelled or replaced
+        else:
+            self._disarm()
+            return
+        if self._after_id is not None and self._armed_due is not None and self._armed_due <= due:
+            return  # Already armed early enough
+        self._disarm()
+        delay_ms = max(0, int((due - time.monotonic()) * 1000 + 0.5))
+        try:
+            self._after_id = self.root.after(delay_ms, self._run_due)
+            self._armed_due = due
+        except tk.TclError:
+            pass  # Root destroyed
+
+    def _run_due(self):
+        self._after_id = None
+        self._armed_due = None
+        habit_metrics.increment("timers.wakeups")
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            due, seq, name = heapq.heappop(self._heap)
+            job = self._jobs.get(name)
+            if job is None or job[1] != seq:
+                continue
+            del self._jobs[name]
+            _, _, callback, owner = job
+            if not self._owner_alive(owner):
+                habit_metrics.increment("timers.dropped")
+                continue
+            start_time = time.perf_counter()
+            try:
+                callback()
+            except Exception as e:
+                print(f"{Fore.LIGHTRED_EX}Error in timer '{name}': {e}{Style.RESET_ALL}")
+            habit_metrics.record("timers.callback_ms", (time.perf_counter() - start_time) * 1000)
+        self._arm()
+
+class MainThreadStallProbe:
+    """
+    Measures how responsive the Tk event loop stays while background work runs:
+    a short after() tick is rescheduled every interval_ms and any lateness is
+    counted as a main-thread stall. stop() records the worst and total stall
+    in habit_metrics under "<name>.max_stall_ms" / "<name>.total_stall_ms".
+    """
+
+    def __init__(self, widget, name, interval_ms=10):
+        self.widget = widget
+        self.name = name
+        self.interval_ms = interval_ms
+        self.max_stall_ms = 0.0
+        self.total_stall_ms = 0.0
+        self._job = None
+        self._expected = None
+        self._started = None
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._schedule()
+        return self
+
+    def _schedule(self):
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._job = self.widget.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        late_ms = (time.perf_counter() - self._expected) * 1000
+        if late_ms > 0:
+            self.max_stall_ms = max(self.max_stall_ms, late_ms)
+            self.total_stall_ms += late_ms
+        self._schedule()
+
+    def stop(self):
+        """Stop ticking and record the measurement. Returns (elapsed_ms, max_stall_ms, total_stall_ms)."""
+        if self._job is not None:
+            try:
+                self.widget.after_cancel(self._job)
+            except (ValueError, tk.TclError):
+                pass
+            self._job = None
+        elapsed_ms = (time.perf_counter() - self._started) * 1000 if self._started else 0.0
+        habit_metrics.record(f"{self.name}.elapsed_ms", elapsed_ms)
+        habit_metrics.record(f"{self.name}.max_stall_ms", self.max_stall_ms)
+        habit_metrics.record(f"{self.name}.total_stall_ms", self.total_stall_ms)
+        return elapsed_ms, self.max_stall_ms, self.total_stall_ms
+
+class MainLoopWatchdog:
+    """
+    Optional watchdog for the Tk main loop. A heartbeat after() callback runs
+    every interval_ms; a daemon thread checks it and, when it is more than
+    threshold_ms late, logs the main thread's stack (sys._current_frames) with
+    a timestamp. Once the loop catches up, the stall's duration is recorded
+    against the GUI function that was running, and stop() prints a summary.
+    """
+
+    def __init__(self, widget, threshold_ms=100, interval_ms=None):
+        self.widget = widget
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms or max(10, threshold_ms // 4)
+        self._main_ident = threading.get_ident()  # Created on the Tk thread
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._last_beat = time.monotonic()
+        self._culprit = None  # Function blamed for the stall in progress
+        self._job = None
+        self.stalls = {}  # culprit -> [count, total_ms, max_ms]
+
+    def start(self):
+        self._job = self.widget.after(self.interval_ms, self._beat)
+        threading.Thread(target=self._watch, name="main-loop-watchdog", daemon=True).start()
+        print(f"{Fore.LIGHTBLACK_EX}Main loop watchdog on: stalls over {self.threshold_ms} ms are logged{Style.RESET_ALL}")
+        return self
+
+    def _beat(self):
+        now = time.monotonic()
+        with self._lock:
+            culprit, self._culprit = self._culprit, None
+            late_ms = (now - self._last_beat) * 1000 - self.interval_ms
+            self._last_beat = now
+        if culprit is not None:
+            stats = self.stalls.setdefault(culprit, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += late_ms
+            stats[2] = max(stats[2], late_ms)
+            habit_metrics.increment("watchdog.stalls")
+            habit_metrics.record("watchdog.stall_ms", late_ms)
+            print(f"{Fore.LIGHTYELLOW_EX}Main loop resumed after {late_ms:.0f} ms ({culprit}){Style.RESET_ALL}")
+        if not self._stop.is_set():
+            self._job = self.widget.after(self.interval_ms, self._beat)
+
+    def _watch(self):
+        while not self._stop.wait(self.interval_ms / 2000):
+            with self._lock:
+                late_ms = (time.monotonic() - self._last_beat) * 1000 - self.interval_ms
+                if self._culprit is not None or late_ms <= self.threshold_ms:
+                    continue
+                frame = sys._current_frames().get(self._main_ident)
+                if frame is None:
+                    continue
+                stack = traceback.extract_stack(frame)
+                self._culprit = self._blame(stack)
+            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            print(f"{Fore.LIGHTRED_EX}[{timestamp}] Main loop stalled for {late_ms:.0f} ms+ in {self._culprit}:{Style.RESET_ALL}\n"
+                  f"{''.join(traceback.format_list(stack[-12:]))}", end="")
+
+    @staticmethod
+    def _blame(stack):
+        """The innermost GUI function on the stack, or the innermost function if none"""
+        for entry in reversed(stack):
+            if os.path.basename(entry.filename) == "gui.py":
+                return entry.name
+        return f"{os.path.basename(stack[-1].filename)}:{stack[-1].name}" if stack else "unknown"
+
+    def summary(self):
+        """[(culprit, count, total_ms, max_ms), ...] worst total first"""
+        return sorted(((name, *stats) for name, stats in self.stalls.items()), key=lambda row: -row[2])
+
+    def stop(self):
+        """Stop the heartbeat and print the stall summary"""
+        self._stop.set()
+        if self._job is not None:
+            try:
+                self.widget.after_cancel(self._job)
+            except (ValueError, tk.TclError):
+                pass
+            self._job = None
+        rows = self.summary()
+        if not rows:
+            print(f"{Fore.LIGHTBLACK_EX}Main loop watchdog: no stalls over {self.threshold_ms} ms{Style.RESET_ALL}")
+            return
+        print(f"{Fore.LIGHTCYAN_EX}Main loop stalls over {self.threshold_ms} ms:{Style.RESET_ALL}")
+        print(f"  {'Function':<32}{'Count':>7}{'Total ms':>11}{'Max ms':>9}")
+        for name, count, total_ms, max_ms in rows:
+            print(f"  {name[:31]:<32}{count:>7}{total_ms:>11.0f}{max_ms:>9.0f}")
+
 def init_customtkinter():
     """Lazy load customtkinter when needed"""
     global _ctk_instance, darkdetect
@@ -156,7 +532,7 @@ def __init__(self, master, title, message, duration=2000, **kwargs):
         
         # Position window and configure colors
         self.window.geometry(f"{window_width}x{window_height}+{x}+{y}")
-        self.window.configure(fg_color=("gray95", "#292929"))  # Light/Dark mode colors
+        self.window.configure(fg_color=COLORS["panel_bg"])  # Light/Dark mode colors
         # self.window.grab_set()  # Make window modal
         try:
             if self.window.winfo_exists():
@@ -172,18 +548,23 @@ def __init__(self, master, title, message, duration=2000, **kwargs):
         label = self.ctk.CTkLabel(
             self.window, 
             text=message, 
-            font=self.ctk.CTkFont(size=14),
-            text_color=("gray10", "gray90"),  # Light/Dark mode text
+            font=ResourceManager().font(14),
+            text_color=COLORS["text"],  # Light/Dark mode text
             justify="center"
         )
         label.pack(pady=20)
         
         # Auto-close after duration
+        self._dismiss_job = f"message-dismiss-{id(self)}"
         if (duration > 0):
-            self.window.after(duration, self.destroy)
+            TimerService.for_widget(self.window).schedule(self._dismiss_job, duration, self.destroy, owner=self.window)
     
     def destroy(self):
         """Properly destroy the message window"""
+        try:
+            TimerService.for_widget(self.window).cancel(self._dismiss_job)
+        except (AttributeError, tk.TclError):
+            pass
         if self.on_close:
             try:
                 self.on_close()
@@ -257,7 +638,7 @@ def __init__(self, master, title, message, **kwargs):
         self.window.geometry(f"{window_width}x{window_height}+{x}+{y}")
         
         # Message label
-        label = self.ctk.CTkLabel(self.window, text=message, font=self.ctk.CTkFont(size=14))
+        label = self.ctk.CTkLabel(self.window, text=message, font=ResourceManager().font(14))
         label.pack(pady=20)
         
         # Text input
@@ -314,7 +695,7 @@ def __init__(self, master, title, message, yes_fg_color=None, yes_hover_color=No
         self.window.grab_set()
         
         # Message label
-        label = self.ctk.CTkLabel(frame, text=message, wraplength=400, justify="left", anchor="w", font=self.ctk.CTkFont(size=14))
+        label = self.ctk.CTkLabel(frame, text=message, wraplength=400, justify="left", anchor="w", font=ResourceManager().font(14))
         label.pack(fill="x", padx=20, pady=(10, 20))
         
         # Buttons frame
@@ -358,6 +739,109 @@ def no_click(self):
         self.result = False
         self.window.destroy()
 
+class VirtualLogList:
+    """
+    Scrollable list of habit logs, newest date first, drawn on a single Canvas.
+    Only the rows in view have canvas items: a fixed pool of text items is
+    moved and relabelled as the list scrolls, so the list costs the same with
+    ten logs or a million.
+    """
+
+    def __init__(self, master, date_groups, row_height=28):
+        self.ctk = init_customtkinter()
+        self.frame = self.ctk.CTkFrame(master, fg_color=COLORS["panel_bg"])
+        self.frame.grid_columnconfigure(0, weight=1)
+        self.frame.grid_rowconfigure(0, weight=1)
+
+        scaling = self.ctk.ScalingTracker.get_widget_scaling(self.frame)
+        self.row_height = round(row_height * scaling)
+        self._date_x = round(10 * scaling)
+        self._log_x = round(30 * scaling)
+        self._date_font = ResourceManager().font(round(16 * scaling), "bold")
+        self._log_font = ResourceManager().font(round(14 * scaling))
+
+        self.canvas = tk.Canvas(self.frame, highlightthickness=0, borderwidth=0, yscrollincrement=1)
+        self.scrollbar = self.ctk.CTkScrollbar(self.frame, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_view_changed)
+        self.canvas.grid(row=0, column=0, sticky="nsew", padx=(10, 0), pady=10)
+        self.scrollbar.grid(row=0, column=1, sticky="ns", pady=10)
+
+        self._pool = []  # Canvas text items, one per visible row
+        self._first_row = None
+        self.canvas.bind("<Configure>", lambda event: self._redraw(force=True))
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda event: self.canvas.yview_scroll(-3 * self.row_height, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.canvas.yview_scroll(3 * self.row_height, "units"))
+
+        self._set_appearance_mode(self.ctk.get_appearance_mode())
+        self.ctk.AppearanceModeTracker.add(self._set_appearance_mode, self.canvas)
+        self.canvas.bind("<Destroy>", lambda event: self.ctk.AppearanceModeTracker.remove(self._set_appearance_mode), add="+")
+
+        self.set_data(date_groups)
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def set_data(self, date_groups):
+        """Show new [(date, [log, ...]), ...] groups, keeping the scroll position where possible"""
+        self.groups = date_groups
+        # Row of each date's header; its logs take the rows that follow
+        self._starts = []
+        row = 0
+        for _, logs in date_groups:
+            self._starts.append(row)
+            row += 1 + len(logs)
+        self._row_count = row
+        self.canvas.configure(scrollregion=(0, 0, 0, self._row_count * self.row_height))
+        self._redraw(force=True)
+
+    def _set_appearance_mode(self, mode):
+        dark = str(mode).lower() == "dark"
+        self.canvas.configure(bg="#292929" if dark else "gray95")
+        self._text_color = "#DCE4EE" if dark else "gray10"
+        self._redraw(force=True)
+
+    def _on_view_changed(self, first, last):
+        self.scrollbar.set(first, last)
+        self._redraw()
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small deltas
+        notches = event.delta / 120 if abs(event.delta) >= 120 else event.delta
+        self.canvas.yview_scroll(int(-notches * 3 * self.row_height), "units")
+
+    def _row_content(self, row):
+        """(text, x, font, color) for a list row"""
+        group = bisect_right(self._starts, row) - 1
+        date, logs = self.groups[group]
+        offset = row - self._starts[group]
+        if offset == 0:
+            return date, self._date_x, self._date_font, self._text_color
+        habit, _, completed = logs[offset - 1][:3]
+        status = "✓" if completed else "✗"
+        return f"{status} {habit}", self._log_x, self._log_font, "green" if completed else "red"
+
+    def _redraw(self, force=False):
+        """Bind the row pool to the rows currently in view"""
+        if not hasattr(self, "_starts"):
+            return
+        first = max(0, int(self.canvas.canvasy(0)) // self.row_height)
+        visible = self.canvas.winfo_height() // self.row_height + 2
+        while len(self._pool) < visible:
+            self._pool.append(self.canvas.create_text(0, 0, anchor="w", state="hidden"))
+        if first == self._first_row and not force:
+            return
+        self._first_row = first
+
+        for slot, item in enumerate(self._pool):
+            row = first + slot
+            if row >= self._row_count:
+                self.canvas.itemconfigure(item, state="hidden")
+                continue
+            text, x, font, color = self._row_content(row)
+            self.canvas.coords(item, x, row * self.row_height + self.row_height / 2)
+            self.canvas.itemconfigure(item, text=text, font=font, fill=color, state="normal")
+
 class HabitTrackerGUI:
     def __init__(self, load_habits_fn, save_habits_fn, load_logs_fn, save_logs_fn, 
                  update_streaks_fn, load_streaks_fn, visualize_fn):
@@ -371,7 +855,7 @@ def __init__(self, load_habits_fn, save_habits_fn, load_logs_fn, save_logs_fn,
         self._load_habits = load_habits_fn
         self._save_habits = save_habits_fn
         self._load_logs = load_logs_fn
-        self._save_logs = save_logs_fn
+        self._save_logs = habit_metrics.timed("save.logs_ms")(save_logs_fn)
         self._update_streaks = update_streaks_fn
         self._load_streaks = load_streaks_fn
         self._visualize = visualize_fn
@@ -381,6 +865,11 @@ def __init__(self, load_habits_fn, save_habits_fn, load_logs_fn, save_logs_fn,
         
         # Create main window
         self.window = self.ctk.CTk()
+        self.timers = TimerService.for_widget(self.window)
+        # All background work (I/O, renders) runs through one bounded executor;
+        # results come back on the Tk thread
+        self.tasks = TaskExecutor(lambda callback: self.window.after(0, callback))
+        self.render_pool = self.tasks.process_pool
         self.set_window_icon(self.window)
         self.window.title("HERALDEXX HABIT TRACKER")
 
@@ -393,6 +882,37 @@ def __init__(self, load_habits_fn, save_habits_fn, load_logs_fn, save_logs_fn,
         self.chart_style = self.settings.get("chart_style", "Line Plot")
         self.show_streak_annotations = self.settings.get("show_streak_annotations", True)
         self.chart_date_range = self.settings.get("chart_date_range", "Last 30 Days")
+        if not is_valid_date_range(self.chart_date_range):
+            self.chart_date_range = "Last 30 Days"
+        self.render_profile = self.settings.get("render_profile", DEFAULT_RENDER_PROFILE)
+
+        # Speculative chart pre-rendering (see _schedule_prerender)
+        self._last_chart_size_px = None
+
+        # Charts render in a pre-warmed worker process unless set to "thread"
+        self.render_backend = self.settings.get("render_backend", "process")
+        if self.render_backend not in RENDER_BACKENDS:
+            self.render_backend = "process"
+        self.render_backend_map = {
+            "Separate process": "process",
+            "Background thread": "thread"
+        }
+        self.render_backend_map_rev = {v: k for k, v in self.render_backend_map.items()}
+
+        # Byte cap of the decoded image cache ("image_cache_mb" in settings.json)
+        try:
+            self.resources.set_image_cache_limit(float(self.settings.get("image_cache_mb", 64)) * 1024 * 1024)
+        except (TypeError, ValueError):
+            pass
+
+        # Opt-in main loop watchdog ("stall_watchdog_ms" in settings.json, 0 = off)
+        self.watchdog = None
+        try:
+            watchdog_ms = int(self.settings.get("stall_watchdog_ms", 0))
+        except (TypeError, ValueError):
+            watchdog_ms = 0
+        if watchdog_ms > 0:
+            self.watchdog = MainLoopWatchdog(self.window, watchdog_ms).start()
 
         self.autosave_interval = self.settings.get("autosave_interval", 30)
         self.autosave_map = {                                              
@@ -403,6 +923,14 @@ def __init__(self, load_habits_fn, save_habits_fn, load_logs_fn, save_logs_fn,
         }
         self.autosave_map_rev = {v: k for k, v in self.autosave_map.items()}
 
+        self.plot_retention_map = {
+            "5 per habit": 5,
+            "10 per habit": 10,
+            "25 per habit": 25,
+            "Keep all": 0
+        }
+        self.plot_retention_map_rev = {v: k for k, v in self.plot_retention_map.items()}
+
         # Apply appearance from settings
         self.current_appearance_mode = self.settings.get("appearance_mode", "System")
         self.ctk.set_appearance_mode(self.current_appearance_mode)
@@ -412,11 +940,12 @@ def __init__(self, load_habits_fn, save_habits_fn, load_logs_fn, save_logs_fn,
         self.window.grid_columnconfigure(1, weight=1)  # Make second column expandable
         self.window.grid_rowconfigure(0, weight=1)     # Make first row expandable
         
-        # Widget recycling pools
-        self._checkbox_pool = []
-        self._label_pool = []
-        self._button_pool = []
-        self._frame_pool = []
+        # Views are built once and kept (see show_view); data_version tells
+        # them when the habits, logs or streaks they show have changed
+        self.data_version = 0
+        self._views = {}
+        self._current_view = None
+        self.view_frame = None
         
         # Setup window metrics and platform specifics
         self._setup_platform_specifics()
@@ -443,7 +972,7 @@ def __init__(self, load_habits_fn, save_habits_fn, load_logs_fn, save_logs_fn,
         )
         self.main_frame.grid(row=0, column=1, sticky="nsew", padx=20, pady=20)
         self.main_frame.grid_columnconfigure(0, weight=1)
-        self.main_frame.grid_rowconfigure(1, weight=1)
+        self.main_frame.grid_rowconfigure(0, weight=1)
         
         # Setup UI components
         self.setup_sidebar()
@@ -452,12 +981,14 @@ def __init__(self, load_habits_fn, save_habits_fn, load_logs_fn, save_logs_fn,
         # Load initial data
         self._load_data()
         
-        # Set up autosave
-        self._setup_autosave()
-        
         # Bind window close event
         self.window.protocol("WM_DELETE_WINDOW", self.on_closing)   
 
+        # Debug view of pending timers, performance overlay
+        self.window.bind("<Control-Shift-T>", lambda e: self.show_timer_debug())
+        self.window.bind("<Control-Shift-P>", lambda e: self.toggle_perf_hud())
+        self.perf_hud = None
+
     def _create_tooltip(self, button, message):
         if hasattr(button, 'tooltip') and button.tooltip:
             button.tooltip.destroy()
@@ -498,8 +1029,8 @@ def _create_tooltip(self, button, message):
         label = self.ctk.CTkLabel(
             tooltip_frame,
             text=message,
-            font=self.ctk.CTkFont(size=12),
-            text_color=("gray10", "gray90"),
+            font=self.resources.font(12),
+            text_color=COLORS["text"],
             wraplength=140
         )
         label.place(relx=0.5, rely=0.5, anchor="center")
@@ -514,14 +1045,10 @@ def _create_tooltip(self, button, message):
 
     def _show_tooltip(self, event, button, message):
         if button.cget("state") == "disabled":
-            if hasattr(button, 'tooltip_timer') and button.tooltip_timer:
-                self.window.after_cancel(button.tooltip_timer)
-            button.tooltip_timer = self.window.after(200, lambda: self._create_tooltip(button, message))
+            self.timers.schedule(f"tooltip-{id(button)}", 200, lambda: self._create_tooltip(button, message), owner=button)
 
     def _hide_tooltip(self, event, button):
-        if hasattr(button, 'tooltip_timer') and button.tooltip_timer:
-            self.window.after_cancel(button.tooltip_timer)
-            button.tooltip_timer = None
+        self.timers.cancel(f"tooltip-{id(button)}")
         if hasattr(button, 'tooltip') and button.tooltip:
             button.tooltip.destroy()
             button.tooltip = None
@@ -559,58 +1086,39 @@ def set_window_icon(self, window):
         except Exception as e:
             print(f"Error setting window icon: {e}")     
 
-    def _get_recycled_widget(self, pool, widget_type, parent, **kwargs):
-        """Get a widget from the recycling pool or create a new one with optimized configuration"""
-        try:
-            if pool:
-                widget = pool.pop()
-                try:
-                    # Batch configure widget properties
-                    config_updates = {}
-                    for key, value in kwargs.items():
-                        config_updates[key] = value
-                    if config_updates:
-                        widget.configure(**config_updates)
-                    return widget
-                except tk.TclError:
-                    # Widget invalid, create new one
-                    pass
-                    
-            # Create new widget if none available in pool
-            return widget_type(parent, **kwargs)
-            
-        except Exception as e:
-            print(f"{Fore.LIGHTRED_EX}Error getting recycled widget: {e}{Style.RESET_ALL}")
-            # Fallback to creating new widget
-            return widget_type(parent, **kwargs)
+    def _autosave(self):
+        """Write pending check-ins to disk (run by the autosave timer, or on close)"""
+        self._cancel_autosave()
+        if not self.pending_changes:
+            return
+        habit_metrics.increment("autosave.wakeups")
+        if self._save_logs(self.logs, self.streaks):
+            self.pending_changes = False
+            self.last_save = datetime.now()
+            self.show_autosave_status("Progress auto-saved")
+            self.update_clear_buttons_state()
+        else:
+            self.show_error_message("Failed to auto-save progress")
 
-    def _recycle_widget(self, widget, pool):
-        """Add a widget to the recycling pool with error handling"""
-        try:
-            widget.pack_forget()
-            widget.grid_forget()
-            widget.place_forget()
-            pool.append(widget)
-        except tk.TclError:
-            # Widget already destroyed or invalid
-            pass
-        except Exception as e:
-            print(f"{Fore.LIGHTRED_EX}Error recycling widget: {e}{Style.RESET_ALL}")
+    def _mark_dirty(self):
+        """
+        Record an unsaved change. Autosave is event-driven: nothing runs while
+        there are no unsaved changes; the first change arms a single timer for
+        autosave_interval seconds and later changes are saved with it.
+        """
+        self.pending_changes = True
+        if self.autosave_interval > 0:
+            # coalesce: later changes ride on the save the first one armed
+            self.timers.schedule("autosave", self.autosave_interval * 1000, self._autosave, coalesce=True)
 
-    @ResourceManager().debounce(500)  # Debounce save operations
-    def _autosave(self):
-        """Debounced autosave function"""
-        if self.pending_changes:
-            self.save_progress()
-
-    def _setup_autosave(self):
-        """Set up periodic autosave check"""
-        def check_autosave():
-            now = datetime.now()
-            if self.pending_changes and self.autosave_interval > 0 and (now - self.last_save).seconds >= self.autosave_interval:
-                self._autosave()
-            self.window.after(1000, check_autosave)  # Check every second
-        check_autosave()
+    def _cancel_autosave(self):
+        self.timers.cancel("autosave")
+
+    def _autosave_instruction(self):
+        """The habits view's line on how check-ins get saved, for the current autosave setting"""
+        if self.autosave_interval > 0:
+            return "Progress saves automatically"
+        return "Auto-save is off: click Save & Continue"
 
     def has_tracking_data(self):
         """Check if there are any logs, streaks, or plot files."""
@@ -621,12 +1129,7 @@ def has_tracking_data(self):
         if self.streaks:
             return True
         # Check for plot files
-        plots_dir = PLOTS_DIR
-        if os.path.exists(plots_dir):
-            plot_files = [f for f in os.listdir(plots_dir) if f.startswith('habit_streak_') and f.endswith('.png')]
-            if plot_files:
-                return True
-        return False
+        return has_plots()
 
     def update_clear_buttons_state(self):
         """Update the state of the 'Clear Tracking History' button in the sidebar."""
@@ -635,51 +1138,45 @@ def update_clear_buttons_state(self):
             self.clear_btn.configure(state=state)
 
     def _load_data(self):
-        """Load all data in a background thread"""
+        """Load all data in the background, then show the first view"""
         def load():
-            try:
-                self.habits = self._load_habits()
-                self.logs = self._load_logs()
-                self.streaks = self._load_streaks()
-                
-                # Update UI in main thread
-                self.window.after(0, lambda: self.show_setup_view() if not self.habits else self.show_habits_view())
-                self.window.after(100, self._schedule_daily_reminder) # Schedule the reminder check shortly after UI loads
-
-                # Update navigation buttons based on habits
-                if self.habits:
-                    self.habits_button.configure(state="normal")
-                    self.logs_button.configure(state="normal")
-                    self.stats_button.configure(state="normal")
-                else:
-                    self.habits_button.configure(state="disabled")
-                    self.logs_button.configure(state="disabled")
-                    self.stats_button.configure(state="disabled")
-                    
-                self.window.after(0, self.update_clear_buttons_state)
-
-            except Exception as e:
-                # Show error in main thread
-                self.window.after(0, lambda: self.show_error_message(str(e)))
-        
-        thread = threading.Thread(target=load)
-        thread.daemon = True
-        thread.start()
-
-    def clear_main_frame(self):
-        """Clear main frame and recycle all widgets"""
-        for widget in self.main_frame.winfo_children():
-            widget_type = type(widget)
-            if isinstance(widget, self.ctk.CTkCheckBox):
-                self._recycle_widget(widget, self._checkbox_pool)
-            elif isinstance(widget, self.ctk.CTkLabel):
-                self._recycle_widget(widget, self._label_pool)
-            elif isinstance(widget, self.ctk.CTkButton):
-                self._recycle_widget(widget, self._button_pool)
-            elif isinstance(widget, self.ctk.CTkFrame):
-                self._recycle_widget(widget, self._frame_pool)
-            else:
-                widget.destroy()  # Destroy non-recyclable widgets
+            habits = self._load_habits()
+            logs = self._load_logs()
+            streaks = self._load_streaks()
+
+            # Pick up plot files added or removed outside the app, then
+            # trim the plots directory to the retention limits (if the user set any)
+            repair_plot_index()
+            deleted, freed = apply_retention_settings(self.settings)
+            return habits, logs, streaks, deleted, freed
+
+        def on_loaded(result):
+            self.habits, self.logs, self.streaks, deleted, freed = result
+            if deleted:
+                print(f"{Fore.LIGHTYELLOW_EX}Plot retention removed {deleted} old plot(s), {freed / (1024 * 1024):.1f} MB reclaimed{Style.RESET_ALL}")
+                self.show_success_message(f"Removed {deleted} old plot(s) under your retention settings\n({freed / (1024 * 1024):.1f} MB reclaimed)")
+            self._bump_data_version()
+            self.show_setup_view() if not self.habits else self.show_habits_view()
+            self.timers.schedule("daily-reminder", 100, self._schedule_daily_reminder) # Schedule the reminder check shortly after UI loads
+
+            # Update navigation buttons based on habits
+            state = "normal" if self.habits else "disabled"
+            self.habits_button.configure(state=state)
+            self.logs_button.configure(state=state)
+            self.stats_button.configure(state=state)
+            self.update_clear_buttons_state()
+
+        self.tasks.submit(load, name="load-data", on_done=on_loaded,
+                          on_error=lambda e: self.show_error_message(str(e)))
+
+        # Resolve chart fonts (and start the render worker) while the user is
+        # still looking at the habits view
+        def warm_up():
+            warm_up_fonts()
+            if self.render_backend == "process":
+                self.render_pool.start()
+
+        self.tasks.submit(warm_up, name="warm-up", lane="background")
 
     def _setup_platform_specifics(self):
         """Platform-specific initializations"""
@@ -798,7 +1295,10 @@ def __del__(self):
     def on_closing(self):
         """Enhanced window closing handler with proper cleanup"""
         try:
-            if (self.pending_changes):
+            if (self.pending_changes and self.autosave_interval > 0):
+                # With autosave on, check-ins waiting for the timer are saved, not asked about
+                self.save_pending_changes()
+            elif (self.pending_changes):
                 dialog = YesNoDialog(
                     master=self.window,
                     title="Unsaved Changes",
@@ -815,13 +1315,19 @@ def on_closing(self):
                     pass
             
             # Destroy all open plot windows with logging
-            for pw, fp in self.plot_windows:
+            for pw, fp in list(self.plot_windows):
                 try:
                     pw.destroy()
                     print(f"{Fore.LIGHTYELLOW_EX}Destroyed plot window for {fp}{Style.RESET_ALL}")
                 except:
                     pass
             self.plot_windows = []  # Clear the list
+
+            # Stop background work (and the render worker) and drop pending timers
+            self.tasks.shutdown()
+            self.timers.cancel_all()
+            if self.watchdog is not None:
+                self.watchdog.stop()
             
             # Clean up matplotlib resources if it was imported
             if 'plt' in globals():
@@ -855,10 +1361,14 @@ def on_closing(self):
                 pass
 
     def save_pending_changes(self):
-        """Save any pending changes before closing"""
+        """Quietly save any pending changes before closing"""
         try:
-            if (hasattr(self, 'habit_vars')):
-                self.save_progress()
+            self._cancel_autosave()
+            if self.pending_changes and self._save_logs(self.logs, self.streaks):
+                self.pending_changes = False
+                self.last_save = datetime.now()
+            elif self.pending_changes:
+                print(f"{Fore.LIGHTRED_EX}Failed to save pending changes on close{Style.RESET_ALL}")
         except Exception:
             pass  # Ignore errors during cleanup
 
@@ -868,7 +1378,7 @@ def setup_sidebar(self):
             self.window, 
             width=200, 
             corner_radius=0,
-            fg_color=("gray90", "#2B2B2B")  # Light mode, Dark mode
+            fg_color=COLORS["header_bg"]  # Light mode, Dark mode
         )
         self.sidebar.grid(row=0, column=0, sticky="nsew")
         self.sidebar.grid_rowconfigure(5, weight=1)  # Adjusted for new icon
@@ -902,16 +1412,16 @@ def setup_sidebar(self):
         self.logo_label = self.ctk.CTkLabel(
             self.sidebar, 
             text="HABIT TRACKER",
-            font=self.ctk.CTkFont(size=20, weight="bold"),
-            text_color=("gray10", "gray90")  # Light mode, Dark mode
+            font=self.resources.font(20, "bold"),
+            text_color=COLORS["text"]  # Light mode, Dark mode
         )
         self.logo_label.grid(row=1, column=0, padx=20, pady=(5, 20))
         
         # Navigation buttons with proper color scheme
         button_config = {
-            "fg_color": ("gray80", "gray20"),  # Light mode, Dark mode
+            "fg_color": COLORS["control_bg"],  # Light mode, Dark mode
             "hover_color": ("gray70", "gray30"),
-            "text_color": ("gray10", "gray90")
+            "text_color": COLORS["text"]
         }
         
         self.habits_button = self.ctk.CTkButton(
@@ -923,7 +1433,6 @@ def setup_sidebar(self):
         )
         self.habits_button.grid(row=2, column=0, padx=20, pady=10)
         self.habits_button.tooltip = None
-        self.habits_button.tooltip_timer = None
         self.habits_button.bind('<Enter>', lambda e: self._show_tooltip(e, self.habits_button, "No habits found!"))
         self.habits_button.bind('<Leave>', lambda e: self._hide_tooltip(e, self.habits_button))
 
@@ -936,7 +1445,6 @@ def setup_sidebar(self):
         )
         self.logs_button.grid(row=3, column=0, padx=20, pady=10)
         self.logs_button.tooltip = None
-        self.logs_button.tooltip_timer = None
         self.logs_button.bind('<Enter>', lambda e: self._show_tooltip(e, self.logs_button, "No habits found!"))
         self.logs_button.bind('<Leave>', lambda e: self._hide_tooltip(e, self.logs_button))
 
@@ -949,7 +1457,6 @@ def setup_sidebar(self):
         )
         self.stats_button.grid(row=4, column=0, padx=20, pady=10)
         self.stats_button.tooltip = None
-        self.stats_button.tooltip_timer = None
         self.stats_button.bind('<Enter>', lambda e: self._show_tooltip(e, self.stats_button, "No habits found!"))
         self.stats_button.bind('<Leave>', lambda e: self._hide_tooltip(e, self.stats_button))
 
@@ -957,9 +1464,9 @@ def setup_sidebar(self):
             self.sidebar,
             text="⚙️ Settings",
             command=self.open_settings_window,
-            fg_color=("gray80", "gray20"),
+            fg_color=COLORS["control_bg"],
             hover_color=("gray70", "gray30"),
-            text_color=("gray10", "gray90")
+            text_color=COLORS["text"]
         )
         self.settings_button.grid(row=5, column=0, padx=20, pady=10)
         
@@ -967,11 +1474,11 @@ def setup_main_frame(self):
         # Main frame with color customization
         self.main_frame = self.ctk.CTkFrame(
             self.window,
-            fg_color=("gray95", "#292929")  # Light mode, Dark mode
+            fg_color=COLORS["panel_bg"]  # Light mode, Dark mode
         )
         self.main_frame.grid(row=0, column=1, sticky="nsew", padx=20, pady=20)
         self.main_frame.grid_columnconfigure(0, weight=1)
-        self.main_frame.grid_rowconfigure(1, weight=1)
+        self.main_frame.grid_rowconfigure(0, weight=1)
         
     def show_habits_view(self):
         """Show habits view with optimized performance"""
@@ -992,13 +1499,13 @@ def show_setup_view(self):
     def _show_habits_view(self):
         """Internal optimized habits view implementation"""
         # Configure grid before creating widgets for better performance
-        self.main_frame.grid_columnconfigure(0, weight=1)
-        self.main_frame.grid_rowconfigure(1, weight=1)
+        self.view_frame.grid_columnconfigure(0, weight=1)
+        self.view_frame.grid_rowconfigure(1, weight=1)
         
         # Create header frame
         header_frame = self.ctk.CTkFrame(
-            self.main_frame,
-            fg_color=("gray90", "#2B2B2B"),
+            self.view_frame,
+            fg_color=COLORS["header_bg"],
             corner_radius=10
         )
         header_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=20, pady=(10, 5))
@@ -1007,29 +1514,31 @@ def _show_habits_view(self):
         title = self.ctk.CTkLabel(
             header_frame, 
             text="Daily Habits Check-in",
-            font=self.ctk.CTkFont(size=28, weight="bold"),
-            text_color=("gray10", "gray90")
+            font=self.resources.font(28, "bold"),
+            text_color=COLORS["text"]
         )
         title.grid(row=0, column=0, pady=(20, 5))
         
         # Today's date prominently displayed
         today = datetime.now().strftime('%Y-%m-%d')
+        self._habits_view_date = today
         date_label = self.ctk.CTkLabel(
             header_frame,
             text=f"Today's Date: {today}",
-            font=self.ctk.CTkFont(size=16, weight="bold"),
-            text_color=("gray20", "gray80")
+            font=self.resources.font(16, "bold"),
+            text_color=COLORS["text_secondary"]
         )
         date_label.grid(row=1, column=0, pady=(0, 10))
+        self._habits_date_label = date_label
 
         # Instructions section
         instructions_frame = self.ctk.CTkFrame(
-            self.main_frame,
-            fg_color=("gray95", "#232323"),
+            self.view_frame,
+            fg_color=COLORS["card_bg"],
             corner_radius=10
         )
         instructions_frame.grid(row=1, column=0, padx=(20, 10), pady=(5, 20), sticky="nsew")
-        self.main_frame.grid_columnconfigure(0, weight=1)  # Give equal weight to first column
+        self.view_frame.grid_columnconfigure(0, weight=1)  # Give equal weight to first column
         instructions_frame.grid_columnconfigure(0, weight=1)
         
         # Instructions with icons and better formatting
@@ -1037,7 +1546,7 @@ def _show_habits_view(self):
             ("✓", "Check habits you've completed"),
             ("✗", "Leave incomplete habits unchecked"),
             ("🔥", "Watch your streak grow"),
-            ("💾", "Progress saves automatically")
+            ("💾", self._autosave_instruction())
         ]
         
         for i, (icon, text) in enumerate(instructions_text):
@@ -1048,7 +1557,7 @@ def _show_habits_view(self):
             icon_label = self.ctk.CTkLabel(
                 instruction_row,
                 text=icon,
-                font=self.ctk.CTkFont(size=20),
+                font=self.resources.font(20),
                 width=30
             )
             icon_label.grid(row=0, column=0, padx=(5, 10))
@@ -1056,19 +1565,21 @@ def _show_habits_view(self):
             text_label = self.ctk.CTkLabel(
                 instruction_row,
                 text=text,
-                font=self.ctk.CTkFont(size=14),
+                font=self.resources.font(14),
                 justify="left"
             )
             text_label.grid(row=0, column=1, sticky="w")
+            if icon == "💾":
+                self._autosave_instruction_label = text_label
 
         # Habits section with visual improvements
         habits_container = self.ctk.CTkFrame(
-            self.main_frame,
-            fg_color=("gray95", "#232323"),
+            self.view_frame,
+            fg_color=COLORS["card_bg"],
             corner_radius=10
         )
         habits_container.grid(row=1, column=1, padx=(10, 20), pady=(5, 20), sticky="nsew")
-        self.main_frame.grid_columnconfigure(1, weight=1)  # Give equal weight to second column
+        self.view_frame.grid_columnconfigure(1, weight=1)  # Give equal weight to second column
         habits_container.grid_columnconfigure(0, weight=1)
         habits_container.grid_rowconfigure(1, weight=1)
         
@@ -1076,8 +1587,8 @@ def _show_habits_view(self):
         habits_header = self.ctk.CTkLabel(
             habits_container,
             text="Your Daily Habits",
-            font=self.ctk.CTkFont(size=18, weight="bold"),
-            text_color=("gray20", "gray80")
+            font=self.resources.font(18, "bold"),
+            text_color=COLORS["text_secondary"]
         )
         habits_header.grid(row=0, column=0, pady=(15, 5))
         
@@ -1094,8 +1605,14 @@ def _show_habits_view(self):
         self.streak_labels = {}
         
         def on_checkbox_click(habit):
-            """Handle checkbox click with auto-save"""
+            """Apply a check-in right away; writing it to disk is left to autosave"""
             try:
+                # The view may have been left open past midnight
+                today = datetime.now().strftime('%Y-%m-%d')
+                if today != self._habits_view_date:
+                    self._habits_view_date = today
+                    self._habits_date_label.configure(text=f"Today's Date: {today}")
+
                 # Get all current values
                 current_values = {h: var.get() for h, var in self.habit_vars.items()}
                 
@@ -1107,19 +1624,23 @@ def on_checkbox_click(habit):
                 
                 # Add new logs
                 self.logs.extend(new_logs)
+                self._bump_data_version()
                 
                 # Update streaks
                 self._update_streaks(self.logs, self.habits, self.streaks)
                 
-                # Save to disk
-                if (self._save_logs(self.logs, self.streaks)):
-                    # Update streak display
-                    for h, streak_label in self.streak_labels.items():
-                        streak_label.configure(text=f"🔥 {self.streaks.get(h, 0)}")
-                    
-                    # Show auto-save indicator briefly
-                    self.show_autosave_status("Progress auto-saved")
-                    self.update_clear_buttons_state()
+                # Update streak display
+                for h, streak_label in self.streak_labels.items():
+                    streak_label.configure(text=f"🔥 {self.streaks.get(h, 0)}")
+                
+                # Reflect the change on the live chart without rebuilding it
+                self._update_live_chart_day(today, current_values)
+                self._schedule_prerender()
+
+                # Saved by the autosave timer (or Save & Continue / on close)
+                self._mark_dirty()
+                if self.autosave_interval <= 0:
+                    self.show_autosave_status("Unsaved changes")
                     
             except Exception as e:
                 self.show_error_message(f"Error saving progress: {str(e)}")
@@ -1141,7 +1662,7 @@ def on_checkbox_click(habit):
                 habit_row, 
                 text=habit,
                 variable=var,
-                font=self.ctk.CTkFont(size=16),
+                font=self.resources.font(16),
                 command=lambda h=habit: on_checkbox_click(h),
                 border_width=2,
                 checkbox_width=24,
@@ -1156,8 +1677,8 @@ def on_checkbox_click(habit):
             streak_label = self.ctk.CTkLabel(
                 habit_row,
                 text=f"🔥 {streak}",
-                font=self.ctk.CTkFont(size=16),
-                text_color=("#FF6B6B", "#FFB86B") if (streak > 0) else ("gray40", "gray60")
+                font=self.resources.font(16),
+                text_color=COLORS["streak_active"] if (streak > 0) else COLORS["text_muted"]
             )
             streak_label.grid(row=0, column=2, padx=15)
             
@@ -1182,8 +1703,8 @@ def on_checkbox_click(habit):
         self.autosave_label = self.ctk.CTkLabel(
             controls,
             text="",
-            font=self.ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60"),
+            font=self.resources.font(12),
+            text_color=COLORS["text_muted"],
             width=150  # Fixed width to accommodate the message
         )
         self.autosave_label.grid(row=0, column=0, sticky="w", padx=(10, 0))  # Added left padding
@@ -1193,7 +1714,7 @@ def on_checkbox_click(habit):
             controls,
             text="Save & Continue",
             command=self.finish_habit_logging,
-            font=self.ctk.CTkFont(size=14, weight="bold"),
+            font=self.resources.font(14, "bold"),
             height=32
         )
         save_button.grid(row=0, column=2, sticky="e")
@@ -1201,10 +1722,10 @@ def on_checkbox_click(habit):
         # Copyright at bottom
         from habit_engine.__init__ import __copyright__
         copyright = self.ctk.CTkLabel(
-            self.main_frame,
+            self.view_frame,
             text=__copyright__,
-            font=self.ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60")
+            font=self.resources.font(12),
+            text_color=COLORS["text_muted"]
         )
         copyright.grid(row=2, column=0, columnspan=2, padx=20, pady=10, sticky="e")
             
@@ -1212,16 +1733,20 @@ def show_autosave_status(self, message, duration=1500):
         """Show auto-save status briefly"""
         if (hasattr(self, 'autosave_label')):
             self.autosave_label.configure(text=message)
-            self.window.after(duration, lambda: self.autosave_label.configure(text=""))
+            self.timers.schedule("autosave-status", duration, lambda: self.autosave_label.configure(text=""), owner=self.autosave_label)
             
     def finish_habit_logging(self):
         """Complete habit logging and show next steps"""
         try:
             # Final save
             if (self._save_logs(self.logs, self.streaks)):
+                self._cancel_autosave()
+                self.pending_changes = False
+                self.last_save = datetime.now()
+                self.update_clear_buttons_state()
                 self.show_success_message("Progress saved successfully!\n\nPlease Wait...")
                 # Show next action dialog
-                self.window.after(2100, self.ask_next_action)
+                self.timers.schedule("next-action", 2100, self.ask_next_action)
             else:
                 self.show_error_message("Failed to save progress")
         except Exception as e:
@@ -1270,7 +1795,7 @@ def ask_next_action(self):
         # Message
         message = self.ctk.CTkLabel(dialog, 
                              text="What would you like to do next?",
-                             font=self.ctk.CTkFont(size=16))
+                             font=self.resources.font(16))
         message.pack(pady=20)
         
         # Buttons frame with more spacing
@@ -1312,12 +1837,13 @@ def save_progress(self):
                 new_logs.append([habit, today, completed])
                 
             self.logs.extend(new_logs)
+            self._bump_data_version()
             self._update_streaks(self.logs, self.habits, self.streaks)
             
             if (self._save_logs(self.logs, self.streaks)):
                 self.show_success_message("Progress saved successfully!\n\nPlease Wait...")
                 # Show next action dialog after success message
-                self.window.after(2100, self.ask_next_action)
+                self.timers.schedule("next-action", 2100, self.ask_next_action)
             else:
                 self.show_error_message("Failed to save progress")
         except Exception as e:
@@ -1326,96 +1852,60 @@ def save_progress(self):
     def _show_logs_view(self):
         """Internal optimized logs view implementation"""
         # Configure grid with proper weights
-        self.main_frame.grid_columnconfigure(0, weight=1)
-        self.main_frame.grid_rowconfigure(1, weight=1)
+        self.view_frame.grid_columnconfigure(0, weight=1)
+        self.view_frame.grid_rowconfigure(1, weight=1)
 
         # Prepare batch updates
         updates = []
         
         # Create header frame
         header_frame = self.ctk.CTkFrame(
-            self.main_frame,
-            fg_color=("gray90", "#2B2B2B")
+            self.view_frame,
+            fg_color=COLORS["header_bg"]
         )
         updates.append((header_frame, {"row": 0, "column": 0, "sticky": "ew", "pady": (0, 20)}))
         
         header = self.ctk.CTkLabel(
             header_frame, 
             text="Habit Logs",
-            font=self.ctk.CTkFont(size=24, weight="bold")
+            font=self.resources.font(24, "bold")
         )
         header.pack(pady=20)
         
-        # Create scrollable frame with deferred rendering
-        scroll_frame = self.ctk.CTkScrollableFrame(
-            self.main_frame,
-            fg_color=("gray95", "#292929")
-        )
-        updates.append((scroll_frame, {"row": 1, "column": 0, "sticky": "nsew", "padx": 20, "pady": (0, 20)}))
-        
-        # Pre-process logs by date for better performance
-        logs_by_date = {}
-        for log in self.logs:
-            date = log[1]
-            if date not in logs_by_date:
-                logs_by_date[date] = []
-            logs_by_date[date].append(log)
-        
-        if logs_by_date:
-            # Create log entries with deferred rendering
-            def create_log_chunk(dates, start_idx, chunk_size):
-                end_idx = min(start_idx + chunk_size, len(dates))
-                current_dates = sorted(dates[start_idx:end_idx], reverse=True)
-                
-                for date in current_dates:
-                    date_label = self.ctk.CTkLabel(
-                        scroll_frame, 
-                        text=date,
-                        font=self.ctk.CTkFont(size=16, weight="bold")
-                    )
-                    date_label.pack(anchor="w", pady=(10, 5))
-                    
-                    for log in logs_by_date[date]:
-                        habit, _, completed = log
-                        status = "✓" if completed else "✗"
-                        color = "green" if completed else "red"
-                        
-                        log_label = self.ctk.CTkLabel(
-                            scroll_frame,
-                            text=f"{status} {habit}",
-                            text_color=color,
-                            font=self.ctk.CTkFont(size=14)
-                        )
-                        log_label.pack(anchor="w", padx=20)
-                    
-                # Schedule next chunk if needed
-                if end_idx < len(dates):
-                    self.window.after(10, lambda: create_log_chunk(dates, end_idx, chunk_size))
-                
-            # Start deferred rendering with chunks
-            dates = list(logs_by_date.keys())
-            create_log_chunk(dates, 0, 5)  # Render 5 dates at a time
+        # Logs grouped by date from the shared log index; only the rows in
+        # view are ever drawn, however long the history is
+        date_groups = get_log_index(self.logs).date_groups()
+        
+        self.log_list = None
+        if date_groups:
+            self.log_list = VirtualLogList(self.view_frame, date_groups)
+            updates.append((self.log_list, {"row": 1, "column": 0, "sticky": "nsew", "padx": 20, "pady": (0, 20)}))
         else:
             # Show empty state
+            empty_frame = self.ctk.CTkFrame(
+                self.view_frame,
+                fg_color=COLORS["panel_bg"]
+            )
+            updates.append((empty_frame, {"row": 1, "column": 0, "sticky": "nsew", "padx": 20, "pady": (0, 20)}))
             no_logs_label = self.ctk.CTkLabel(
-                scroll_frame,
+                empty_frame,
                 text="No habit logs found.\nComplete some habits to see them here!",
-                font=self.ctk.CTkFont(size=14)
+                font=self.resources.font(14)
             )
             no_logs_label.pack(pady=20)
 
         clear_btn = self.ctk.CTkButton(
-            self.main_frame,
+            self.view_frame,
             text="Clear Tracking History",
             fg_color="transparent",
             border_width=3,
-            border_color=("gray40", "gray60"),
+            border_color=COLORS["text_muted"],
             hover_color="darkred",
             command=self.confirm_clear_logs,
             state="normal" if self.has_tracking_data() else "disabled"
         )
+        self.logs_clear_btn = clear_btn
         clear_btn.tooltip = None
-        clear_btn.tooltip_timer = None
         clear_btn.bind('<Enter>', lambda e: self._show_tooltip(e, clear_btn, "No Tracking History to Clear!"))
         clear_btn.bind('<Leave>', lambda e: self._hide_tooltip(e, clear_btn))
         updates.append((clear_btn, {"row": 2, "column": 0, "padx": 20, "pady": (0, 20)}))
@@ -1423,10 +1913,10 @@ def create_log_chunk(dates, start_idx, chunk_size):
         # Copyright at bottom
         from habit_engine.__init__ import __copyright__
         copyright = self.ctk.CTkLabel(
-            self.main_frame,
+            self.view_frame,
             text=__copyright__,
-            font=self.ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60")
+            font=self.resources.font(12),
+            text_color=COLORS["text_muted"]
         )
         updates.append((copyright, {"row": 3, "column": 0, "padx": 20, "pady": 10, "sticky": "e"}))
         
@@ -1450,6 +1940,7 @@ def confirm_clear_logs(self):
             if success:
                 self.logs = []
                 self.streaks = {}
+                self._bump_data_version()
                 self.show_success_message("Logs, streaks, and plots cleared successfully.")
                 self.show_logs_view()
                 self.update_clear_buttons_state()
@@ -1460,34 +1951,35 @@ def _show_stats_view(self):
         """Show statistics view with optimized performance"""
         try:
             # Configure grid layout
-            self.main_frame.grid_columnconfigure(0, weight=1)
-            self.main_frame.grid_rowconfigure(1, weight=1)
+            self.view_frame.grid_columnconfigure(0, weight=1)
+            self.view_frame.grid_rowconfigure(1, weight=1)
             
             # Prepare batch updates
             updates = []
             
             # Header section with custom styling
             header_frame = self.ctk.CTkFrame(
-                self.main_frame,
-                fg_color=("gray90", "#2B2B2B")
+                self.view_frame,
+                fg_color=COLORS["header_bg"]
             )
             updates.append((header_frame, {"row": 0, "column": 0, "sticky": "ew", "pady": (0, 20)}))
             
             title = self.ctk.CTkLabel(
                 header_frame, 
                 text="Statistics & Visualization",
-                font=self.ctk.CTkFont(size=24, weight="bold")
+                font=self.resources.font(24, "bold")
             )
             title.pack(pady=(20, 5))
             
             instructions_text = (
-                "Select a habit and click 'Visualize' to see your progress over time.\n"
-                f"Visualizations are saved as .png files in your plots directory"
+                "Select a habit and click 'Visualize' to see your progress over time,\n"
+                "or click 'Dashboard' to compare all habits at once.\n"
+                f"Click 'Export' to save the chart as a .png file in your plots directory"
             )
             self.instructions = self.ctk.CTkLabel(
                 header_frame,
                 text=instructions_text,
-                font=self.ctk.CTkFont(size=14)
+                font=self.resources.font(14)
             )
             self.instructions.pack(pady=(0, 20))
 
@@ -1500,7 +1992,7 @@ def _show_stats_view(self):
             btn_open_plots.pack(pady=(5, 20))
 
             # Controls section with better layout
-            controls = self.ctk.CTkFrame(self.main_frame)
+            controls = self.ctk.CTkFrame(self.view_frame)
             updates.append((controls, {"row": 1, "column": 0, "sticky": "new", "padx": 20, "pady": 10}))
             controls.grid_columnconfigure(1, weight=1)
             
@@ -1510,6 +2002,7 @@ def _show_stats_view(self):
             
             # Pre-calculate habit names for dropdown
             habit_names = ["No habits yet"] if not self.habits else self.habits
+            self._stats_view_habits = list(self.habits)
             
             # Use StringVar for habit selection
             self.selected_habit = tk.StringVar()
@@ -1517,11 +2010,25 @@ def _show_stats_view(self):
                 controls,
                 values=habit_names,
                 variable=self.selected_habit,
+                command=lambda _: self._show_live_chart(),
                 state="disabled" if not self.habits else "normal",
                 width=250
             )
             self.selected_habit.set(habit_names[0])
             habit_dropdown.grid(row=0, column=1, padx=10, pady=5, sticky="ew")
+
+            # Date range selection (shared with the settings window)
+            range_label = self.ctk.CTkLabel(controls, text="Date range:")
+            range_label.grid(row=1, column=0, padx=10, pady=5)
+            self.stats_range_optionmenu = self.ctk.CTkOptionMenu(
+                controls,
+                values=DATE_RANGES + [CUSTOM_RANGE_OPTION],
+                command=self._set_chart_date_range,
+                state="disabled" if not self.habits else "normal",
+                width=250
+            )
+            self.stats_range_optionmenu.set(self.chart_date_range)
+            self.stats_range_optionmenu.grid(row=1, column=1, padx=10, pady=5, sticky="ew")
             
             # Status label with better positioning
             self.viz_status = self.ctk.CTkLabel(
@@ -1541,21 +2048,39 @@ def _show_stats_view(self):
             )
             self.visualize_btn.grid(row=0, column=3, padx=20, pady=5)
 
+            # Export button - saving to disk is an explicit action
+            self.export_btn = self.ctk.CTkButton(
+                controls,
+                text="Export",
+                command=self.export_visualization,
+                state="normal" if self.habits else "disabled",
+                width=120
+            )
+            self.export_btn.grid(row=0, column=4, padx=(0, 20), pady=5)
+
+            # Dashboard button - all habits side by side in one chart
+            self.dashboard_btn = self.ctk.CTkButton(
+                controls,
+                text="Dashboard",
+                command=self.create_dashboard,
+                state="normal" if self.habits else "disabled",
+                width=120
+            )
+            self.dashboard_btn.grid(row=1, column=3, padx=20, pady=5)
+
             # Check for existing plots
-            plots_dir = PLOTS_DIR
-            if os.path.exists(plots_dir):
-                existing_plots = [f for f in os.listdir(plots_dir) if f.startswith('habit_streak_') and f.endswith('.png')]
-                if existing_plots:
-                    view_existing_btn = self.ctk.CTkButton(
-                        controls,
-                        text="View Existing Plots",
-                        command=self.show_existing_plots,
-                        width=120
-                    )
-                    view_existing_btn.grid(row=0, column=4, padx=20, pady=5)
+            self._stats_view_has_plots = has_plots()
+            if self._stats_view_has_plots:
+                view_existing_btn = self.ctk.CTkButton(
+                    controls,
+                    text="View Existing Plots",
+                    command=self.show_existing_plots,
+                    width=120
+                )
+                view_existing_btn.grid(row=0, column=5, padx=20, pady=5)
             
             # Plot area with placeholder
-            self.plot_frame = self.ctk.CTkFrame(self.main_frame)
+            self.plot_frame = self.ctk.CTkFrame(self.view_frame)
             updates.append((self.plot_frame, {"row": 2, "column": 0, "sticky": "nsew", "padx": 20, "pady": 20}))
             self.plot_frame.grid_columnconfigure(0, weight=1)
             self.plot_frame.grid_rowconfigure(0, weight=1)
@@ -1564,12 +2089,14 @@ def _show_stats_view(self):
                 placeholder = self.ctk.CTkLabel(
                     self.plot_frame,
                     text="No habits available for visualization.\nPlease add some habits first.",
-                    font=self.ctk.CTkFont(size=14)
+                    font=self.resources.font(14)
                 )
                 placeholder.grid(row=0, column=0, padx=20, pady=20)
+            else:
+                self._embed_live_chart()
             
             # Bottom frame with improved layout
-            bottom_frame = self.ctk.CTkFrame(self.main_frame)
+            bottom_frame = self.ctk.CTkFrame(self.view_frame)
             updates.append((bottom_frame, {"row": 3, "column": 0, "sticky": "ew", "padx": 20, "pady": (0, 10)}))
             bottom_frame.grid_columnconfigure(0, weight=1)
             
@@ -1578,8 +2105,8 @@ def _show_stats_view(self):
             copyright = self.ctk.CTkLabel(
                 bottom_frame,
                 text=__copyright__,
-                font=self.ctk.CTkFont(size=12),
-                text_color=("gray40", "gray60")
+                font=self.resources.font(12),
+                text_color=COLORS["text_muted"]
             )
             copyright.grid(row=0, column=0, sticky="e", padx=20, pady=10)
             
@@ -1621,8 +2148,8 @@ def show_existing_plots(self):
             # dialog.grab_set()
 
             # Set size and position
-            window_width = 600
-            window_height = 400
+            window_width = 760
+            window_height = 480
             screen_width = dialog.winfo_screenwidth()
             screen_height = dialog.winfo_screenheight()
             x = (screen_width - window_width) // 2
@@ -1634,68 +2161,127 @@ def show_existing_plots(self):
             scroll_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
             plots_dir = PLOTS_DIR
-            plot_files = []
-            if os.path.exists(plots_dir):
-                plot_files = [f for f in os.listdir(plots_dir) if f.startswith('habit_streak_') and f.endswith('.png')]
-                plot_files.sort(reverse=True)  # Most recent first
-
-            if plot_files:
-                for plot_file in plot_files:
-                    # Extract habit name and date from filename
-                    # Format: habit_streak_habitname_YYYYMMDD_HHMMSS.png
-                    parts = plot_file.replace('habit_streak_', '').replace('.png', '').split('_')
-                    if len(parts) >= 3:
-                        habit_name = '_'.join(parts[:-2])
-                        date_str = parts[-2]
-                        time_str = parts[-1]
+            plot_entries = list_plots()  # Most recent first
+
+            if plot_entries:
+                # Thumbnails are produced by a worker thread and dropped into
+                # their rows as they become ready; rows themselves are built in
+                # small batches so the dialog appears immediately
+                thumb_labels = {}
+                ready_thumbs = {}
+                cancelled = threading.Event()
+
+                def set_thumbnail(plot_file):
+                    label = thumb_labels.get(plot_file)
+                    if label is None or plot_file not in ready_thumbs:
+                        return
+                    image = ready_thumbs[plot_file]
+                    try:
+                        if image is None:
+                            label.configure(text="No preview")
+                        elif label.winfo_exists():
+                            ctk_img = self.ctk.CTkImage(light_image=image, dark_image=image, size=image.size)
+                            label.configure(image=ctk_img, text="")
+                            label.image = ctk_img
+                    except tk.TclError:
+                        pass
+
+                def load_thumbnails():
+                    for plot_file, _ in plot_entries:
+                        if cancelled.is_set():
+                            return
+                        thumb_path = get_thumbnail(plot_file)
+                        if thumb_path is None:
+                            ready_thumbs[plot_file] = None
+                            self.window.after(0, lambda f=plot_file: set_thumbnail(f))
+                            continue
                         try:
-                            date_time = datetime.strptime(f"{date_str}_{time_str}", "%Y%m%d_%H%M%S")
-                            formatted_date = date_time.strftime("%Y-%m-%d %H:%M:%S")
-                        except:
-                            formatted_date = "Unknown date"
-
-                        # Create frame for each plot entry
-                        plot_frame = self.ctk.CTkFrame(scroll_frame)
-                        plot_frame.pack(fill="x", padx=5, pady=5)
-
-                        # Plot info
-                        info_text = f"Habit: {habit_name}\nCreated: {formatted_date}"
-                        info_label = self.ctk.CTkLabel(
-                            plot_frame,
-                            text=info_text,
-                            justify="left"
-                        )
-                        info_label.pack(side="left", padx=10, pady=5)
-
-                        # Buttons frame
-                        btn_frame = self.ctk.CTkFrame(plot_frame, fg_color="transparent")
-                        btn_frame.pack(side="right", padx=10)
-
-                        # View button
-                        view_btn = self.ctk.CTkButton(
-                            btn_frame,
-                            text="View",
-                            command=lambda f=plot_file: self.open_plot_file(os.path.join(plots_dir, f), parent=dialog),
-                            width=70
-                        )
-                        view_btn.pack(side="left", padx=5)
-
-                        # Delete button
-                        delete_btn = self.ctk.CTkButton(
-                            btn_frame,
-                            text="Delete",
-                            command=lambda f=plot_file, frame=plot_frame: self.delete_plot(f, frame),
-                            fg_color="red",
-                            hover_color="darkred",
-                            width=70
-                        )
-                        delete_btn.pack(side="left", padx=5)
+                            with Image.open(thumb_path) as thumb:
+                                thumb.load()
+                                image = thumb.copy()
+                        except Exception as e:
+                            print(f"{Fore.LIGHTRED_EX}Error loading thumbnail {thumb_path}: {e}{Style.RESET_ALL}")
+                            continue
+                        if cancelled.is_set():
+                            return
+                        ready_thumbs[plot_file] = image
+                        self.window.after(0, lambda f=plot_file: set_thumbnail(f))
+
+                def build_row(plot_file, entry):
+                    # Create frame for each plot entry
+                    plot_frame = self.ctk.CTkFrame(scroll_frame)
+                    plot_frame.pack(fill="x", padx=5, pady=5)
+
+                    # Thumbnail placeholder, filled in by the worker
+                    thumb_label = self.ctk.CTkLabel(
+                        plot_frame,
+                        text="…",
+                        width=THUMBNAIL_SIZE[0],
+                        height=THUMBNAIL_SIZE[1]
+                    )
+                    thumb_label.pack(side="left", padx=(10, 0), pady=5)
+                    thumb_labels[plot_file] = thumb_label
+                    set_thumbnail(plot_file)
+
+                    # Plot info
+                    info_text = f"Habit: {entry.get('habit')}\nCreated: {entry.get('created_at') or 'Unknown date'}"
+                    if entry.get('chart_style') and entry.get('date_range'):
+                        info_text += f"\n{entry['chart_style']} · {entry['date_range']}"
+                    info_label = self.ctk.CTkLabel(
+                        plot_frame,
+                        text=info_text,
+                        justify="left"
+                    )
+                    info_label.pack(side="left", padx=10, pady=5)
+
+                    # Buttons frame
+                    btn_frame = self.ctk.CTkFrame(plot_frame, fg_color="transparent")
+                    btn_frame.pack(side="right", padx=10)
+
+                    # View button
+                    view_btn = self.ctk.CTkButton(
+                        btn_frame,
+                        text="View",
+                        command=lambda f=plot_file: self.open_plot_file(os.path.join(plots_dir, f), parent=dialog),
+                        width=70
+                    )
+                    view_btn.pack(side="left", padx=5)
+
+                    # Delete button
+                    delete_btn = self.ctk.CTkButton(
+                        btn_frame,
+                        text="Delete",
+                        command=lambda f=plot_file, frame=plot_frame: self.delete_plot(f, frame),
+                        fg_color="red",
+                        hover_color="darkred",
+                        width=70
+                    )
+                    delete_btn.pack(side="left", padx=5)
+
+                def build_rows(start_index=0, batch_size=20):
+                    if cancelled.is_set() or not dialog.winfo_exists():
+                        return
+                    for plot_file, entry in plot_entries[start_index:start_index + batch_size]:
+                        build_row(plot_file, entry)
+                    if start_index + batch_size < len(plot_entries):
+                        self.timers.schedule(f"plot-rows-{id(dialog)}", 10, lambda: build_rows(start_index + batch_size, batch_size), owner=dialog)
+
+                def on_dialog_destroy(event):
+                    if event.widget is dialog:
+                        cancelled.set()
+                        self.tasks.cancel_group(thumbs_group)
+                        ready_thumbs.clear()
+
+                dialog.bind("<Destroy>", on_dialog_destroy, add="+")
+                build_rows()
+                thumbs_group = f"thumbnails-{id(dialog)}"
+                self.tasks.submit(load_thumbnails, name="load-thumbnails", lane="background", group=thumbs_group)
 
             else:
                 no_plots_label = self.ctk.CTkLabel(
                     scroll_frame,
                     text="No plots found",
-                    font=self.ctk.CTkFont(size=14)
+                    font=self.resources.font(14)
                 )
                 no_plots_label.pack(pady=20)
 
@@ -1713,19 +2299,24 @@ def show_existing_plots(self):
 
     def open_plot_file(self, filepath, parent=None):
         try:
+            if filepath.lower().endswith(".svg"):
+                # Vector exports are handed to the system viewer
+                if sys.platform == "win32":
+                    os.startfile(filepath)
+                elif sys.platform == "darwin":
+                    subprocess.run(["open", filepath])
+                else:
+                    subprocess.run(["xdg-open", filepath])
+                return
             print(f"{Fore.LIGHTCYAN_EX}Attempting to open plot in GUI window: {filepath}{Style.RESET_ALL}")
-            img = Image.open(filepath)
-            img_width, img_height = img.size
+            # Only the header is read here; decoding and scaling run on a worker
+            with Image.open(filepath) as header:
+                source_size = header.size
             # Constrain image size to fit within 80% of screen
-            max_width = int(self.window.winfo_screenwidth() * 0.8)
-            max_height = int(self.window.winfo_screenheight() * 0.8)
-            if img_width > max_width or img_height > max_height:
-                # Resize image while maintaining aspect ratio
-                ratio = min(max_width / img_width, max_height / img_height)
-                new_width = int(img_width * ratio)
-                new_height = int(img_height * ratio)
-                img = img.resize((new_width, new_height), Image.LANCZOS)
-                img_width, img_height = new_width, new_height
+            max_size = (int(self.window.winfo_screenwidth() * 0.8), int(self.window.winfo_screenheight() * 0.8))
+            img_width, img_height = fit_within(source_size, max_size)
+            cache_key = (filepath, os.stat(filepath).st_mtime, (img_width, img_height))
+            ctk_img = self.resources.get_image(cache_key)
             parent = parent or self.window  # fallback to main window
             plot_window = self.ctk.CTkToplevel(parent)
             self.remove_window_icon(plot_window)
@@ -1746,40 +2337,72 @@ def open_plot_file(self, filepath, parent=None):
             x = (screen_width - img_width) // 2
             y = (screen_height - img_height) // 2
             plot_window.geometry(f"{img_width}x{img_height}+{x}+{y}")
-            from customtkinter import CTkImage
-            ctk_img = CTkImage(light_image=img, dark_image=img, size=(img_width, img_height))
-            label = self.ctk.CTkLabel(plot_window, image=ctk_img, text="")
-            label.pack()
+            # Placeholder until the image is decoded (unless it is cached already)
+            label = self.ctk.CTkLabel(plot_window, image=ctk_img, text="" if ctk_img else "Loading plot...",
+                                      width=img_width, height=img_height, font=self.resources.font(14))
+            label.pack(fill="both", expand=True)
             label.image = ctk_img
+            plot_window.plot_label = label
             plot_window.protocol("WM_DELETE_WINDOW", lambda pw=plot_window: self.on_plot_window_close(pw))
+            # Also runs when the window goes away with its parent dialog
+            plot_window.bind("<Destroy>", lambda e, pw=plot_window: self._release_plot_window(pw) if e.widget is pw else None, add="+")
+
+            def show_image(img):
+                from customtkinter import CTkImage
+                loaded = CTkImage(light_image=img, dark_image=img, size=(img_width, img_height))
+                self.resources.put_image(cache_key, loaded)
+                if label.winfo_exists():
+                    label.configure(image=loaded, text="")
+                    label.image = loaded
+
+            def show_load_error(e):
+                print(f"{Fore.LIGHTRED_EX}Error loading plot image {filepath}: {e}{Style.RESET_ALL}")
+                if label.winfo_exists():
+                    label.configure(text="Could not load this plot")
+
+            if ctk_img is None:
+                self.tasks.submit(load_plot_image, filepath, (img_width, img_height), name="load-plot-image",
+                                  group=f"plot-window-{id(plot_window)}", on_done=show_image, on_error=show_load_error)
             print(f"{Fore.LIGHTGREEN_EX}Opened plot window for {filepath}{Style.RESET_ALL}")
         except Exception as e:
             self.show_error_message(f"Error opening file: {str(e)}")
             print(f"{Fore.LIGHTRED_EX}Error in open_plot_file: {str(e)}{Style.RESET_ALL}")    
 
     def on_plot_window_close(self, plot_window):
+        plot_window.destroy()  # Cleanup happens in _release_plot_window
+
+    def _release_plot_window(self, plot_window):
+        """Drop everything a closed plot window kept alive: its pending load and its image"""
+        self.tasks.cancel_group(f"plot-window-{id(plot_window)}")
+        label = getattr(plot_window, "plot_label", None)
+        if label is not None:
+            # A CTkImage keeps a callback into every label showing it, so detach
+            # it or the cached image would keep the closed window's widgets alive
+            try:
+                label.configure(image=None)
+            except (tk.TclError, AttributeError):
+                pass
+            label.image = None
+            plot_window.plot_label = None
         for item in self.plot_windows:
             if item[0] == plot_window:
                 fp = item[1]
                 self.plot_windows.remove(item)
                 print(f"{Fore.LIGHTYELLOW_EX}Closed plot window for {fp}{Style.RESET_ALL}")
                 break
-        plot_window.destroy()
 
     def delete_plot(self, filename, frame):
         """Delete a plot file and remove it from the dialog"""
         try:
-            filepath = os.path.join(PLOTS_DIR, filename)
-            if os.path.exists(filepath):
-                os.remove(filepath)
-                frame.destroy()
-                self.show_success_message("Plot deleted successfully")
-                self.update_clear_buttons_state()
+            delete_plot_file(filename)
+            frame.destroy()
+            self.show_success_message("Plot deleted successfully")
+            self.update_clear_buttons_state()
         except Exception as e:
             self.show_error_message(f"Error deleting plot: {str(e)}")
 
     def create_visualization(self):
-        """Create visualization with enhanced error handling"""
+        """Render the selected habit's chart in memory and show it in the plot area"""
         try:
             habit_name = self.selected_habit.get()
             if not habit_name or habit_name == "No habits yet":
@@ -1790,10 +2413,6 @@ def create_visualization(self):
             self.visualize_btn.configure(state="disabled")
             self.viz_status.configure(text="Generating visualization...")
             
-            # Clear previous plot
-            for widget in self.plot_frame.winfo_children():
-                widget.destroy()
-
             # Check if we have data for this habit
             habit_logs = [log for log in self.logs if log[0] == habit_name]
             if not habit_logs:
@@ -1802,43 +2421,424 @@ def create_visualization(self):
                 self.viz_status.configure(text="")
                 return
 
-            def create_viz():
-                try:
-                    # Generate visualization in background
-                    result = self._visualize(self.logs, habit_name, chart_style=self.chart_style, show_streak_annotations=self.show_streak_annotations, date_range=self.chart_date_range)
-                    
-                    def update_ui():
-                        if result and os.path.exists(result):
-                            # Reset button and status
-                            self.visualize_btn.configure(state="normal")
-                            self.viz_status.configure(text="")
-                            
-                            # Show the view options dialog
-                            self.window.after(100, lambda: self.show_view_options(result))
-                            self.update_clear_buttons_state()
-                        else:
-                            self.show_error_message("Failed to create visualization")
-                            self.visualize_btn.configure(state="normal")
-                            self.viz_status.configure(text="")
-                    
-                    # Update UI in main thread
-                    self.window.after(0, update_ui)
-                    
-                except Exception as e:
-                    self.window.after(0, lambda: self.show_error_message(f"Error creating visualization: {str(e)}"))
-                    self.window.after(0, lambda: self.visualize_btn.configure(state="normal"))
-                    self.window.after(0, lambda: self.viz_status.configure(text=""))
-            
-            # Run visualization in background thread
-            viz_thread = threading.Thread(target=create_viz)
-            viz_thread.daemon = True
-            viz_thread.start()
+            # Render at the plot area's pixel size so no resize is needed afterwards
+            size_px = self._chart_size_px()
+            stall_probe = self._start_stall_probe(f"render.{self.render_backend}")
+
+            def update_ui(result):
+                self._report_render_stall(stall_probe)
+                # Reset button and status
+                self.visualize_btn.configure(state="normal")
+                self.viz_status.configure(text="")
+                if result is not None:
+                    self._show_chart_buffer(result)
+                else:
+                    self.show_error_message("Failed to create visualization")
+
+            def on_error(e):
+                if stall_probe is not None:
+                    stall_probe.stop()
+                self.show_error_message(f"Error creating visualization: {str(e)}")
+                self.visualize_btn.configure(state="normal")
+                self.viz_status.configure(text="")
+
+            # Generate visualization in background
+            self.tasks.submit(self._render_chart, self.logs, habit_name, self.chart_style, self.show_streak_annotations,
+                              self.chart_date_range, size_px, name="visualize", on_done=update_ui, on_error=on_error)
             
         except Exception as e:
             self.show_error_message(f"Error: {str(e)}")
             self.visualize_btn.configure(state="normal")
             self.viz_status.configure(text="")
 
+    def create_dashboard(self):
+        """Render all habits in one dashboard figure and show it in the plot area"""
+        try:
+            if not self.habits:
+                self.show_error_message("Please add some habits first")
+                return
+
+            self.dashboard_btn.configure(state="disabled")
+            self.viz_status.configure(text="Generating dashboard...")
+
+            size_px = self._chart_size_px()
+            habits = list(self.habits)
+            logs = list(self.logs)
+
+            date_range = self.chart_date_range
+
+            def create_dash():
+                try:
+                    return visualize_dashboard(logs, habits, date_range=date_range, output="rgba", size_px=size_px)
+                except Exception as e:
+                    print(f"{Fore.LIGHTRED_EX}Error creating dashboard: {e}{Style.RESET_ALL}")
+                    return None
+
+            def update_ui(result):
+                self.dashboard_btn.configure(state="normal")
+                self.viz_status.configure(text="")
+                if result is not None:
+                    self._show_chart_buffer(result)
+                else:
+                    self.show_error_message("Failed to create dashboard")
+
+            self.tasks.submit(create_dash, name="dashboard", on_done=update_ui)
+
+        except Exception as e:
+            self.show_error_message(f"Error: {str(e)}")
+            self.dashboard_btn.configure(state="normal")
+            self.viz_status.configure(text="")
+
+    def _show_chart_buffer(self, rgba):
+        """Display an in-memory RGBA chart buffer in the plot area"""
+        try:
+            if not self.plot_frame.winfo_exists():
+                return
+            self._clear_chart_buffer()
+            if getattr(self, 'live_chart_widget', None) is not None:
+                self.live_chart_widget.grid_remove()
+
+            img = Image.fromarray(rgba)
+            # CTkImage sizes are in logical pixels; undo widget scaling so the buffer maps 1:1
+            scaling = self.ctk.ScalingTracker.get_widget_scaling(self.plot_frame)
+            size = (int(img.width / scaling), int(img.height / scaling))
+            chart_img = self.ctk.CTkImage(light_image=img, dark_image=img, size=size)
+            chart_label = self.ctk.CTkLabel(self.plot_frame, image=chart_img, text="")
+            chart_label.grid(row=0, column=0, sticky="nsew")
+            chart_label.image = chart_img
+            self.chart_buffer_label = chart_label
+        except tk.TclError:
+            pass  # Stats view was closed while rendering
+
+    def _clear_chart_buffer(self):
+        """Remove the last rendered chart image from the plot area"""
+        label = getattr(self, 'chart_buffer_label', None)
+        if label is not None:
+            try:
+                label.destroy()
+            except tk.TclError:
+                pass
+        self.chart_buffer_label = None
+
+    def _embed_live_chart(self):
+        """Embed the live chart in the stats view's plot area"""
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        # The figure is created once per session and re-attached to each new plot_frame
+        if getattr(self, 'live_chart', None) is None:
+            self.live_chart = LiveHabitChart()
+        elif self._live_chart_exists():
+            # Drop the canvas from the previous stats view so it stops resizing the shared figure
+            self.live_chart_widget.destroy()
+        canvas = FigureCanvasTkAgg(self.live_chart.figure, master=self.plot_frame)
+        self.live_chart.attach(canvas)
+        self.live_chart_widget = canvas.get_tk_widget()
+        self.live_chart_widget.grid(row=0, column=0, sticky="nsew")
+        self.chart_buffer_label = None
+        self._show_live_chart()
+
+    def _chart_size_px(self):
+        """Pixel size of the stats plot area, which in-memory charts are rendered at"""
+        self.plot_frame.update_idletasks()
+        self._last_chart_size_px = (max(self.plot_frame.winfo_width(), 400), max(self.plot_frame.winfo_height(), 250))
+        return self._last_chart_size_px
+
+    @habit_metrics.timed("render.ms")
+    def _render_chart(self, logs, habit_name, chart_style, show_annotations, date_range, size_px=None, profile=None):
+        """
+        Render a chart with the configured backend and wait for it, so call it
+        from a background thread. With profile=None the chart is rendered in
+        memory at size_px and returned as an RGBA array (through the render
+        cache); otherwise it is saved with that render profile and its path
+        is returned.
+        """
+        if self.render_backend == "process":
+            try:
+                if profile is None:
+                    cache_key = render_cache_key(logs, habit_name, chart_style, show_annotations, date_range, size_px)
+                    rgba = render_cache.get(cache_key)
+                    if rgba is None:
+                        rgba = self.render_pool.render_rgba(logs, habit_name, chart_style, show_annotations, date_range, size_px).result()
+                        if rgba is not None:
+                            render_cache.put(cache_key, rgba)
+                    return rgba
+                filepath = self.render_pool.render_file(logs, habit_name, chart_style, show_annotations, date_range, profile).result()
+                if filepath:
+                    # The worker only writes the file; the index is kept by this process
+                    register_rendered_plot(filepath, logs, habit_name, chart_style, date_range)
+                return filepath
+            except Exception as e:
+                print(f"{Fore.LIGHTRED_EX}Render worker failed, rendering in this process instead: {e}{Style.RESET_ALL}")
+
+        if profile is None:
+            return self._visualize(logs, habit_name, chart_style=chart_style, show_streak_annotations=show_annotations,
+                                   date_range=date_range, output="rgba", size_px=size_px)
+        return self._visualize(logs, habit_name, chart_style=chart_style, show_streak_annotations=show_annotations,
+                               date_range=date_range, profile=profile)
+
+    def _start_stall_probe(self, name):
+        """Probe the main thread during a render, but only while the watchdog or perf overlay is on"""
+        if self.watchdog is None and self.perf_hud is None:
+            return None
+        return MainThreadStallProbe(self.window, name).start()
+
+    def _report_render_stall(self, stall_probe):
+        """Stop a render's stall probe (if any) and log how long the main thread was held up"""
+        if stall_probe is None:
+            return
+        elapsed_ms, max_stall_ms, total_stall_ms = stall_probe.stop()
+        print(f"{Fore.LIGHTBLACK_EX}{stall_probe.name}: {elapsed_ms:.0f} ms, main thread stalled "
+              f"{total_stall_ms:.0f} ms (longest {max_stall_ms:.0f} ms){Style.RESET_ALL}")
+
+    def show_timer_debug(self):
+        """Show pending timers and background tasks with their counters, refreshed every second"""
+        if getattr(self, "_timer_debug", None) is not None and self._timer_debug.winfo_exists():
+            self._timer_debug.lift()
+            return
+        dialog = self.ctk.CTkToplevel(self.window)
+        dialog.title("Pending Timers & Tasks")
+        dialog.geometry("420x320")
+        self.set_window_icon(dialog)
+        self._timer_debug = dialog
+        textbox = self.ctk.CTkTextbox(dialog, font=self.resources.font(12, family="Courier"))
+        textbox.pack(fill="both", expand=True, padx=10, pady=10)
+
+        def refresh():
+            lines = [f"{'Timer':<30}{'Due in':>10}"]
+            for name, due_in_ms, owner_alive in self.timers.pending():
+                lines.append(f"{name[:29]:<30}{due_in_ms:>8.0f}ms{'' if owner_alive else '  (stale)'}")
+            if len(lines) == 1:
+                lines.append("(none)")
+            lines.append("")
+            lines.append(f"{'Task':<30}{'Lane':<13}State")
+            tasks = self.tasks.pending()
+            for name, lane, state in tasks:
+                lines.append(f"{name[:29]:<30}{lane:<13}{state}")
+            if not tasks:
+                lines.append("(none)")
+            _, counters = habit_metrics.snapshot()
+            callback_ms = habit_metrics.summary("timers.callback_ms")
+            lines.append("")
+            lines.append(f"Wake-ups: {counters.get('timers.wakeups', 0)}   "
+                         f"Dropped (owner gone): {counters.get('timers.dropped', 0)}")
+            if callback_ms:
+                lines.append(f"Callbacks: {callback_ms['count']}, avg {callback_ms['avg']:.1f} ms, "
+                             f"max {callback_ms['max']:.1f} ms")
+            lines.append(f"Tasks: {counters.get('tasks.completed', 0)} done, {counters.get('tasks.failed', 0)} failed, "
+                         f"{counters.get('tasks.cancelled', 0)} cancelled")
+            textbox.configure(state="normal")
+            textbox.delete("1.0", "end")
+            textbox.insert("1.0", "\n".join(lines))
+            textbox.configure(state="disabled")
+            # The refresh itself shows up in the list as a 1 s job
+            self.timers.schedule("timer-debug-refresh", 1000, refresh, owner=dialog)
+
+        refresh()
+
+    def toggle_perf_hud(self):
+        """Show or hide the performance overlay in the top-right corner of the window"""
+        if self.perf_hud is not None:
+            self.timers.cancel("perf-hud")
+            self.perf_hud.destroy()
+            self.perf_hud = None
+            return
+        self.perf_hud = self.ctk.CTkFrame(self.window, fg_color=COLORS["card_bg"], corner_radius=8)
+        self.perf_hud.place(relx=1.0, rely=0.0, x=-30, y=30, anchor="ne")
+        self.perf_hud_label = self.ctk.CTkLabel(self.perf_hud, text="", justify="left", anchor="w",
+                                                font=self.resources.font(11, family="Courier"),
+                                                text_color=COLORS["text"])
+        self.perf_hud_label.pack(padx=10, pady=8)
+        self._refresh_perf_hud()
+
+    def _refresh_perf_hud(self):
+        """Redraw the performance overlay from habit_metrics and live counts, twice a second"""
+        if self.perf_hud is None or not self.perf_hud.winfo_exists():
+            self.perf_hud = None
+            return
+
+        def last(name, unit="ms"):
+            stats = habit_metrics.summary(name)
+            return f"{stats['last']:.0f} {unit} (max {stats['max']:.0f})" if stats else "-"
+
+        widgets, stack = 0, [self.main_frame]
+        while stack:
+            children = stack.pop().winfo_children()
+            widgets += len(children)
+            stack.extend(children)
+        _, counters = habit_metrics.snapshot()
+        caches = self.resources.stats()
+        rss = habit_metrics.process_rss_bytes()
+        rows = [
+            ("View build", last("view.build_ms")),
+            ("View show", last("view.show_ms")),
+            ("Save", last("save.logs_ms")),
+            ("Render", last("render.ms")),
+            ("Widgets", str(widgets)),
+            ("Image cache", f"{caches['images']} ({caches['image_bytes'] / (1024 * 1024):.1f}/{caches['image_cap'] / (1024 * 1024):.0f} MB)"),
+            ("Image hits", f"{caches['image_hits']} / {caches['image_hits'] + caches['image_misses']}"),
+            ("Font cache", str(caches["fonts"])),
+            ("Render cache", str(len(render_cache))),
+            ("Tk after jobs", str(len(self.window.tk.splitlist(self.window.tk.call("after", "info"))))),
+            ("Timers", str(len(self.timers.pending()))),
+            ("Tasks", str(len(self.tasks.pending()))),
+            ("Stalls", str(counters.get("watchdog.stalls", 0)) if self.watchdog else "watchdog off"),
+            ("RSS", f"{rss / (1024 * 1024):.0f} MB" if rss else "n/a"),
+        ]
+        self.perf_hud_label.configure(text="\n".join(f"{name:<14}{value}" for name, value in rows))
+        self.perf_hud.lift()
+        self.timers.schedule("perf-hud", 500, self._refresh_perf_hud, owner=self.perf_hud)
+
+    def _schedule_prerender(self):
+        """
+        Speculatively render the chart the user is most likely to ask for next
+        (selected habit, current style and range, optionally the other ranges)
+        into the render cache, so Visualize is served from memory.
+        Starts on the next timer tick and supersedes any pre-render already
+        running; runs in the speculative lane, behind any interactive work.
+        """
+        self._cancel_prerender()
+        self.timers.schedule("prerender", 0, self._start_prerender)
+
+    def _cancel_prerender(self):
+        """Stop pending and running pre-renders (a running render finishes its current chart)"""
+        self.timers.cancel("prerender")
+        self.tasks.cancel_group("prerender")
+
+    def _resume_prerender(self):
+        """Pre-render again for the shown stats view if its chart is not in the render cache"""
+        habit_name = self.selected_habit.get()
+        if not self._live_chart_visible() or habit_name not in self.habits:
+            return
+        key = render_cache_key(self.logs, habit_name, self.chart_style, self.show_streak_annotations,
+                               self.chart_date_range, self._chart_size_px())
+        if key not in render_cache:
+            self._schedule_prerender()
+
+    def _start_prerender(self):
+        if self._live_chart_visible():
+            habit_name = self.selected_habit.get()
+            size_px = self._chart_size_px()
+        elif self._live_chart_exists():
+            return  # Stats view kept but hidden: it pre-renders again when shown
+        elif self.habits and self._last_chart_size_px:
+            # Stats view closed (e.g. after a save): it opens on the first habit
+            habit_name = self.habits[0]
+            size_px = self._last_chart_size_px
+        else:
+            return
+        if habit_name not in self.habits:
+            return
+
+        date_ranges = [self.chart_date_range]
+        if self.settings.get("prerender_all_ranges", False):
+            date_ranges += [r for r in DATE_RANGES if r != self.chart_date_range]
+
+        self.tasks.cancel_group("prerender")
+        logs = self.logs
+        chart_style = self.chart_style
+        show_annotations = self.show_streak_annotations
+
+        def prerender():
+            for date_range in date_ranges:
+                if current_task().cancelled:
+                    return
+                try:
+                    if render_cache_key(logs, habit_name, chart_style, show_annotations, date_range, size_px) in render_cache:
+                        continue
+                    self._render_chart(logs, habit_name, chart_style, show_annotations, date_range, size_px=size_px)
+                except Exception as e:
+                    print(f"{Fore.LIGHTRED_EX}Error pre-rendering chart: {e}{Style.RESET_ALL}")
+                    return
+
+        self.tasks.submit(prerender, name="prerender", lane="speculative", group="prerender")
+
+    def _live_chart_exists(self):
+        """True if the live chart is embedded in an existing (possibly hidden) plot area"""
+        widget = getattr(self, 'live_chart_widget', None)
+        try:
+            return widget is not None and bool(widget.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def _live_chart_visible(self):
+        """
+        True if the live chart exists and the stats view is the one shown.
+        A kept stats view hidden behind another view is not redrawn or
+        pre-rendered for; it refreshes when it is shown again.
+        """
+        return self._current_view == self._show_stats_view.__name__ and self._live_chart_exists()
+
+    def _show_live_chart(self):
+        """Show the live chart for the selected habit and range, replacing any rendered image"""
+        if not self._live_chart_visible():
+            return
+        self._clear_chart_buffer()
+        self.live_chart_widget.grid()
+        habit_name = self.selected_habit.get()
+        if habit_name in self.habits:
+            self.live_chart.set_data(self.logs, habit_name, self.chart_date_range)
+            self._schedule_prerender()
+
+    def _update_live_chart_day(self, date_str, values):
+        """Push a checkbox change for date_str to the live chart (blitted when possible)"""
+        if not self._live_chart_visible():
+            return
+        habit_name = self.live_chart.habit_name
+        if habit_name not in values:
+            return
+        if self.live_chart.covers(date_str):
+            self.live_chart.update_day(date_str, values[habit_name])
+        else:
+            self.live_chart.set_data(self.logs, habit_name, self.chart_date_range)
+
+    def export_visualization(self):
+        """Save the selected habit's chart as a PNG in the plots directory"""
+        try:
+            habit_name = self.selected_habit.get()
+            if not habit_name or habit_name == "No habits yet":
+                self.show_error_message("Please select a habit first")
+                return
+
+            if not any(log[0] == habit_name for log in self.logs):
+                self.show_error_message(f"No data available for {habit_name}")
+                return
+
+            self.export_btn.configure(state="disabled")
+            self.viz_status.configure(text="Exporting...")
+            stall_probe = self._start_stall_probe(f"export.{self.render_backend}")
+
+            def export():
+                try:
+                    result = self._render_chart(self.logs, habit_name, self.chart_style, self.show_streak_annotations, self.chart_date_range, profile=self.render_profile)
+                except Exception as e:
+                    print(f"{Fore.LIGHTRED_EX}Error exporting visualization: {e}{Style.RESET_ALL}")
+                    result = None
+
+                deleted, freed = apply_retention_settings(self.settings, protect=[result] if result else ())
+                return result, deleted, freed
+
+            def update_ui(outcome):
+                result, deleted, freed = outcome
+                self._report_render_stall(stall_probe)
+                self.export_btn.configure(state="normal")
+                if deleted:
+                    self.viz_status.configure(text=f"Removed {deleted} old plot(s), {freed / (1024 * 1024):.1f} MB reclaimed")
+                else:
+                    self.viz_status.configure(text="")
+                if result and os.path.exists(result):
+                    self._bump_data_version()
+                    self.show_view_options(result)
+                    self.update_clear_buttons_state()
+                else:
+                    self.show_error_message("Failed to export visualization")
+
+            self.tasks.submit(export, name="export", on_done=update_ui)
+
+        except Exception as e:
+            self.show_error_message(f"Error: {str(e)}")
+            self.export_btn.configure(state="normal")
+            self.viz_status.configure(text="")
+
     def show_view_options(self, filepath):
         """Show dialog with options to view or open visualization"""
         try:
@@ -1859,8 +2859,8 @@ def show_view_options(self, filepath):
             # Message
             msg = self.ctk.CTkLabel(
                 view_dialog,
-                text="Visualization created successfully!\nWould you like to view it?",
-                font=self.resources.cache_font("Helvetica", 14)
+                text="Visualization exported successfully!\nWould you like to view it?",
+                font=self.resources.font(14)
             )
             msg.pack(pady=20)
             
@@ -1944,7 +2944,7 @@ def show_license_dialog(self):
                 license_label = self.ctk.CTkLabel(
                     text_frame,
                     text=license_text,
-                    font=self.ctk.CTkFont(family="Courier", size=12),
+                    font=self.resources.font(12, "normal", family="Courier"),
                     justify="left",
                     wraplength=window_width-60
                 )
@@ -2015,7 +3015,7 @@ def show_error_message(self, message, on_close=None):
             
     def after_success_action(self, action):
         """Execute an action after success message disappears"""
-        self.window.after(1800, action)  # 1500ms for message + 300ms buffer
+        self.timers.schedule("after-success", 1800, action)  # 1500ms for message + 300ms buffer
             
     def show_reset_confirmation(self):
         """Show reset confirmation dialog"""
@@ -2069,7 +3069,7 @@ def show_reset_confirmation(self):
             
             # Message label
             label = self.ctk.CTkLabel(dialog, text="Type 'RESET' to confirm clearing all data:", 
-                               font=self.ctk.CTkFont(size=14))
+                               font=self.resources.font(14))
             label.pack(pady=20)
             
             # Entry field
@@ -2113,6 +3113,7 @@ def reset_all_data(self):
                 self.habits = []
                 self.logs = []
                 self.streaks = {}
+                self._bump_data_version()
                 
                 # Re-load settings from disk (reset to DEFAULTS)
                 self.settings = load_settings()
@@ -2145,7 +3146,7 @@ def reset_all_data(self):
                 self.show_success_message("All data has been reset\n\nPlease Wait...")
                 
                 # Use after to ensure message is shown before view change
-                self.window.after(2100, self.show_setup_view)
+                self.timers.schedule("after-success", 2100, self.show_setup_view)
 
                 # Ensure the main window has focus after reset
                 self.window.focus_force()
@@ -2188,7 +3189,7 @@ def apply_theme():
         
             # 5. Schedule the theme change to happen after a short delay.
             #    This ensures the settings window has fully closed before redrawing the entire UI.
-            self.window.after(50, apply_theme)
+            self.timers.schedule("apply-theme", 50, apply_theme)
 
         except Exception as e:
             self.show_error_message(f"Failed to change theme: {str(e)}")
@@ -2203,8 +3204,16 @@ def change_autosave_interval(self, new_interval_str: str):
                 self.show_error_message(f"Unknown interval: {new_interval_str}")
                 return
 
-            # 2. Update the instance attribute used by the autosave loop
+            # 2. Update the instance attribute used by the autosave timer and
+            #    re-arm a pending save with the new interval
             self.autosave_interval = new_interval
+            self._cancel_autosave()
+            if self.pending_changes:
+                self._mark_dirty()
+            try:
+                self._autosave_instruction_label.configure(text=self._autosave_instruction())
+            except (AttributeError, tk.TclError):
+                pass  # Habits view not built
 
             # 3. Update the settings dictionary
             self.settings['autosave_interval'] = new_interval
@@ -2218,7 +3227,7 @@ def change_autosave_interval(self, new_interval_str: str):
             def show_msg():
                  self.show_success_message(f"Auto-save set to {new_interval_str.lower()}")
 
-            self.window.after(100, show_msg)
+            self.timers.schedule("autosave-interval-message", 100, show_msg)
 
         except Exception as e:
             self.show_error_message(f"Failed to set interval: {str(e)}")
@@ -2262,6 +3271,7 @@ def _set_chart_style(self, style: str):
         self.chart_style = style
         self.settings["chart_style"] = self.chart_style
         save_settings(self.settings)
+        self._schedule_prerender()
         self.show_success_message(f"Chart style set to '{self.chart_style}'")
 
     def _toggle_streak_annotations(self):
@@ -2273,11 +3283,129 @@ def _toggle_streak_annotations(self):
 
     def _set_chart_date_range(self, date_range: str):
         """Sets the default chart date range and saves it."""
+        if date_range == CUSTOM_RANGE_OPTION:
+            # Put the menus back until the dialog produces a valid range
+            for menu_name in ('stats_range_optionmenu', 'chart_date_range_optionmenu'):
+                menu = getattr(self, menu_name, None)
+                try:
+                    if menu is not None and menu.winfo_exists():
+                        menu.set(self.chart_date_range)
+                except tk.TclError:
+                    pass
+            self._show_custom_range_dialog()
+            return
         self.chart_date_range = date_range
         self.settings["chart_date_range"] = self.chart_date_range
         save_settings(self.settings)
+        if self._live_chart_visible():
+            self.stats_range_optionmenu.set(self.chart_date_range)
+            self._show_live_chart()
+        elif self._live_chart_exists():
+            # Hidden stats view: show the new range in its menu now, redraw it when it is shown
+            self.stats_range_optionmenu.set(self.chart_date_range)
+            stats_view = self._views.get(self._show_stats_view.__name__)
+            if stats_view is not None:
+                stats_view["version"] = None
+        try:
+            if self.chart_date_range_optionmenu.winfo_exists():
+                self.chart_date_range_optionmenu.set(self.chart_date_range)
+        except (AttributeError, tk.TclError):
+            pass  # Settings window not open
         self.show_success_message(f"Default chart range set to '{self.chart_date_range}'")
 
+    def _show_custom_range_dialog(self):
+        """Ask for a custom start/end date and apply it as the chart date range."""
+        try:
+            dialog = self.ctk.CTkToplevel(self.window)
+            dialog.title("Custom Date Range")
+            self.remove_window_icon(dialog)
+            dialog.attributes('-topmost', True)
+
+            window_width = 320
+            window_height = 240
+            x = (dialog.winfo_screenwidth() - window_width) // 2
+            y = (dialog.winfo_screenheight() - window_height) // 2
+            dialog.geometry(f"{window_width}x{window_height}+{x}+{y}")
+
+            label = self.ctk.CTkLabel(dialog, text="Dates as YYYY-MM-DD (leave one empty for an open range):",
+                                      wraplength=280, font=self.resources.font(13))
+            label.pack(pady=(20, 10))
+
+            # Pre-fill with the current range
+            try:
+                current_start, current_end = resolve_date_range(self.chart_date_range)
+            except ValueError:
+                current_start, current_end = None, None
+
+            start_entry = self.ctk.CTkEntry(dialog, placeholder_text="Start date", width=200)
+            start_entry.pack(pady=5)
+            if current_start:
+                start_entry.insert(0, current_start)
+            end_entry = self.ctk.CTkEntry(dialog, placeholder_text="End date", width=200)
+            end_entry.pack(pady=5)
+            if current_end:
+                end_entry.insert(0, current_end)
+            start_entry.focus_set()
+
+            def apply():
+                date_range = format_custom_range(start_entry.get().strip() or None, end_entry.get().strip() or None)
+                try:
+                    resolve_date_range(date_range)
+                except ValueError as e:
+                    self.show_error_message(f"Invalid date range: {e}")
+                    return
+                dialog.destroy()
+                self._set_chart_date_range(date_range if date_range != format_custom_range() else "All Time")
+
+            button_frame = self.ctk.CTkFrame(dialog, fg_color="transparent")
+            button_frame.pack(pady=15)
+            self.ctk.CTkButton(button_frame, text="Apply", command=apply, width=100).pack(side="left", padx=10)
+            self.ctk.CTkButton(button_frame, text="Cancel", command=dialog.destroy, width=100).pack(side="left", padx=10)
+
+            dialog.bind("<Return>", lambda e: apply())
+            dialog.bind("<Escape>", lambda e: dialog.destroy())
+
+        except Exception as e:
+            self.show_error_message(f"Error showing date range dialog: {str(e)}")
+
+    def _set_render_profile(self, profile: str):
+        """Sets the render profile used when exporting charts and saves it."""
+        self.render_profile = profile
+        self.settings["render_profile"] = self.render_profile
+        save_settings(self.settings)
+        render_profile = RENDER_PROFILES[profile]
+        self.show_success_message(f"Export profile set to '{profile}' ({render_profile['format'].upper()}, {render_profile['dpi']} DPI)")
+
+    def _set_render_backend(self, choice: str):
+        """Sets whether charts render in a worker process or a background thread and saves it."""
+        backend = self.render_backend_map.get(choice)
+        if backend is None:
+            self.show_error_message(f"Unknown render backend: {choice}")
+            return
+        self.render_backend = backend
+        self.settings["render_backend"] = backend
+        save_settings(self.settings)
+        pool_action = self.render_pool.start if backend == "process" else self.render_pool.shutdown
+        self.tasks.submit(pool_action, name=f"render-pool-{backend}", lane="background")
+        self.show_success_message(f"Charts will render in a {choice.lower()}")
+
+    def _set_plot_retention(self, choice: str):
+        """Sets how many exported plots to keep per habit and applies it in the background."""
+        keep_per_habit = self.plot_retention_map.get(choice)
+        if keep_per_habit is None:
+            self.show_error_message(f"Unknown retention option: {choice}")
+            return
+        self.settings["plot_retention_keep_per_habit"] = keep_per_habit
+        save_settings(self.settings)
+
+        def on_applied(result):
+            deleted, freed = result
+            if deleted:
+                self.update_clear_buttons_state()
+
+        self.tasks.submit(apply_retention_settings, self.settings, name="apply-retention", lane="background", on_done=on_applied)
+        self.show_success_message(f"Plot retention set to '{choice.lower()}'")
+
     def _schedule_daily_reminder(self):
         """
         Schedules the daily habit reminder.
@@ -2285,11 +3413,7 @@ def _schedule_daily_reminder(self):
         to run periodically or for the next day.
         """
         # Cancel any previous schedules to avoid multiple reminders
-        if hasattr(self, '_reminder_job_id') and self._reminder_job_id:
-            try:
-                self.window.after_cancel(self._reminder_job_id)
-            except ValueError:
-                pass # Job might have already run or been cancelled
+        self.timers.cancel("daily-reminder")
 
         if not self.daily_reminder_enabled:
             print(f"{Fore.LIGHTYELLOW_EX}Daily reminders are disabled. Not scheduling.{Style.RESET_ALL}")
@@ -2330,7 +3454,7 @@ def _schedule_daily_reminder(self):
             delay_ms = (next_day_target - now).total_seconds() * 1000
             if delay_ms < 0: # Should not happen if logic is correct, but safety
                 delay_ms = 60 * 1000 # Default to 1 minute to re-evaluate
-            self._reminder_job_id = self.window.after(int(delay_ms), self._schedule_daily_reminder)
+            self.timers.schedule("daily-reminder", int(delay_ms), self._schedule_daily_reminder)
             print(f"{Fore.LIGHTCYAN_EX}Next reminder scheduled for {next_day_target.strftime('%Y-%m-%d %H:%M')}{Style.RESET_ALL}")
 
         else:
@@ -2348,7 +3472,7 @@ def _schedule_daily_reminder(self):
                 delay_seconds = 60 # Check again in 1 minute
 
             delay_ms = max(1000, int(delay_seconds * 1000)) # Minimum 1 second delay
-            self._reminder_job_id = self.window.after(delay_ms, self._schedule_daily_reminder)
+            self.timers.schedule("daily-reminder", delay_ms, self._schedule_daily_reminder)
             print(f"{Fore.LIGHTCYAN_EX}Reminder re-check scheduled in {int(delay_seconds / 60)} minutes ({int(delay_seconds)} seconds){Style.RESET_ALL}")
 
 
@@ -2446,7 +3570,7 @@ def open_settings_window(self):
         self.settings_appearance_option.set(self.current_appearance_mode)
 
         # --- Notification / Reminder Preferences ---
-        CTkLabel(settings_scroll_frame, text="Reminder Preferences", font=self.ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 5))
+        CTkLabel(settings_scroll_frame, text="Reminder Preferences", font=self.resources.font(14, "bold")).pack(pady=(15, 5))
         
         # Enable Daily Reminders Checkbox
         self.enable_reminder_checkbox = self.ctk.CTkCheckBox(
@@ -2465,10 +3589,10 @@ def open_settings_window(self):
             settings_scroll_frame,
             values=time_options,
             command=self._set_reminder_time,
-            fg_color=("gray80", "gray20"),
-            button_color=("gray60", "gray40"),
-            button_hover_color=("gray50", "gray50"),
-            text_color=("gray10", "gray90")
+            fg_color=COLORS["control_bg"],
+            button_color=COLORS["control_button"],
+            button_hover_color=COLORS["control_hover"],
+            text_color=COLORS["text"]
         )
         # Set current value or placeholder
         if self.reminder_time in time_options:
@@ -2478,18 +3602,18 @@ def open_settings_window(self):
         self.reminder_time_optionmenu.pack(padx=20, pady=5, fill="x")
 
         # --- Chart / Visualization Settings ---
-        self.ctk.CTkLabel(settings_scroll_frame, text="Visualization Settings", font=self.ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 5))
+        self.ctk.CTkLabel(settings_scroll_frame, text="Visualization Settings", font=self.resources.font(14, "bold")).pack(pady=(15, 5))
         
         # Chart Style Option Menu
         self.ctk.CTkLabel(settings_scroll_frame, text="Chart Type:").pack(padx=20, pady=(5,0), anchor="w")
         self.chart_style_optionmenu = self.ctk.CTkOptionMenu(
             settings_scroll_frame,
-            values=["Line Plot", "Bar Chart"],
+            values=CHART_STYLES,
             command=self._set_chart_style,
-            fg_color=("gray80", "gray20"),
-            button_color=("gray60", "gray40"),
-            button_hover_color=("gray50", "gray50"),
-            text_color=("gray10", "gray90")
+            fg_color=COLORS["control_bg"],
+            button_color=COLORS["control_button"],
+            button_hover_color=COLORS["control_hover"],
+            text_color=COLORS["text"]
         )
         self.chart_style_optionmenu.set(self.chart_style)
         self.chart_style_optionmenu.pack(padx=20, pady=5, fill="x")
@@ -2507,16 +3631,59 @@ def open_settings_window(self):
         self.ctk.CTkLabel(settings_scroll_frame, text="Default Date Range:").pack(padx=20, pady=(5,0), anchor="w")
         self.chart_date_range_optionmenu = self.ctk.CTkOptionMenu(
             settings_scroll_frame,
-            values=["Last 7 Days", "Last 30 Days", "All Time"],
+            values=DATE_RANGES + [CUSTOM_RANGE_OPTION],
             command=self._set_chart_date_range,
-            fg_color=("gray80", "gray20"),
-            button_color=("gray60", "gray40"),
-            button_hover_color=("gray50", "gray50"),
-            text_color=("gray10", "gray90")
+            fg_color=COLORS["control_bg"],
+            button_color=COLORS["control_button"],
+            button_hover_color=COLORS["control_hover"],
+            text_color=COLORS["text"]
         )
         self.chart_date_range_optionmenu.set(self.chart_date_range)
         self.chart_date_range_optionmenu.pack(padx=20, pady=5, fill="x")
 
+        # Plot Retention Option Menu
+        self.ctk.CTkLabel(settings_scroll_frame, text="Keep Exported Plots:").pack(padx=20, pady=(5,0), anchor="w")
+        self.plot_retention_optionmenu = self.ctk.CTkOptionMenu(
+            settings_scroll_frame,
+            values=list(self.plot_retention_map.keys()),
+            command=self._set_plot_retention,
+            fg_color=COLORS["control_bg"],
+            button_color=COLORS["control_button"],
+            button_hover_color=COLORS["control_hover"],
+            text_color=COLORS["text"]
+        )
+        keep_per_habit = self.settings.get("plot_retention_keep_per_habit", 0)
+        self.plot_retention_optionmenu.set(self.plot_retention_map_rev.get(keep_per_habit, f"{keep_per_habit} per habit"))
+        self.plot_retention_optionmenu.pack(padx=20, pady=5, fill="x")
+
+        # Export Profile Option Menu
+        self.ctk.CTkLabel(settings_scroll_frame, text="Export Profile:").pack(padx=20, pady=(5,0), anchor="w")
+        self.render_profile_optionmenu = self.ctk.CTkOptionMenu(
+            settings_scroll_frame,
+            values=list(RENDER_PROFILES.keys()),
+            command=self._set_render_profile,
+            fg_color=COLORS["control_bg"],
+            button_color=COLORS["control_button"],
+            button_hover_color=COLORS["control_hover"],
+            text_color=COLORS["text"]
+        )
+        self.render_profile_optionmenu.set(self.render_profile)
+        self.render_profile_optionmenu.pack(padx=20, pady=5, fill="x")
+
+        # Render Backend Option Menu
+        self.ctk.CTkLabel(settings_scroll_frame, text="Render Charts In:").pack(padx=20, pady=(5,0), anchor="w")
+        self.render_backend_optionmenu = self.ctk.CTkOptionMenu(
+            settings_scroll_frame,
+            values=list(self.render_backend_map.keys()),
+            command=self._set_render_backend,
+            fg_color=COLORS["control_bg"],
+            button_color=COLORS["control_button"],
+            button_hover_color=COLORS["control_hover"],
+            text_color=COLORS["text"]
+        )
+        self.render_backend_optionmenu.set(self.render_backend_map_rev[self.render_backend])
+        self.render_backend_optionmenu.pack(padx=20, pady=5, fill="x")
+
         # — Auto-save —
         CTkLabel(settings_scroll_frame, text="Auto-save Interval").pack(pady=(15, 5))
         autosave_options = list(self.autosave_map.keys())
@@ -2543,7 +3710,7 @@ def open_settings_window(self):
             text="Clear Tracking History",
             fg_color="gray20",
             border_width=3,
-            border_color=("gray40", "gray60"),
+            border_color=COLORS["text_muted"],
             hover_color="darkred",
             command=self.confirm_clear_logs
         ).pack(fill="x", padx=20, pady=5)
@@ -2576,113 +3743,121 @@ def run(self):
             except:
                 pass
 
-    def clear_main_frame(self):
-        """Clear main frame and recycle all widgets"""
-        for widget in self.main_frame.winfo_children():
-            widget_type = type(widget)
-            if isinstance(widget, self.ctk.CTkCheckBox):
-                self._recycle_widget(widget, self._checkbox_pool)
-            elif isinstance(widget, self.ctk.CTkLabel):
-                self._recycle_widget(widget, self._label_pool)
-            elif isinstance(widget, self.ctk.CTkButton):
-                self._recycle_widget(widget, self._button_pool)
-            elif isinstance(widget, self.ctk.CTkFrame):
-                self._recycle_widget(widget, self._frame_pool)
-            else:
-                widget.destroy()  # Destroy non-recyclable widgets
-
     def show_view(self, view_method):
-        """Generic optimized view switching method"""
+        """
+        Show a view, building it only on the first visit. Built views stay
+        alive hidden (grid_remove) and come back as they were; if the data
+        or the day changed since, the view's _refresh_* method updates it in
+        place, or it is rebuilt when that is not possible. The setup view is always
+        built fresh and discards the other views.
+        """
         try:
-            # Disable window updates during transition
+            start_time = time.perf_counter()
+
+            # Pre-renders are only useful for the view that scheduled them
+            self._cancel_prerender()
+
+            name = view_method.__name__
+            keep = view_method != self._show_setup_view
+            if not keep:
+                self._discard_views()
+
+            if self._current_view not in (None, name) and self._current_view in self._views:
+                if self._current_view == self._show_setup_view.__name__:
+                    self._discard_views(self._current_view)
+                else:
+                    self._views[self._current_view]["frame"].grid_remove()
+            # Set before refreshing/building so the view counts as visible (see _live_chart_visible)
+            self._current_view = name
+
+            today = datetime.now().strftime('%Y-%m-%d')
+            view = self._views.get(name)
+            if view is not None and (view["version"] != self.data_version or view["date"] != today):
+                refresh = getattr(self, name.replace("_show_", "_refresh_", 1), None)
+                if refresh is not None and refresh():
+                    view["version"] = self.data_version
+                    view["date"] = today
+                else:
+                    self._discard_views(name)
+                    view = None
+
+            action = "show"
+            if view is None:
+                action = "build"
+                self._current_view = name
+                self.view_frame = self.ctk.CTkFrame(self.main_frame, fg_color="transparent")
+                view = {"frame": self.view_frame, "version": self.data_version, "date": today}
+                self._views[name] = view
+                view_method()
+                # Named Tk fonts alive after the build (the style registry keeps this flat)
+                habit_metrics.record("tk.named_fonts", len(self.window.tk.call("font", "names")))
+
+            view["frame"].grid(row=0, column=0, sticky="nsew")
+
             self.window.update_idletasks()
-            
-            # Hide main frame during transition to prevent flickering
-            self.main_frame.grid_remove()
-            
-            # Clear existing widgets efficiently
-            self._clear_widgets_efficiently()
-            
-            # Show new view
-            view_method()
-            
-            # Show main frame and update
-            self.main_frame.grid()
-            
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            habit_metrics.record(f"view.{name[len('_show_'):]}.{action}_ms", elapsed_ms)
+            habit_metrics.record(f"view.{action}_ms", elapsed_ms)
+            if name == self._show_stats_view.__name__ and not self.timers.is_pending("prerender"):
+                # The switch away cancelled its pre-render; restart it unless the chart is cached
+                self._resume_prerender()
+
         except Exception as e:
             print(f"{Fore.LIGHTRED_EX}Error switching view: {e}{Style.RESET_ALL}")
             self.show_error_message(f"Error switching view: {str(e)}")
-            
-    def _clear_widgets_efficiently(self):
-        """Clear widgets efficiently using batched operations"""
-        try:
-            # Get all children once
-            children = self.main_frame.winfo_children()
-            
-            # Sort widgets by type for efficient recycling
-            for widget in children:
-                try:
-                    if isinstance(widget, self.ctk.CTkCheckBox):
-                        self._recycle_widget(widget, self._checkbox_pool)
-                    elif isinstance(widget, self.ctk.CTkLabel):
-                        self._recycle_widget(widget, self._label_pool)
-                    elif isinstance(widget, self.ctk.CTkButton):
-                        self._recycle_widget(widget, self._button_pool)
-                    elif isinstance(widget, self.ctk.CTkFrame):
-                        self._recycle_widget(widget, self._frame_pool)
-                    else:
-                        widget.destroy()
-                except tk.TclError:
-                    # Widget already destroyed
-                    continue
-                    
-        except Exception as e:
-            print(f"{Fore.LIGHTRED_EX}Error clearing widgets: {e}{Style.RESET_ALL}")
-            
-    def _recycle_widget(self, widget, pool):
-        """Add a widget to the recycling pool with error handling"""
-        try:
-            widget.pack_forget()
-            widget.grid_forget()
-            widget.place_forget()
-            pool.append(widget)
-        except tk.TclError:
-            # Widget already destroyed or invalid
-            pass
-        except Exception as e:
-            print(f"{Fore.LIGHTRED_EX}Error recycling widget: {e}{Style.RESET_ALL}")
 
-    def _get_recycled_widget(self, pool, widget_type, parent, **kwargs):
-        """Get a widget from the recycling pool or create a new one with optimized configuration"""
-        try:
-            if pool:
-                widget = pool.pop()
-                try:
-                    # Batch configure widget properties
-                    config_updates = {}
-                    for key, value in kwargs.items():
-                        config_updates[key] = value
-                    if config_updates:
-                        widget.configure(**config_updates)
-                    return widget
-                except tk.TclError:
-                    # Widget invalid, create new one
-                    pass
-                    
-            # Create new widget if none available in pool
-            return widget_type(parent, **kwargs)
-            
-        except Exception as e:
-            print(f"{Fore.LIGHTRED_EX}Error getting recycled widget: {e}{Style.RESET_ALL}")
-            # Fallback to creating new widget
-            return widget_type(parent, **kwargs)
+    def _bump_data_version(self):
+        """Mark habits/logs/streaks as changed so kept views refresh on their next show"""
+        self.data_version += 1
+
+    def _discard_views(self, name=None):
+        """Destroy one kept view (or all of them) so it is rebuilt on its next show"""
+        for view_name in ([name] if name else list(self._views)):
+            view = self._views.pop(view_name, None)
+            if view is None:
+                continue
+            try:
+                view["frame"].destroy()
+            except tk.TclError:
+                pass
+            if self._current_view == view_name:
+                self._current_view = None
+
+    def _refresh_habits_view(self):
+        """Update the kept habits view's checkboxes and streaks; False if it needs a rebuild"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        if list(self.habit_vars) != list(self.habits) or self._habits_view_date != today:
+            return False
+        today_values = {log[0]: log[2] for log in self.logs if log[1] == today}
+        for habit, var in self.habit_vars.items():
+            var.set(bool(today_values.get(habit, False)))
+            streak = self.streaks.get(habit, 0)
+            self.streak_labels[habit].configure(
+                text=f"🔥 {streak}",
+                text_color=COLORS["streak_active"] if (streak > 0) else COLORS["text_muted"]
+            )
+        return True
+
+    def _refresh_logs_view(self):
+        """Rebind the kept logs view to the current logs; False if it needs a rebuild"""
+        date_groups = get_log_index(self.logs).date_groups()
+        if self.log_list is None or not date_groups:
+            return False  # Switching between the list and the empty state
+        self.log_list.set_data(date_groups)
+        self.logs_clear_btn.configure(state="normal" if self.has_tracking_data() else "disabled")
+        return True
+
+    def _refresh_stats_view(self):
+        """Redraw the kept stats view's live chart; False if it needs a rebuild"""
+        if self._stats_view_habits != list(self.habits) or self._stats_view_has_plots != has_plots():
+            return False
+        self._show_live_chart()
+        return True
 
     def _show_setup_view(self):
         """Show the initial setup view with proper validation"""
-        self.clear_main_frame()
-        
         # Create main container frame that will hold everything
-        main_container = self.ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        main_container = self.ctk.CTkFrame(self.view_frame, fg_color="transparent")
         main_container.pack(fill="both", expand=True, padx=20, pady=20)
         main_container.grid_columnconfigure(0, weight=1)
         main_container.grid_rowconfigure(1, weight=1)  # Make habits section expandable
@@ -2694,14 +3869,14 @@ def _show_setup_view(self):
         welcome = self.ctk.CTkLabel(
             top_frame, 
             text="Welcome to HERALDEXX HABIT TRACKER!",
-            font=self.ctk.CTkFont(size=24, weight="bold")
+            font=self.resources.font(24, "bold")
         )
         welcome.pack(pady=(0, 20))
         
         intro = self.ctk.CTkLabel(
             top_frame,
             text="Let's set up your daily habits to track.",
-            font=self.ctk.CTkFont(size=16)
+            font=self.resources.font(16)
         )
         intro.pack()
         
@@ -2748,7 +3923,7 @@ def _show_setup_view(self):
             bottom_frame,
             text="Start Tracking",
             command=self.save_initial_habits,
-            font=self.ctk.CTkFont(size=16, weight="bold"),
+            font=self.resources.font(16, "bold"),
             width=200,
             height=50
         )
@@ -2759,8 +3934,8 @@ def _show_setup_view(self):
         copyright = self.ctk.CTkLabel(
             bottom_frame,
             text=__copyright__,
-            font=self.ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60")
+            font=self.resources.font(12),
+            text_color=COLORS["text_muted"]
         )
         copyright.grid(row=1, column=0, pady=(0, 5))
         
@@ -2799,8 +3974,8 @@ def update_habit_entries(self):
                     label = self.ctk.CTkLabel(
                         row, 
                         text=f"Habit #{i+1}:",
-                        font=self.ctk.CTkFont(size=14, weight="bold"),
-                        text_color=("gray10", "gray90")
+                        font=self.resources.font(14, "bold"),
+                        text_color=COLORS["text"]
                     )
                     label.pack(side="left", padx=10)
                     
@@ -2812,7 +3987,7 @@ def update_habit_entries(self):
                         placeholder_text="Enter habit name (max 50 chars)",
                         border_width=2,
                         corner_radius=8,
-                        font=self.ctk.CTkFont(size=13)
+                        font=self.resources.font(13)
                     )
                     entry.pack(side="left", padx=10, fill="x", expand=True)
 
@@ -2916,6 +4091,7 @@ def save_initial_habits(self):
             # Save habits
             if (self._save_habits(habits)):
                 self.habits = habits
+                self._bump_data_version()
                 # Enable navigation buttons now that we have habits
                 self.habits_button.configure(state="normal")
                 self.logs_button.configure(state="normal")
@@ -0,0 +1,394 @@
+# Exports a static HTML dashboard that renders charts in the browser.
+# Per-habit daily series and aggregates are precomputed here into compact data
+# files; the page draws them with plain JavaScript and SVG, so viewing history
+# needs neither matplotlib nor a server (the data files are loaded with
+# <script> tags, which also works when index.html is opened from disk).
+# Exports are incremental: a habit's data file is only rewritten when the
+# hash of its logs changed since the previous export.
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+
+import numpy as np
+from colorama import Fore, Style
+
+from habit_engine.__init__ import __version__
+from habit_engine.habit_plots import compute_data_hash
+from habit_engine.habit_visualization import _build_habit_matrix, _series_stats, get_log_index
+
+EXPORT_VERSION = 1
+MANIFEST_FILE = "manifest.js"
+HABITS_SUBDIR = "habits"
+
+def _habit_slug(habit_name):
+    """Filesystem-safe, collision-free file stem for a habit."""
+    readable = re.sub(r'[^A-Za-z0-9]+', '_', habit_name).strip('_')[:40] or "habit"
+    return f"{readable}_{hashlib.sha1(habit_name.encode('utf-8')).hexdigest()[:8]}"
+
+def _bucket_rates(start_date, day_values, unit):
+    """Completion rate per week ('W', Monday based) or month ('M'), ignoring days without entries."""
+    days = start_date + np.arange(len(day_values))
+    if unit == 'W':
+        keys = (days - np.datetime64('1970-01-05', 'D')).astype(int) // 7
+    else:
+        keys = days.astype('datetime64[M]').astype(int)
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(keys)) + 1))
+    logged = np.add.reduceat((~np.isnan(day_values)).astype(int), starts)
+    completed = np.add.reduceat(np.nan_to_num(day_values), starts)
+    rates = np.divide(completed, logged, out=np.zeros(len(starts)), where=logged > 0)
+    if unit == 'W':
+        labels = np.datetime_as_string(np.datetime64('1970-01-05', 'D') + 7 * keys[starts], unit='D')
+    else:
+        labels = np.datetime_as_string(days[starts], unit='M')
+    return {"labels": labels.tolist(), "rates": [round(float(rate), 3) for rate in rates]}
+
+def build_habit_payload(habit_name, habit_logs, index=None):
+    """
+    Precompute everything the page needs for one habit. The daily series is a
+    string with one character per day: '1' completed, '0' missed, '.' no entry.
+    Pass the LogIndex of the full logs as index when exporting several habits,
+    so it is not rebuilt from habit_logs for each one.
+    """
+    start_date, matrix = _build_habit_matrix(habit_logs, [habit_name], "All Time", index=index)
+    day_values = matrix[0]
+    daily = ''.join('.' if np.isnan(value) else ('1' if value else '0') for value in day_values)
+    _, current, longest = _series_stats(np.nan_to_num(day_values).astype(np.int8)) if habit_logs else (0.0, 0, 0)
+    logged_days = int(np.sum(~np.isnan(day_values)))
+    rate = float(np.nansum(day_values)) / logged_days if logged_days else 0.0
+    return {
+        "habit": habit_name,
+        "start": str(start_date),
+        "daily": daily,
+        "weekly": _bucket_rates(start_date, day_values, 'W'),
+        "monthly": _bucket_rates(start_date, day_values, 'M'),
+        "stats": {
+            "days": logged_days,
+            "completion": round(rate, 3),
+            "current_streak": current,
+            "best_streak": longest
+        }
+    }
+
+def _write_if_changed(filepath, content):
+    """Write text only if it differs from what is on disk. Returns True if written."""
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    temp_path = filepath + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(temp_path, filepath)
+    return True
+
+def _load_manifest(out_dir):
+    """Read the manifest of the previous export, or None."""
+    try:
+        with open(os.path.join(out_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            text = f.read()
+        data = json.loads(text[text.index('(') + 1:text.rindex(')')])
+        return data if data.get("version") == EXPORT_VERSION else None
+    except (OSError, ValueError):
+        return None
+
+def export_html_dashboard(logs, habits, out_dir):
+    """
+    Write (or update) the static dashboard in out_dir.
+    Returns (written, unchanged) habit counts, or None on error.
+    """
+    try:
+        habits_dir = os.path.join(out_dir, HABITS_SUBDIR)
+        os.makedirs(habits_dir, exist_ok=True)
+
+        previous = _load_manifest(out_dir) or {}
+        previous_habits = {entry["habit"]: entry for entry in previous.get("habits", [])}
+
+        index = get_log_index(logs)
+        logs_by_habit = {habit: index.logs_for(habit) for habit in habits}
+
+        written = unchanged = 0
+        manifest_habits = []
+        for habit in habits:
+            slug = _habit_slug(habit)
+            data_file = f"{HABITS_SUBDIR}/{slug}.js"
+            data_hash = compute_data_hash(logs_by_habit[habit], habit, "All Time")
+            old_entry = previous_habits.get(habit)
+
+            if old_entry and old_entry.get("hash") == data_hash and os.path.exists(os.path.join(out_dir, data_file)):
+                manifest_habits.append(old_entry)
+                unchanged += 1
+                continue
+
+            payload = build_habit_payload(habit, logs_by_habit[habit], index=index)
+            _write_if_changed(os.path.join(out_dir, data_file),
+                              f"HabitData.addHabit({json.dumps(payload, separators=(',', ':'))});\n")
+            manifest_habits.append({"habit": habit, "file": data_file, "hash": data_hash, "stats": payload["stats"]})
+            written += 1
+
+        # Drop data files of habits that no longer exist
+        current_files = {os.path.basename(entry["file"]) for entry in manifest_habits}
+        for name in os.listdir(habits_dir):
+            if name.endswith(".js") and name not in current_files:
+                os.remove(os.path.join(habits_dir, name))
+
+        manifest = {
+            "version": EXPORT_VERSION,
+            "app_version": __version__,
+            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "habits": manifest_habits
+        }
+        _write_if_changed(os.path.join(out_dir, MANIFEST_FILE),
+                          f"HabitData.setManifest({json.dumps(manifest, separators=(',', ':'))});\n")
+
+        # Static page assets only change with the app itself
+        _write_if_changed(os.path.join(out_dir, "index.html"), INDEX_HTML)
+        _write_if_changed(os.path.join(out_dir, "dashboard.js"), DASHBOARD_JS)
+        _write_if_changed(os.path.join(out_dir, "dashboard.css"), DASHBOARD_CSS)
+
+        return written, unchanged
+
+    except Exception as e:
+        print(f"{Fore.LIGHTRED_EX}Error exporting HTML dashboard: {e}{Style.RESET_ALL}")
+        return None
+
+INDEX_HTML = """<!DOCTYPE html>
+<html lang="en">
+  <head>
+    <meta charset="UTF-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+    <title>HERALDEXX Habit Tracker - Dashboard</title>
+    <link rel="stylesheet" href="dashboard.css" />
+  </head>
+  <body>
+    <header>
+      <h1>Habit Dashboard</h1>
+      <p id="generated"></p>
+      <nav id="range-buttons">
+        <button data-days="30">Last 30 Days</button>
+        <button data-days="365" class="active">Last Year</button>
+        <button data-days="0">All Time</button>
+      </nav>
+    </header>
+    <main id="habits"></main>
+    <script src="dashboard.js"></script>
+    <script src="manifest.js"></script>
+  </body>
+</html>
+"""
+
+DASHBOARD_JS = r"""// Renders the exported habit data with plain SVG. Data files call
+// HabitData.setManifest() / HabitData.addHabit(), so no fetch() is needed.
+(function () {
+  "use strict";
+
+  var SVG_NS = "http://www.w3.org/2000/svg";
+  var CELL = 12;
+  var state = { manifest: null, habits: {}, days: 365 };
+
+  function svg(tag, attrs, parent) {
+    var node = document.createElementNS(SVG_NS, tag);
+    Object.keys(attrs).forEach(function (key) { node.setAttribute(key, attrs[key]); });
+    if (parent) parent.appendChild(node);
+    return node;
+  }
+
+  function addDays(isoDate, days) {
+    var date = new Date(isoDate + "T00:00:00Z");
+    date.setUTCDate(date.getUTCDate() + days);
+    return date.toISOString().slice(0, 10);
+  }
+
+  function dayDiff(fromIso, toIso) {
+    return Math.round((Date.parse(toIso + "T00:00:00Z") - Date.parse(fromIso + "T00:00:00Z")) / 86400000);
+  }
+
+  // Today's local date, which is what the app's date ranges are based on
+  function todayIso() {
+    var now = new Date();
+    return new Date(Date.UTC(now.getFullYear(), now.getMonth(), now.getDate())).toISOString().slice(0, 10);
+  }
+
+  // [first, last] day shown: the last N days up to today (as "Last N Days" in
+  // the app, so days after the last entry are included), or all logged days
+  function visibleSpan(data) {
+    if (state.days > 0) {
+      var today = todayIso();
+      return [addDays(today, 1 - state.days), today];
+    }
+    return [data.start, addDays(data.start, data.daily.length - 1)];
+  }
+
+  function percent(rate) { return Math.round(rate * 100) + "%"; }
+
+  // Calendar heatmap: one column per week, Monday at the top
+  function drawCalendar(data, container) {
+    var daily = data.daily;
+    var span = visibleSpan(data);
+    var count = dayDiff(span[0], span[1]) + 1;
+    var offset = dayDiff(data.start, span[0]);  // Index in daily of the first day shown
+    var weekday = (new Date(span[0] + "T00:00:00Z").getUTCDay() + 6) % 7;
+    var weeks = Math.ceil((weekday + count) / 7);
+    var chart = svg("svg", { width: weeks * CELL + 2, height: 7 * CELL + 2, class: "calendar" }, container);
+    for (var i = 0; i < count; i++) {
+      var value = offset + i >= 0 ? daily.charAt(offset + i) : "";  // "" outside the logged days
+      var slot = weekday + i;
+      var rect = svg("rect", {
+        x: Math.floor(slot / 7) * CELL + 1, y: (slot % 7) * CELL + 1,
+        width: CELL - 2, height: CELL - 2, rx: 2,
+        class: value === "1" ? "done" : value === "0" ? "missed" : "empty"
+      }, chart);
+      svg("title", {}, rect).textContent = addDays(span[0], i) +
+        (value === "1" ? " completed" : value === "0" ? " missed" : " no entry");
+    }
+  }
+
+  // Completion-rate bars, weekly for short ranges and monthly for long ones
+  function drawRates(data, container) {
+    var series = state.days > 0 && state.days <= 365 ? data.weekly : data.monthly;
+    var first = visibleSpan(data)[0];
+    var rates = [], labels = [];
+    series.labels.forEach(function (label, i) {
+      // Keep the weeks / months that overlap the visible span
+      var overlaps = series === data.weekly ? addDays(label, 6) >= first : label >= first.slice(0, 7);
+      if (state.days === 0 || overlaps) {
+        rates.push(series.rates[i]);
+        labels.push(label);
+      }
+    });
+    var width = Math.max(200, Math.min(720, rates.length * 14));
+    var height = 80;
+    var barWidth = width / Math.max(rates.length, 1);
+    var chart = svg("svg", { width: width, height: height, class: "rates" }, container);
+    rates.forEach(function (rate, i) {
+      var barHeight = Math.max(1, rate * (height - 4));
+      var bar = svg("rect", {
+        x: i * barWidth + 1, y: height - barHeight, width: Math.max(1, barWidth - 2), height: barHeight
+      }, chart);
+      svg("title", {}, bar).textContent = labels[i] + ": " + percent(rate);
+    });
+  }
+
+  function render() {
+    var root = document.getElementById("habits");
+    root.textContent = "";
+    if (!state.manifest) return;
+    document.getElementById("generated").textContent =
+      "Generated " + state.manifest.generated_at + " - " + state.manifest.habits.length + " habit(s)";
+
+    state.manifest.habits.forEach(function (entry) {
+      var data = state.habits[entry.habit];
+      var card = document.createElement("section");
+      card.className = "habit";
+      var title = document.createElement("h2");
+      title.textContent = entry.habit;
+      card.appendChild(title);
+      var stats = document.createElement("p");
+      stats.className = "stats";
+      stats.textContent = "Completion " + percent(entry.stats.completion) +
+        " · Current streak " + entry.stats.current_streak +
+        " · Best streak " + entry.stats.best_streak +
+        " · " + entry.stats.days + " day(s) logged";
+      card.appendChild(stats);
+      if (data && data.daily.length) {
+        drawCalendar(data, card);
+        drawRates(data, card);
+      }
+      root.appendChild(card);
+    });
+  }
+
+  window.HabitData = {
+    setManifest: function (manifest) {
+      state.manifest = manifest;
+      var pending = manifest.habits.length;
+      if (!pending) render();
+      manifest.habits.forEach(function (entry) {
+        var script = document.createElement("script");
+        script.src = entry.file + "?v=" + entry.hash.slice(0, 8);
+        script.onload = script.onerror = function () { if (--pending === 0) render(); };
+        document.body.appendChild(script);
+      });
+    },
+    addHabit: function (data) { state.habits[data.habit] = data; }
+  };
+
+  document.getElementById("range-buttons").addEventListener("click", function (event) {
+    if (!event.target.dataset.days) return;
+    state.days = parseInt(event.target.dataset.days, 10);
+    Array.prototype.forEach.call(this.children, function (button) {
+      button.classList.toggle("active", button === event.target);
+    });
+    render();
+  });
+})();
+"""
+
+DASHBOARD_CSS = """body {
+  margin: 0;
+  font-family: system-ui, -apple-system, "Segoe UI", sans-serif;
+  background: #1e1e1e;
+  color: #e6e6e6;
+}
+header {
+  padding: 24px 32px 8px;
+}
+h1 {
+  margin: 0 0 4px;
+}
+#generated {
+  margin: 0 0 12px;
+  color: #9a9a9a;
+}
+nav button {
+  background: #2b2b2b;
+  color: inherit;
+  border: 1px solid #444;
+  border-radius: 6px;
+  padding: 6px 12px;
+  cursor: pointer;
+}
+nav button.active {
+  background: #30a14e;
+  border-color: #30a14e;
+}
+main {
+  padding: 8px 32px 32px;
+}
+.habit {
+  background: #2b2b2b;
+  border-radius: 10px;
+  padding: 16px 20px;
+  margin-bottom: 16px;
+  overflow-x: auto;
+}
+.habit h2 {
+  margin: 0 0 4px;
+  font-size: 1.2em;
+}
+.stats {
+  margin: 0 0 12px;
+  color: #b5b5b5;
+}
+svg {
+  display: block;
+  margin-bottom: 8px;
+}
+.calendar .done {
+  fill: #30a14e;
+}
+.calendar .missed {
+  fill: #ebedf0;
+}
+.calendar .empty {
+  fill: #3a3a3a;
+}
+.rates rect {
+  fill: #30a14e;
+}
+"""
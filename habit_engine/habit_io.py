@@ -17,7 +17,15 @@
     "reminder_time": "09:00",
     "chart_style": "Line Plot",
     "show_streak_annotations": True,
-    "chart_date_range": "Last 30 Days"
+    "chart_date_range": "Last 30 Days",
+    "plot_retention_keep_per_habit": 0,
+    "plot_retention_max_mb": 0,
+    "plot_retention_max_age_days": 0,
+    "render_profile": "Print",
+    "prerender_all_ranges": False,
+    "render_backend": "process",
+    "stall_watchdog_ms": 0,
+    "image_cache_mb": 64
 }    
 
 # Detect base path depending on whether the app is frozen (compiled with PyInstaller) or not
@@ -46,6 +54,8 @@
 HABITS_FILE = os.path.join(DATA_DIR, "habits.json")
 LOGS_FILE = os.path.join(DATA_DIR, "logs.json")
 STREAKS_FILE = os.path.join(DATA_DIR, "streaks.json")
+PLOTS_INDEX_FILE = os.path.join(PLOTS_DIR, "index.json")
+THUMBNAILS_DIR = os.path.join(PLOTS_DIR, ".thumbnails")
 
 # Core files to protect
 CORE_FILES = [
@@ -56,6 +66,11 @@
     os.path.join(os.path.dirname(__file__), 'habit_display.py'),
     os.path.join(os.path.dirname(__file__), 'gui.py'),
     os.path.join(os.path.dirname(__file__), 'habit_visualization.py'),
+    os.path.join(os.path.dirname(__file__), 'habit_plots.py'),
+    os.path.join(os.path.dirname(__file__), 'habit_export.py'),
+    os.path.join(os.path.dirname(__file__), 'habit_workers.py'),
+    os.path.join(os.path.dirname(__file__), 'habit_metrics.py'),
+    os.path.join(os.path.dirname(__file__), 'habit_tasks.py'),
     os.path.join(os.path.dirname(os.path.dirname(__file__)), 'main.py'),
     os.path.join(os.path.dirname(os.path.dirname(__file__)), 'README.md'),
     os.path.join(os.path.dirname(os.path.dirname(__file__)), 'LICENSE')
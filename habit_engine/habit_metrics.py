@@ -0,0 +1,91 @@
+# Lightweight in-process performance metrics.
+# Timings and counters are recorded by name from any thread and summarized on
+# demand (count, last, average, max), so the GUI can report main-thread stalls,
+# render times and similar without a profiler attached.
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+_lock = threading.Lock()
+_samples = {}   # name -> [count, total, last, maximum]
+_counters = {}  # name -> int
+
+def record(name, value):
+    """Record one sample (e.g. a duration in ms) under name."""
+    with _lock:
+        stats = _samples.get(name)
+        if stats is None:
+            _samples[name] = [1, value, value, value]
+        else:
+            stats[0] += 1
+            stats[1] += value
+            stats[2] = value
+            stats[3] = max(stats[3], value)
+
+def increment(name, amount=1):
+    """Add amount to a counter."""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+@contextmanager
+def timed(name):
+    """Record the duration of the with-block (or decorated function) in milliseconds under name."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, (time.perf_counter() - start) * 1000)
+
+def summary(name):
+    """Return {'count', 'last', 'avg', 'max'} for name, or None if nothing was recorded."""
+    with _lock:
+        stats = _samples.get(name)
+        if stats is None:
+            return None
+        count, total, last, maximum = stats
+    return {"count": count, "last": last, "avg": total / count, "max": maximum}
+
+def snapshot():
+    """Return ({name: summary}, {counter: value}) for everything recorded so far."""
+    with _lock:
+        names = list(_samples)
+        counters = dict(_counters)
+    return {name: summary(name) for name in names}, counters
+
+def process_rss_bytes():
+    """Resident memory of this process in bytes, or None if it cannot be read here."""
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                            ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                            ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            if ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(),
+                                                        ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+            return None
+        # macOS and other Unixes: peak rather than current RSS (bytes on macOS, KiB elsewhere)
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except Exception:
+        return None
+
+def reset():
+    with _lock:
+        _samples.clear()
+        _counters.clear()
@@ -0,0 +1,344 @@
+# Keeps an index of the generated plot files in PLOTS_DIR.
+# The index is the source of truth for which plots exist and what they show
+# (habit, date range, chart style, creation time, size, data hash), so the GUI
+# never has to list the directory or parse habit names out of filenames.
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+from colorama import Fore, Style
+
+from habit_engine.habit_io import PLOTS_DIR, PLOTS_INDEX_FILE, THUMBNAILS_DIR, save_with_backup, try_load_json
+
+PLOT_PREFIX = "habit_streak_"
+
+# File types written by the render profiles
+PLOT_EXTENSIONS = (".png", ".webp", ".svg")
+
+# Multi-habit dashboards are indexed under a pseudo habit name
+DASHBOARD_PREFIX = "habit_dashboard_"
+DASHBOARD_HABIT = "All Habits"
+INDEX_VERSION = 1
+
+# Bounding box of the previews shown in the Existing Plots dialog
+THUMBNAIL_SIZE = (160, 80)
+
+# In-memory copy of the index, reloaded only when the file on disk changes
+_index_lock = threading.RLock()
+_index_cache = None
+_index_mtime = None
+
+def _empty_index():
+    return {"version": INDEX_VERSION, "plots": {}}
+
+def _load_index():
+    """Return the cached index, reloading it if the file changed or disappeared."""
+    global _index_cache, _index_mtime
+    try:
+        mtime = os.stat(PLOTS_INDEX_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if _index_cache is None or mtime != _index_mtime:
+        data = try_load_json(PLOTS_INDEX_FILE, PLOTS_INDEX_FILE + '.bak') if mtime is not None else None
+        if not (isinstance(data, dict) and isinstance(data.get("plots"), dict)):
+            data = _empty_index()
+        _index_cache = data
+        _index_mtime = mtime
+    return _index_cache
+
+def _save_index(index):
+    """Write the index to disk and remember the new mtime."""
+    global _index_mtime
+    os.makedirs(PLOTS_DIR, exist_ok=True)
+    if save_with_backup(PLOTS_INDEX_FILE, index):
+        try:
+            _index_mtime = os.stat(PLOTS_INDEX_FILE).st_mtime_ns
+        except OSError:
+            _index_mtime = None
+        return True
+    return False
+
+def compute_data_hash(logs, habit_name, date_range):
+    """Stable hash of the logs a plot was drawn from: those of habit_name (all habits if None) within date_range."""
+    from habit_engine.habit_visualization import get_log_index  # Imports this module
+    index = get_log_index(logs)
+    habits = index.habits() if habit_name is None else [habit_name]
+    habit_logs = sorted(log for habit in habits for log in index.logs_for(habit, date_range))
+    payload = json.dumps([habit_name, date_range, habit_logs], separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+def register_plot(filepath, habit_name, date_range=None, chart_style=None, data_hash=None):
+    """Add (or replace) the index entry for a plot file that was just written."""
+    try:
+        stat_result = os.stat(filepath)
+        entry = {
+            "habit": habit_name,
+            "date_range": date_range,
+            "chart_style": chart_style,
+            "created_at": datetime.fromtimestamp(stat_result.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
+            "size": stat_result.st_size,
+            "data_hash": data_hash
+        }
+        with _index_lock:
+            index = _load_index()
+            index["plots"][os.path.basename(filepath)] = entry
+            _save_index(index)
+        return entry
+    except Exception as e:
+        print(f"{Fore.LIGHTRED_EX}Error registering plot: {e}{Style.RESET_ALL}")
+        return None
+
+def unregister_plot(filename):
+    """Drop a plot's index entry without touching the file."""
+    with _index_lock:
+        index = _load_index()
+        if index["plots"].pop(filename, None) is not None:
+            _save_index(index)
+
+def delete_plot_file(filename):
+    """Delete a plot file and its index entry. Returns the number of bytes freed."""
+    filepath = os.path.join(PLOTS_DIR, os.path.basename(filename))
+    freed = 0
+    try:
+        if os.path.exists(filepath):
+            freed = os.path.getsize(filepath)
+            os.remove(filepath)
+    finally:
+        unregister_plot(os.path.basename(filename))
+        remove_thumbnail(filename)
+    return freed
+
+def list_plots(habit_name=None):
+    """Return [(filename, entry), ...] for indexed plots, most recent first."""
+    with _index_lock:
+        items = list(_load_index()["plots"].items())
+    if habit_name is not None:
+        items = [item for item in items if item[1].get("habit") == habit_name]
+    items.sort(key=lambda item: (item[1].get("created_at") or "", item[0]), reverse=True)
+    return items
+
+def get_plot_entry(filename):
+    """Return the index entry for filename, or None."""
+    with _index_lock:
+        return _load_index()["plots"].get(os.path.basename(filename))
+
+def has_plots():
+    """True if at least one plot is indexed."""
+    with _index_lock:
+        return bool(_load_index()["plots"])
+
+def _parse_legacy_filename(filename):
+    """
+    Best-effort metadata for a plot that is not in the index, using the
+    habit_streak_<name>_<YYYYMMDD>_<HHMMSS>.<ext> naming scheme.
+    """
+    stem = os.path.splitext(filename)[0]
+    if filename.startswith(DASHBOARD_PREFIX):
+        try:
+            created = datetime.strptime(stem[len(DASHBOARD_PREFIX):], "%Y%m%d_%H%M%S")
+            return DASHBOARD_HABIT, created.strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            return DASHBOARD_HABIT, None
+
+    parts = stem[len(PLOT_PREFIX):].split('_')
+    if len(parts) >= 3:
+        try:
+            created = datetime.strptime(f"{parts[-2]}_{parts[-1]}", "%Y%m%d_%H%M%S")
+            return '_'.join(parts[:-2]), created.strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            pass
+    return stem[len(PLOT_PREFIX):], None
+
+def repair_plot_index():
+    """
+    Reconcile the index with PLOTS_DIR: index plot files that were added by
+    hand and drop entries whose files are gone. Returns (added, removed).
+    """
+    added = removed = 0
+    try:
+        os.makedirs(PLOTS_DIR, exist_ok=True)
+        on_disk = {
+            entry.name: entry for entry in os.scandir(PLOTS_DIR)
+            if entry.is_file() and entry.name.startswith((PLOT_PREFIX, DASHBOARD_PREFIX)) and entry.name.endswith(PLOT_EXTENSIONS)
+        }
+        with _index_lock:
+            index = _load_index()
+            plots = index["plots"]
+
+            for filename in [name for name in plots if name not in on_disk]:
+                del plots[filename]
+                removed += 1
+
+            for filename, dir_entry in on_disk.items():
+                if filename in plots:
+                    continue
+                habit_name, created_at = _parse_legacy_filename(filename)
+                stat_result = dir_entry.stat()
+                plots[filename] = {
+                    "habit": habit_name,
+                    "date_range": None,
+                    "chart_style": None,
+                    "created_at": created_at or datetime.fromtimestamp(stat_result.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
+                    "size": stat_result.st_size,
+                    "data_hash": None
+                }
+                added += 1
+
+            if added or removed or not os.path.exists(PLOTS_INDEX_FILE):
+                _save_index(index)
+    except Exception as e:
+        print(f"{Fore.LIGHTRED_EX}Error repairing plot index: {e}{Style.RESET_ALL}")
+    return added, removed
+
+def _thumbnail_format():
+    """WebP when Pillow was built with it, PNG otherwise."""
+    from PIL import features
+    return ("WEBP", ".webp") if features.check("webp") else ("PNG", ".png")
+
+def thumbnail_path(filename):
+    """Where the thumbnail for a plot file lives (it may not exist yet)."""
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    return os.path.join(THUMBNAILS_DIR, stem + _thumbnail_format()[1])
+
+def get_thumbnail(filename, size=THUMBNAIL_SIZE):
+    """
+    Return the path of an up-to-date thumbnail for a plot, creating it if it is
+    missing or older than the plot. Safe to call from a worker thread.
+    Returns None if the plot cannot be read.
+    """
+    from PIL import Image
+
+    plot_path = os.path.join(PLOTS_DIR, os.path.basename(filename))
+    thumb_path = thumbnail_path(filename)
+    if plot_path.endswith(".svg"):
+        return None  # Vector plots have no raster preview
+    try:
+        plot_mtime = os.stat(plot_path).st_mtime
+        try:
+            if os.stat(thumb_path).st_mtime >= plot_mtime:
+                return thumb_path
+        except OSError:
+            pass  # No thumbnail yet
+
+        os.makedirs(THUMBNAILS_DIR, exist_ok=True)
+        with Image.open(plot_path) as img:
+            # draft() lets JPEG decoders skip detail; reduce() is a cheap integer
+            # downscale before the final filtered thumbnail() pass
+            img.draft("RGB", (size[0] * 2, size[1] * 2))
+            factor = max(1, min(img.width // (size[0] * 2), img.height // (size[1] * 2)))
+            small = img.reduce(factor) if factor > 1 else img.copy()
+        small.thumbnail(size)
+
+        image_format, _ = _thumbnail_format()
+        temp_path = thumb_path + ".tmp"
+        small.save(temp_path, format=image_format)
+        os.replace(temp_path, thumb_path)
+        return thumb_path
+    except Exception as e:
+        print(f"{Fore.LIGHTRED_EX}Error creating thumbnail for {filename}: {e}{Style.RESET_ALL}")
+        return None
+
+def fit_within(size, bounds):
+    """Largest size with size's aspect ratio that fits in bounds (never larger than size)."""
+    ratio = min(1.0, bounds[0] / size[0], bounds[1] / size[1])
+    return max(1, int(size[0] * ratio)), max(1, int(size[1] * ratio))
+
+def load_plot_image(filepath, max_size):
+    """
+    Decode a plot image scaled down to fit within max_size, for display.
+    Slow for large 300-DPI exports, so call it from a worker thread.
+    """
+    from PIL import Image
+
+    with Image.open(filepath) as img:
+        target = fit_within(img.size, max_size)
+        # Same fast path as thumbnails: draft() for decoders that support it,
+        # then an integer reduce() so the filtered resize works on a small image
+        img.draft("RGB", target)
+        factor = max(1, min(img.width // target[0], img.height // target[1]))
+        small = img.reduce(factor) if factor > 1 else img.copy()
+    if small.size != target:
+        small = small.resize(target, Image.LANCZOS)
+    return small
+
+def remove_thumbnail(filename):
+    """Delete a plot's cached thumbnail, if any."""
+    try:
+        os.remove(thumbnail_path(filename))
+    except OSError:
+        pass
+
+def apply_retention_policy(keep_per_habit=0, max_total_mb=0, max_age_days=0, protect=()):
+    """
+    Delete old plots according to the retention limits (0 disables a limit):
+    plots older than max_age_days, all but the newest keep_per_habit plots of
+    each habit, then the oldest plots until the directory is under max_total_mb.
+    Works from the index sizes and dates, so no file is stat'ed.
+    Filenames in protect are never deleted. Returns (deleted_count, freed_bytes).
+    """
+    deleted = freed = 0
+    protect = {os.path.basename(name) for name in protect}
+    try:
+        with _index_lock:
+            index = _load_index()
+            plots = index["plots"]
+            newest_first = sorted(plots.items(), key=lambda item: (item[1].get("created_at") or "", item[0]), reverse=True)
+            doomed = set()
+
+            if max_age_days > 0:
+                cutoff = (datetime.now() - timedelta(days=max_age_days)).strftime("%Y-%m-%d %H:%M:%S")
+                doomed.update(name for name, entry in newest_first if (entry.get("created_at") or "") < cutoff)
+
+            if keep_per_habit > 0:
+                seen = {}
+                for name, entry in newest_first:
+                    habit = entry.get("habit")
+                    seen[habit] = seen.get(habit, 0) + 1
+                    if seen[habit] > keep_per_habit:
+                        doomed.add(name)
+
+            if max_total_mb > 0:
+                max_bytes = int(max_total_mb * 1024 * 1024)
+                total = sum(entry.get("size") or 0 for name, entry in newest_first if name not in doomed)
+                for name, entry in reversed(newest_first):
+                    if total <= max_bytes:
+                        break
+                    if name not in doomed and name not in protect:
+                        doomed.add(name)
+                        total -= entry.get("size") or 0
+
+            doomed -= protect
+            for name in doomed:
+                try:
+                    os.remove(os.path.join(PLOTS_DIR, name))
+                    freed += plots[name].get("size") or 0
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"{Fore.LIGHTRED_EX}Error deleting plot {name}: {e}{Style.RESET_ALL}")
+                    continue
+                del plots[name]
+                remove_thumbnail(name)
+                deleted += 1
+
+            if deleted:
+                _save_index(index)
+    except Exception as e:
+        print(f"{Fore.LIGHTRED_EX}Error applying plot retention policy: {e}{Style.RESET_ALL}")
+
+    if deleted:
+        print(f"{Fore.LIGHTYELLOW_EX}Plot retention: deleted {deleted} plot(s), reclaimed {freed / (1024 * 1024):.1f} MB{Style.RESET_ALL}")
+    return deleted, freed
+
+def apply_retention_settings(settings, protect=()):
+    """Run apply_retention_policy with the limits stored in settings."""
+    return apply_retention_policy(
+        keep_per_habit=int(settings.get("plot_retention_keep_per_habit", 0) or 0),
+        max_total_mb=float(settings.get("plot_retention_max_mb", 0) or 0),
+        max_age_days=int(settings.get("plot_retention_max_age_days", 0) or 0),
+        protect=protect
+    )
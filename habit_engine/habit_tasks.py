@@ -0,0 +1,176 @@
+# Runs the GUI's background work on a small, bounded set of threads.
+# Tasks are queued by priority lane (interactive before background before
+# speculative), tagged with a group so a whole group can be cancelled (e.g.
+# on a view switch), and report completion through callbacks that are
+# dispatched to the Tk main thread. CPU-bound chart renders go to the
+# executor's RenderPool worker process.
+
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from colorama import Fore, Style
+
+from habit_engine import habit_metrics
+from habit_engine.habit_workers import RenderPool
+
+# Priority lanes, highest first
+LANES = ["interactive", "background", "speculative"]
+
+_current = threading.local()
+
+def current_task():
+    """The Task running on the calling worker thread (None elsewhere)"""
+    return getattr(_current, "task", None)
+
+class Task:
+    """
+    One unit of background work. future is a concurrent.futures.Future for the
+    result; cancel() drops the task if it has not started yet and suppresses its
+    callbacks, while a running task can stop early by checking `cancelled`.
+    """
+
+    def __init__(self, fn, args, name, lane, group, on_done, on_error):
+        self.fn = fn
+        self.args = args
+        self.name = name
+        self.lane = lane
+        self.group = group
+        self.on_done = on_done
+        self.on_error = on_error
+        self.future = Future()
+        self.submitted_at = time.perf_counter()
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+        self.future.cancel()
+
+    @property
+    def state(self):
+        if self.cancelled:
+            return "cancelled"
+        if self.future.running():
+            return "running"
+        return "done" if self.future.done() else "queued"
+
+class TaskExecutor:
+    """
+    Bounded thread pool with priority lanes plus the RenderPool process pool.
+
+    dispatch(callback) must run callback on the Tk main thread, e.g.
+    lambda cb: window.after(0, cb); on_done(result) and on_error(exception)
+    are called through it, and only if the task was not cancelled.
+    """
+
+    def __init__(self, dispatch, max_threads=3, process_pool=None):
+        self.dispatch = dispatch
+        self.max_threads = max_threads
+        self.process_pool = process_pool or RenderPool()
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._threads = []
+        self._tasks = set()  # Queued or running
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, fn, *args, name=None, lane="interactive", group=None, on_done=None, on_error=None):
+        """Queue fn(*args) on the thread pool and return its Task"""
+        task = Task(fn, args, name or getattr(fn, "__name__", "task"), lane, group, on_done, on_error)
+        with self._lock:
+            if self._closed:
+                task.cancel()
+                return task
+            self._tasks.add(task)
+            if len(self._threads) < self.max_threads and self._queue.qsize() >= self._idle_threads():
+                thread = threading.Thread(target=self._work, name=f"habit-task-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        habit_metrics.increment("tasks.submitted")
+        self._queue.put((LANES.index(lane), next(self._seq), task))
+        return task
+
+    def _idle_threads(self):
+        return len(self._threads) - sum(1 for task in self._tasks if task.future.running())
+
+    def cancel_group(self, group):
+        """Cancel every queued or running task submitted with group"""
+        with self._lock:
+            tasks = [task for task in self._tasks if task.group == group]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            habit_metrics.increment("tasks.cancelled", len(tasks))
+
+    def pending(self):
+        """[(name, lane, state), ...] for queued and running tasks"""
+        with self._lock:
+            tasks = sorted(self._tasks, key=lambda task: (LANES.index(task.lane), task.submitted_at))
+        return [(task.name, task.lane, task.state) for task in tasks]
+
+    def _work(self):
+        while True:
+            _, _, task = self._queue.get()
+            if task is None:
+                return
+            if not task.future.set_running_or_notify_cancel():
+                self._finish(task)
+                continue
+            started = time.perf_counter()
+            habit_metrics.record(f"tasks.{task.lane}.wait_ms", (started - task.submitted_at) * 1000)
+            _current.task = task
+            try:
+                task.future.set_result(task.fn(*task.args))
+            except BaseException as e:
+                task.future.set_exception(e)
+            finally:
+                _current.task = None
+            habit_metrics.record(f"tasks.{task.name}.run_ms", (time.perf_counter() - started) * 1000)
+            self._finish(task)
+
+    def _finish(self, task):
+        with self._lock:
+            self._tasks.discard(task)
+        if task.cancelled:
+            return
+        try:
+            self.dispatch(lambda: self._deliver(task))
+        except Exception:
+            pass  # Main loop already gone
+
+    def _deliver(self, task):
+        """Run the task's callbacks on the main thread"""
+        if task.cancelled:
+            return
+        error = task.future.exception()
+        try:
+            if error is None:
+                habit_metrics.increment("tasks.completed")
+                if task.on_done is not None:
+                    task.on_done(task.future.result())
+            else:
+                habit_metrics.increment("tasks.failed")
+                if task.on_error is not None:
+                    task.on_error(error)
+                else:
+                    print(f"{Fore.LIGHTRED_EX}Error in background task '{task.name}': {error}{Style.RESET_ALL}")
+        except Exception as e:
+            print(f"{Fore.LIGHTRED_EX}Error handling result of '{task.name}': {e}{Style.RESET_ALL}")
+
+    def shutdown(self):
+        """Cancel queued work, let the threads exit and stop the render worker"""
+        with self._lock:
+            self._closed = True
+            tasks = list(self._tasks)
+            threads = len(self._threads)
+        for task in tasks:
+            task.cancel()
+        for _ in range(threads):
+            self._queue.put((len(LANES), next(self._seq), None))
+        self.process_pool.shutdown()
@@ -5,26 +5,31 @@
 # 3. Allow for future expansion of visualization features
 
 from habit_engine.habit_io import PLOTS_DIR
+from habit_engine.habit_plots import register_plot, compute_data_hash, DASHBOARD_PREFIX, DASHBOARD_HABIT
 import matplotlib
 matplotlib.use('Agg')  # Force Agg backend for thread safety
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import ListedColormap
+from matplotlib.patches import Patch
+import numpy as np
 from datetime import datetime, timedelta
 import threading
 import os
-import warnings
 from colorama import Fore, Style
 import sys
 from collections import OrderedDict
 import time
-import logging
+import re
+import json
+import hashlib
+from bisect import bisect_left, bisect_right
+from matplotlib import font_manager
+from matplotlib.font_manager import FontProperties
+from matplotlib.ft2font import FT2Font
 
-# Suppress findfont warnings from matplotlib.font_manager
-# This sets the logging level for this specific component to ERROR,
-# meaning only messages of level ERROR or higher will be shown.
-logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
-
-# List of fonts that typically support emojis, in order of preference
-# Matplotlib will try to find and use the first available font from this list.
+# List of fonts that typically support emojis, in order of preference.
+# The first installed one that has the streak glyph is resolved once and cached.
 EMOJI_FONTS = [
     'Segoe UI Emoji',    # Windows
     'Apple Color Emoji',  # macOS
@@ -33,39 +38,184 @@
     'sans-serif'          # Generic fallback
 ]
 
+# Streak annotation markers, in order of preference; the second is used when
+# no installed emoji font has the first, so no glyph-missing warnings occur
+STREAK_MARKERS = ["🔥", "★"]
+
+# Ranges longer than these many days are plotted as weekly / monthly completion
+# rates instead of one point per day, so render time and file size stay flat
+# as history grows.
+WEEKLY_AGGREGATION_THRESHOLD = 90
+MONTHLY_AGGREGATION_THRESHOLD = 730
+
+# Upper bound on x-axis tick labels, whatever the number of plotted points
+MAX_XTICKS = 12
+
+# DPI used for in-memory (on-screen) renders; file exports use 300 DPI
+SCREEN_DPI = 100
+
+# Named output settings for saved charts. "bbox_tight" trims the margins but
+# costs an extra draw pass; "pil_kwargs" go to the Pillow encoder.
+RENDER_PROFILES = OrderedDict([
+    ("Print", {"figsize": (12, 6), "dpi": 300, "format": "png", "bbox_tight": True,
+               "pil_kwargs": {"compress_level": 6}}),
+    ("Screen", {"figsize": (12, 6), "dpi": 100, "format": "png", "bbox_tight": False,
+                "pil_kwargs": {"compress_level": 1}}),
+    ("Thumbnail", {"figsize": (6, 3), "dpi": 60, "format": "webp", "bbox_tight": False,
+                   "pil_kwargs": {"quality": 80, "method": 4}}),
+    ("Vector", {"figsize": (12, 6), "dpi": 72, "format": "svg", "bbox_tight": True,
+                "pil_kwargs": None}),
+])
+DEFAULT_RENDER_PROFILE = "Print"
+
+# Chart styles offered by visualize_habit_streak and the settings window
+CHART_STYLES = ["Line Plot", "Bar Chart", "Calendar Heatmap"]
+
+# Date ranges offered for charts
+DATE_RANGES = ["Last 7 Days", "Last 30 Days", "All Time"]
+
+# Missed / completed cell colors for the Calendar Heatmap style
+HEATMAP_COLORS = ['#ebedf0', '#30a14e']
+
 # Add thread lock for matplotlib operations
 plt_lock = threading.Lock()
 
-# Ignore matplotlib warnings
-warnings.filterwarnings('ignore', category=UserWarning, module='matplotlib')
-
 # --- Date range filtering logic ---
+# Date ranges are strings so they can live in settings.json and the plot index:
+# "All Time", "Last N Days", or a custom "YYYY-MM-DD..YYYY-MM-DD" where either
+# side may be left open ("2025-01-01.." or "..2025-03-31").
+CUSTOM_RANGE_SEPARATOR = ".."
+_LAST_DAYS_PATTERN = re.compile(r'^Last (\d+) Days?$')
+_ISO_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+def _is_iso_date(date_str):
+    """True for a real YYYY-MM-DD calendar date (2025-02-30 is rejected)"""
+    if not _ISO_DATE_PATTERN.match(date_str):
+        return False
+    try:
+        datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return True
+
+def format_custom_range(start_date=None, end_date=None):
+    """Build a custom date range string from 'YYYY-MM-DD' dates (None = open end)."""
+    return f"{start_date or ''}{CUSTOM_RANGE_SEPARATOR}{end_date or ''}"
+
+def resolve_date_range(date_range_str):
+    """
+    Turn a date range string into inclusive (start, end) 'YYYY-MM-DD' strings;
+    None means unbounded on that side. Raises ValueError for unknown ranges
+    and for ranges that end before they start (an open end means today).
+    """
+    if not date_range_str or date_range_str == "All Time":
+        return None, None
+
+    match = _LAST_DAYS_PATTERN.match(date_range_str)
+    if match:
+        today = datetime.now().date()
+        return (today - timedelta(days=int(match.group(1)) - 1)).isoformat(), today.isoformat()
+
+    if CUSTOM_RANGE_SEPARATOR in date_range_str:
+        start_str, end_str = (part.strip() or None for part in date_range_str.split(CUSTOM_RANGE_SEPARATOR, 1))
+        for value in (start_str, end_str):
+            if value is not None:
+                datetime.strptime(value, '%Y-%m-%d')  # Raises ValueError if malformed
+        if start_str and end_str and start_str > end_str:
+            raise ValueError(f"Start date {start_str} is after end date {end_str}")
+        if start_str and not end_str and start_str > datetime.now().date().isoformat():
+            raise ValueError(f"Start date {start_str} is in the future; give an end date too")
+        return start_str, end_str
+
+    raise ValueError(f"Unknown date range: {date_range_str}")
+
+def is_valid_date_range(date_range_str):
+    """True if resolve_date_range accepts date_range_str."""
+    try:
+        resolve_date_range(date_range_str)
+        return True
+    except ValueError:
+        return False
+
+class LogIndex:
+    """
+    Logs grouped per habit and sorted by date, with a parallel list of the
+    ISO date strings. ISO dates sort lexicographically, so a range filter is
+    two bisect calls and a slice, with no date parsing. Logs with malformed
+    dates are dropped (with a warning) when the index is built.
+    """
+
+    def __init__(self, logs):
+        by_habit = {}
+        self._valid_logs = []
+        self._date_groups = None
+        for log in logs:
+            # Ensure log has correct structure and date is valid
+            if not (isinstance(log, list) and len(log) >= 2 and isinstance(log[1], str)):
+                continue
+            if not _is_iso_date(log[1]):
+                print(f"{Fore.YELLOW}Warning: Skipping log with invalid date format: {log}{Style.RESET_ALL}")
+                continue
+            by_habit.setdefault(log[0], []).append(log)
+            self._valid_logs.append(log)
+
+        # Stable sort: for duplicate dates the later entry stays last and wins
+        self._logs = {habit: sorted(habit_logs, key=lambda log: log[1]) for habit, habit_logs in by_habit.items()}
+        self._dates = {habit: [log[1] for log in habit_logs] for habit, habit_logs in self._logs.items()}
+
+    def habits(self):
+        return list(self._logs)
+
+    def date_groups(self):
+        """
+        [(date, [log, ...]), ...] across all habits, newest date first. Within a
+        date the logs keep their order from the logs list. Built on first use.
+        """
+        if self._date_groups is None:
+            by_date = {}
+            for log in self._valid_logs:
+                by_date.setdefault(log[1], []).append(log)
+            self._date_groups = sorted(by_date.items(), key=lambda item: item[0], reverse=True)
+        return self._date_groups
+
+    def logs_for(self, habit_name, date_range="All Time"):
+        """Date-sorted logs of one habit within date_range."""
+        habit_logs = self._logs.get(habit_name)
+        if not habit_logs:
+            return []
+        start_str, end_str = resolve_date_range(date_range)
+        dates = self._dates[habit_name]
+        lo = bisect_left(dates, start_str) if start_str else 0
+        hi = bisect_right(dates, end_str) if end_str else len(dates)
+        return habit_logs[lo:hi]
+
+# The index of the most recently used logs list. The fingerprint catches the
+# GUI's usual edits (append, rebuild, replace today's entries); in-place
+# changes to a log's completion flag need no rebuild since the index holds
+# the same log lists.
+_log_index_cache = (None, None)
+_log_index_lock = threading.Lock()
+
+def _logs_fingerprint(logs):
+    return (id(logs), len(logs), id(logs[0]) if logs else None, id(logs[-1]) if logs else None)
+
+def get_log_index(logs):
+    """Return a LogIndex for logs, reusing the cached one when logs are unchanged."""
+    global _log_index_cache
+    fingerprint = _logs_fingerprint(logs)
+    with _log_index_lock:
+        cached_fingerprint, cached_index = _log_index_cache
+        if cached_fingerprint != fingerprint:
+            cached_index = LogIndex(logs)
+            _log_index_cache = (fingerprint, cached_index)
+        return cached_index
+
 def _filter_logs_by_date_range(logs, date_range_str):
-    """Filters logs based on the specified date range string."""
+    """Filters logs based on the specified date range string (date-sorted per habit)."""
+    index = get_log_index(logs)
     filtered = []
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) # Normalize today to start of day
-
-    start_date_filter = None
-    if date_range_str == "Last 7 Days":
-        start_date_filter = today - timedelta(days=6) # Includes today and previous 6 days
-    elif date_range_str == "Last 30 Days":
-        start_date_filter = today - timedelta(days=29) # Includes today and previous 29 days
-
-    for log in logs:
-        # Ensure log has correct structure and date is valid
-        if not (isinstance(log, list) and len(log) >= 2 and isinstance(log[1], str)):
-            continue
-        try:
-            log_date = datetime.strptime(log[1], '%Y-%m-%d').replace(hour=0, minute=0, second=0, microsecond=0)
-            if start_date_filter:
-                if log_date >= start_date_filter:
-                    filtered.append(log)
-            else: # "All Time" or no filter specified
-                filtered.append(log)
-        except ValueError:
-            # Skip logs with malformed dates
-            print(f"{Fore.YELLOW}Warning: Skipping log with invalid date format: {log}{Style.RESET_ALL}")
-            continue
+    for habit in index.habits():
+        filtered.extend(index.logs_for(habit, date_range_str))
     return filtered
 # --- End date range filtering logic ---
 
@@ -82,8 +232,461 @@ def loading_animation():
         except:
             break
 
-def visualize_habit_streak(logs, habit_name, chart_style="Line Plot", show_streak_annotations=True, date_range="All Time"):
-    """Create a visualization of the habit streak."""
+def _build_daily_series(filtered_habit_logs, date_range):
+    """Return (start_date, completion_values) with one 0/1 value per day of the plot range."""
+    today = np.datetime64(datetime.now().date(), 'D')
+    range_start, range_end = resolve_date_range(date_range)
+
+    if not filtered_habit_logs:
+        # If no logs in the selected range, create a blank chart for the range
+        # ("All Time" or an open start just shows today)
+        end_date = np.datetime64(range_end, 'D') if range_end else today
+        start_date = np.datetime64(range_start, 'D') if range_start else end_date
+        end_date = max(end_date, start_date)  # Never a negative span
+        return start_date, np.zeros(int((end_date - start_date).astype(int)) + 1, dtype=np.int8)
+
+    # Create a map for quick lookup of completion status (later entries win)
+    completion_map = {log[1]: log[2] for log in filtered_habit_logs}
+    logged_dates = np.array(list(completion_map.keys()), dtype='datetime64[D]')
+    logged_values = np.array([1 if done else 0 for done in completion_map.values()], dtype=np.int8)
+
+    # The plot's X-axis spans the selected range, or the logged days where it is open
+    start_date = np.datetime64(range_start, 'D') if range_start else logged_dates.min()
+    end_date = np.datetime64(range_end, 'D') if range_end else logged_dates.max()
+
+    # 1 for completed, 0 for missed/no entry
+    completion_values = np.zeros(int((end_date - start_date).astype(int)) + 1, dtype=np.int8)
+    completion_values[(logged_dates - start_date).astype(int)] = logged_values
+    return start_date, completion_values
+
+def _aggregate_series(start_date, completion_values):
+    """
+    Downsample a daily series for long ranges.
+    Returns (bucket_labels, values, granularity) where granularity is "daily",
+    "weekly" or "monthly" and values are completion rates for aggregated buckets.
+    """
+    num_days = len(completion_values)
+    days = start_date + np.arange(num_days)
+
+    if num_days <= WEEKLY_AGGREGATION_THRESHOLD:
+        return np.datetime_as_string(days, unit='D'), completion_values, "daily"
+
+    if num_days <= MONTHLY_AGGREGATION_THRESHOLD:
+        # Monday-aligned week numbers (1970-01-05 was a Monday)
+        bucket_keys = (days - np.datetime64('1970-01-05', 'D')).astype(int) // 7
+        granularity, label_unit = "weekly", 'D'
+    else:
+        bucket_keys = days.astype('datetime64[M]').astype(int)
+        granularity, label_unit = "monthly", 'M'
+
+    # Index of the first day of every bucket, then sum each bucket in one pass
+    bucket_starts = np.concatenate(([0], np.flatnonzero(np.diff(bucket_keys)) + 1))
+    bucket_sizes = np.diff(np.append(bucket_starts, num_days))
+    rates = np.add.reduceat(completion_values, bucket_starts) / bucket_sizes
+
+    return np.datetime_as_string(days[bucket_starts], unit=label_unit), rates, granularity
+
+def _tick_positions(num_points):
+    """Evenly spaced tick indices, never more than MAX_XTICKS of them."""
+    return np.unique(np.linspace(0, num_points - 1, num=min(num_points, MAX_XTICKS)).round().astype(int))
+
+def _draw_timeline(ax, habit_name, start_date, daily_values, chart_style, show_streak_annotations):
+    """Draw the Line Plot / Bar Chart styles onto ax."""
+    # Long ranges are plotted as weekly/monthly completion rates
+    date_labels, completion_values, granularity = _aggregate_series(start_date, daily_values)
+    is_aggregated = granularity != "daily"
+
+    # Use numerical indices for plotting, and set labels separately for both types
+    x_indices = np.arange(len(date_labels))
+    tick_positions = _tick_positions(len(date_labels))
+
+    if chart_style == "Bar Chart":
+        ax.bar(x_indices, completion_values, color='green', width=0.6, label='Completed')
+        # Adjust x-axis limits slightly for bar charts for better visual
+        ax.set_xlim(-0.5, len(date_labels) - 0.5)
+    else:
+        ax.plot(x_indices, completion_values, color='green',
+                   marker='o', linestyle='-', linewidth=2,
+                   markersize=4 if is_aggregated else 8, label='Completed')
+
+    # Bounded tick placement for both chart types
+    ax.set_xticks(tick_positions)
+    ax.set_xticklabels(date_labels[tick_positions], rotation=45, ha="right")
+
+    # Customize plot
+    if is_aggregated:
+        ax.set_title(f'Habit Tracking: {habit_name} ({granularity} completion rate)', pad=20, size=14)
+        ax.set_xlabel('Week Starting' if granularity == "weekly" else 'Month', size=12)
+        ax.set_ylabel('Completion Rate', size=12)
+        ax.set_ylim(0, 1.1)
+        ax.set_yticks([0, 0.25, 0.5, 0.75, 1])
+        ax.set_yticklabels(['0%', '25%', '50%', '75%', '100%'])
+    else:
+        ax.set_title(f'Habit Tracking: {habit_name}', pad=20, size=14)
+        ax.set_xlabel('Date', size=12)
+        ax.set_ylabel('Completion (0=Missed, 1=Completed)', size=12)
+
+        # Set y-axis ticks
+        ax.set_yticks([0, 1])
+        ax.set_yticklabels(['Missed', 'Completed'])
+
+    # Add grid
+    ax.grid(True, linestyle='--', alpha=0.7)
+
+    # Add streak annotations if enabled (daily granularity only, one per day would
+    # mean thousands of text artists for aggregated ranges)
+    if show_streak_annotations and not is_aggregated:
+        # Calculate daily streaks for annotations based on the plotted data
+        font_props, marker = get_annotation_font()
+        current_streak = 0
+        for i in range(len(date_labels)):
+            is_completed = (completion_values[i] == 1) # Directly use completion_values
+            if is_completed:
+                current_streak += 1
+            else:
+                current_streak = 0 # Streak breaks on a miss or missing entry
+
+            if current_streak > 0: # Only annotate non-zero streaks
+                # Get the y-position for the annotation
+                y_pos = completion_values[i]
+
+                # Adjust y_offset based on chart type for better visual placement
+                y_offset = 0.05 if chart_style == "Bar Chart" else 0.08
+
+                ax.text(
+                    i, # x-position (index in date_labels)
+                    y_pos + y_offset, # y-position above the point/bar
+                    f"{marker}{current_streak}",
+                    ha='center', # Horizontal alignment: center
+                    va='bottom', # Vertical alignment: bottom of text is at y_pos + y_offset
+                    color='orange',
+                    fontproperties=font_props
+                )
+
+# (FontProperties, marker) for streak annotations, resolved on first use
+_annotation_font = None
+_annotation_font_lock = threading.Lock()
+
+def _font_has_glyph(font_path, char):
+    try:
+        return FT2Font(font_path).get_char_index(ord(char)) != 0
+    except Exception:
+        return False
+
+def get_annotation_font():
+    """
+    Return the cached (FontProperties, marker) used for streak annotations.
+    The first EMOJI_FONTS entry that is installed and has a STREAK_MARKERS
+    glyph wins; fonts are looked up by name only, so findfont never warns.
+    """
+    global _annotation_font
+    with _annotation_font_lock:
+        if _annotation_font is None:
+            installed = {font.name: font.fname for font in font_manager.fontManager.ttflist}
+            candidates = [installed[name] for name in EMOJI_FONTS if name in installed]
+            candidates.append(font_manager.findfont(FontProperties(family=['sans-serif'])))
+
+            resolved = None
+            for marker in STREAK_MARKERS:
+                font_path = next((path for path in candidates if _font_has_glyph(path, marker)), None)
+                if font_path:
+                    resolved = (FontProperties(fname=font_path, weight='bold', size=15), marker)
+                    break
+            _annotation_font = resolved or (FontProperties(family=['sans-serif'], weight='bold', size=15), "")
+        return _annotation_font
+
+def warm_up_fonts():
+    """
+    Build matplotlib's font cache, resolve the annotation font and render a
+    throwaway figure so the first real chart does not pay for it.
+    Safe to run on a background thread. Returns the elapsed seconds.
+    """
+    start_time = time.perf_counter()
+    try:
+        font_props, marker = get_annotation_font()
+        fig = Figure(figsize=(2, 1), dpi=SCREEN_DPI)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        ax.plot([0, 1], [0, 1])
+        ax.set_title("Warm-up", fontsize=16, fontweight='bold')
+        ax.text(0.5, 0.5, f"{marker}1", fontproperties=font_props)
+        fig.canvas.draw()
+    except Exception as e:
+        print(f"{Fore.LIGHTRED_EX}Error warming up fonts: {e}{Style.RESET_ALL}")
+    return time.perf_counter() - start_time
+
+def _calendar_grid(start_date, daily_values):
+    """
+    Lay a daily series out as a 7 x weeks grid (rows Monday..Sunday).
+    Cells outside the plotted range are NaN. Returns (grid, first_monday).
+    """
+    weekday_offset = int((start_date - np.datetime64('1970-01-05', 'D')).astype(int) % 7)
+    num_weeks = -(-(weekday_offset + len(daily_values)) // 7)  # Ceiling division
+
+    cells = np.full(num_weeks * 7, np.nan)
+    cells[weekday_offset:weekday_offset + len(daily_values)] = daily_values
+    return cells.reshape(num_weeks, 7).T, start_date - weekday_offset
+
+def _draw_calendar_heatmap(ax, start_date, daily_values):
+    """Draw the Calendar Heatmap style as a single image artist."""
+    grid, first_monday = _calendar_grid(start_date, daily_values)
+    num_weeks = grid.shape[1]
+
+    cmap = ListedColormap(HEATMAP_COLORS).with_extremes(bad='white')
+    ax.imshow(np.ma.masked_invalid(grid), cmap=cmap, vmin=0, vmax=1,
+              aspect='equal' if num_weeks <= 53 else 'auto', interpolation='nearest')
+
+    # Month labels on the week columns where a new month starts
+    week_starts = first_monday + 7 * np.arange(num_weeks)
+    months = week_starts.astype('datetime64[M]')
+    month_columns = np.concatenate(([0], np.flatnonzero(np.diff(months.astype(int))) + 1))
+    month_columns = month_columns[_tick_positions(len(month_columns))]
+    ax.set_xticks(month_columns)
+    ax.set_xticklabels(np.datetime_as_string(months[month_columns], unit='M'), rotation=45, ha="right")
+
+    ax.set_yticks([0, 2, 4, 6])
+    ax.set_yticklabels(['Mon', 'Wed', 'Fri', 'Sun'])
+    ax.tick_params(length=0)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
+    ax.legend(
+        handles=[Patch(color=HEATMAP_COLORS[0], label='Missed'), Patch(color=HEATMAP_COLORS[1], label='Completed')],
+        loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=2, frameon=False
+    )
+
+def build_habit_figure(logs, habit_name, chart_style="Line Plot", show_streak_annotations=True,
+                       date_range="All Time", figsize=(12, 6), dpi=100):
+    """
+    Build the chart for one habit as a standalone Agg Figure (no pyplot state).
+    Returns None if there are no logs for the habit.
+    """
+    # Check the habit has logs at all, then apply the date range
+    index = get_log_index(logs)
+    if not index.logs_for(habit_name):
+        return None
+
+    # Create plot
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    _draw_habit_chart(fig, index.logs_for(habit_name, date_range), habit_name, chart_style,
+                      show_streak_annotations, date_range)
+    return fig
+
+def _draw_habit_chart(fig, filtered_habit_logs, habit_name, chart_style, show_streak_annotations, date_range):
+    """
+    Draw one habit's chart onto an empty figure from its date-sorted logs
+    within date_range. Returns (start_date, daily_values).
+    """
+    start_date, daily_values = _build_daily_series(filtered_habit_logs, date_range)
+    ax = fig.add_subplot()
+
+    if chart_style == "Calendar Heatmap":
+        _draw_calendar_heatmap(ax, start_date, daily_values)
+        ax.set_title(f'Habit Tracking: {habit_name}', pad=20, size=14)
+    else:
+        _draw_timeline(ax, habit_name, start_date, daily_values, chart_style,
+                       show_streak_annotations and bool(filtered_habit_logs))
+
+    # Adjust layout
+    fig.tight_layout()
+    return start_date, daily_values
+
+def _series_stats(daily_values):
+    """(completion_rate, current_streak, longest_streak) of a 0/1 daily series."""
+    if len(daily_values) == 0:
+        return 0.0, 0, 0
+    # Lengths of the runs of completed days
+    padded = np.concatenate(([0], daily_values.astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(padded))
+    runs = edges[1::2] - edges[0::2]
+    current = int(runs[-1]) if len(runs) and daily_values[-1] == 1 else 0
+    return float(daily_values.mean()), current, int(runs.max()) if len(runs) else 0
+
+def _build_habit_matrix(logs, habits, date_range, index=None):
+    """
+    Build one (habits x days) matrix for the whole log in a single pass.
+    Cells are 1.0 (completed), 0.0 (missed) or NaN (no entry).
+    An already built LogIndex can be passed instead of logs.
+    Returns (start_date, matrix).
+    """
+    today = np.datetime64(datetime.now().date(), 'D')
+    if index is None:
+        index = get_log_index(logs)
+    range_start, range_end = resolve_date_range(date_range)
+
+    # Later entries win, as in _build_daily_series
+    entries = {}
+    for row, habit in enumerate(habits):
+        for log in index.logs_for(habit, date_range):
+            entries[(row, log[1])] = 1.0 if log[2] else 0.0
+
+    if entries:
+        rows = np.fromiter((key[0] for key in entries), dtype=np.intp, count=len(entries))
+        dates = np.array([key[1] for key in entries], dtype='datetime64[D]')
+        values = np.fromiter(entries.values(), dtype=float, count=len(entries))
+        start_date = np.datetime64(range_start, 'D') if range_start else dates.min()
+        end_date = np.datetime64(range_end, 'D') if range_end else dates.max()
+    else:
+        end_date = np.datetime64(range_end, 'D') if range_end else today
+        start_date = np.datetime64(range_start, 'D') if range_start else end_date
+    end_date = max(end_date, start_date)  # Never a negative span
+
+    matrix = np.full((len(habits), int((end_date - start_date).astype(int)) + 1), np.nan)
+    if entries:
+        matrix[rows, (dates - start_date).astype(int)] = values
+    return start_date, matrix
+
+def build_dashboard_figure(logs, habits, date_range="All Time", figsize=None, dpi=100):
+    """
+    Build a single figure comparing all habits: a stacked habit x day heatmap
+    with each habit's completion rate beside it. Returns None if there are no habits.
+    """
+    if not habits:
+        return None
+
+    start_date, matrix = _build_habit_matrix(logs, habits, date_range)
+    num_habits, num_days = matrix.shape
+    if figsize is None:
+        figsize = (12, min(max(3, 1.5 + 0.3 * num_habits), 30))
+
+    fig = Figure(figsize=figsize, dpi=dpi, layout='constrained')
+    FigureCanvasAgg(fig)
+    grid_spec = fig.add_gridspec(1, 2, width_ratios=[5, 1])
+    ax = fig.add_subplot(grid_spec[0, 0])
+    rate_ax = fig.add_subplot(grid_spec[0, 1], sharey=ax)
+
+    cmap = ListedColormap(HEATMAP_COLORS).with_extremes(bad='white')
+    ax.imshow(np.ma.masked_invalid(matrix), cmap=cmap, vmin=0, vmax=1,
+              aspect='auto', interpolation='nearest')
+
+    ticks = _tick_positions(num_days)
+    ax.set_xticks(ticks)
+    ax.set_xticklabels(np.datetime_as_string(start_date + ticks, unit='D'), rotation=45, ha="right")
+    ax.set_yticks(np.arange(num_habits))
+    ax.set_yticklabels(habits)
+    ax.tick_params(length=0)
+    ax.set_title(f'Habit Dashboard ({date_range})', pad=20, size=14)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
+    # Completion rate over the days each habit has entries for
+    logged_days = np.sum(~np.isnan(matrix), axis=1)
+    rates = np.divide(np.nansum(matrix, axis=1), logged_days,
+                      out=np.zeros(num_habits), where=logged_days > 0)
+    rate_ax.barh(np.arange(num_habits), rates, color=HEATMAP_COLORS[1])
+    rate_ax.set_xlim(0, 1)
+    rate_ax.set_xticks([0, 0.5, 1])
+    rate_ax.set_xticklabels(['0%', '50%', '100%'])
+    rate_ax.set_title('Completion', pad=20, size=12)
+    rate_ax.tick_params(axis='y', left=False, labelleft=False)
+    rate_ax.grid(True, axis='x', linestyle='--', alpha=0.7)
+
+    fig.legend(
+        handles=[Patch(color=HEATMAP_COLORS[0], label='Missed'), Patch(color=HEATMAP_COLORS[1], label='Completed'),
+                 Patch(facecolor='white', edgecolor='gray', label='No entry')],
+        loc='outside lower center', ncol=3, frameon=False
+    )
+    return fig
+
+class RenderCache:
+    """
+    Small thread-safe LRU of rendered RGBA buffers. Keys include a hash of
+    the logs the chart was drawn from, so edits to the data are never served
+    stale; they simply miss and the old entry ages out.
+    """
+
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            rgba = self._entries.get(key)
+            if rgba is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return rgba
+
+    def put(self, key, rgba):
+        rgba.setflags(write=False)  # Shared between callers, so keep it read-only
+        with self._lock:
+            self._entries[key] = rgba
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+# In-memory charts, filled by the stats view's Visualize and its pre-renders
+render_cache = RenderCache()
+
+def render_cache_key(logs, habit_name, chart_style, show_streak_annotations, date_range, size_px):
+    """Cache key for an in-memory chart: the chart options plus a hash of the logs in range."""
+    range_logs = get_log_index(logs).logs_for(habit_name, date_range)
+    payload = json.dumps([str(log[1]) + ('1' if log[2] else '0') for log in range_logs], separators=(",", ":"))
+    # Resolved dates make "Last N Days" keys roll over at midnight
+    return (habit_name, chart_style, bool(show_streak_annotations), resolve_date_range(date_range),
+            tuple(size_px or (1200, 600)), hashlib.sha1(payload.encode("utf-8")).hexdigest())
+
+def figure_to_rgba(fig):
+    """Rasterize a figure with Agg and return its pixels as a (height, width, 4) uint8 array."""
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+def get_render_profile(name):
+    """Return the named render profile, falling back to DEFAULT_RENDER_PROFILE."""
+    return RENDER_PROFILES.get(name) or RENDER_PROFILES[DEFAULT_RENDER_PROFILE]
+
+def save_figure(fig, filepath_stem, profile):
+    """Encode a figure with a render profile. Returns the written path (stem + extension)."""
+    image_format = profile["format"]
+    pil_kwargs = profile.get("pil_kwargs")
+    if image_format == "webp":
+        from PIL import features
+        if not features.check("webp"):
+            image_format, pil_kwargs = "png", None  # Pillow built without WebP
+    filepath = f'{filepath_stem}.{image_format}'
+    save_kwargs = {"dpi": profile["dpi"], "format": image_format}
+    if profile["bbox_tight"]:
+        save_kwargs["bbox_inches"] = 'tight'
+    if pil_kwargs:
+        save_kwargs["pil_kwargs"] = pil_kwargs
+    fig.savefig(filepath, **save_kwargs)
+    return filepath
+
+def register_rendered_plot(filepath, logs, habit_name, chart_style, date_range):
+    """Add a chart written by visualize_habit_streak to the plot index."""
+    return register_plot(filepath, habit_name, date_range, chart_style,
+                         compute_data_hash(logs, habit_name, date_range))
+
+def visualize_habit_streak(logs, habit_name, chart_style="Line Plot", show_streak_annotations=True, date_range="All Time",
+                           output="file", size_px=None, profile=DEFAULT_RENDER_PROFILE, register=True):
+    """
+    Create a visualization of the habit streak.
+
+    output="file" saves the chart in PLOTS_DIR using the named render profile
+    (see RENDER_PROFILES) and returns its path. With register=False the file
+    is not added to the plot index (render worker processes leave that to the
+    GUI process, see register_rendered_plot).
+    output="rgba" writes nothing to disk: the chart is rasterized at size_px
+    (width, height) and returned as an RGBA array for direct display.
+    """
     try:
         # Configure matplotlib backend with error handling
         try:
@@ -98,149 +701,276 @@ def visualize_habit_streak(logs, habit_name, chart_style="Line Plot", show_strea
 
         # Use thread lock for matplotlib operations
         with plt_lock:
-            plt.close('all')  # Clean up any existing plots
-            
-            # Filter logs for the specific habit
-            habit_logs_for_name = [log for log in logs if log[0] == habit_name]
-            if not habit_logs_for_name:
+            if output == "rgba":
+                # Checked under the lock so a click that waited on a pre-render of
+                # the same chart gets that result instead of drawing it again
+                cache_key = render_cache_key(logs, habit_name, chart_style, show_streak_annotations, date_range, size_px)
+                rgba = render_cache.get(cache_key)
+                if rgba is not None:
+                    return rgba
+
+                width, height = size_px or (1200, 600)
+                fig = build_habit_figure(logs, habit_name, chart_style, show_streak_annotations, date_range,
+                                         figsize=(width / SCREEN_DPI, height / SCREEN_DPI), dpi=SCREEN_DPI)
+                if fig is None:
+                    return None
+                rgba = figure_to_rgba(fig)
+                render_cache.put(cache_key, rgba)
+                return rgba
+
+            render_profile = get_render_profile(profile)
+            fig = build_habit_figure(logs, habit_name, chart_style, show_streak_annotations, date_range,
+                                     figsize=render_profile["figsize"])
+            if fig is None:
                 return None
 
-            # Apply date range filtering from settings
-            filtered_habit_logs = _filter_logs_by_date_range(habit_logs_for_name, date_range)
-            
-            # Sort filtered logs by date
-            filtered_habit_logs = sorted(filtered_habit_logs, key=lambda x: x[1])
-
-            if not filtered_habit_logs:
-                # If no logs in the selected range, create a blank chart for the range
-                today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-                if date_range == "Last 7 Days":
-                    start_date_for_display = today - timedelta(days=6)
-                elif date_range == "Last 30 Days":
-                    start_date_for_display = today - timedelta(days=29)
-                else: # "All Time" or default, just show today if no data
-                    start_date_for_display = today
-
-                date_range_list = []
-                current_display_date = start_date_for_display
-                # Generate dates until today or the defined range end
-                while current_display_date <= today:
-                    if date_range == "Last 7 Days" and (today - current_display_date).days > 6:
-                        break
-                    if date_range == "Last 30 Days" and (today - current_display_date).days > 29:
-                        break
-                    date_range_list.append(current_display_date.strftime('%Y-%m-%d'))
-                    current_display_date += timedelta(days=1)
-
-                if not date_range_list: # Ensure at least today is shown if no data
-                    date_range_list = [today.strftime('%Y-%m-%d')]
-
-                date_range_str = date_range_list
-                completion_values = [0] * len(date_range_str) # All zeros if no data
-            else:
-                # Determine the full date range for the x-axis based on filtered data
-                all_plot_dates = sorted(set(log[1] for log in filtered_habit_logs))
-                
-                # Determine the start and end date for the plot's X-axis
-                plot_start_date = datetime.strptime(all_plot_dates[0], '%Y-%m-%d')
-                plot_end_date = datetime.strptime(all_plot_dates[-1], '%Y-%m-%d')
-                
-                # Ensure the plot extends to today if the range selected is for last N days
-                today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-                if date_range in ["Last 7 Days", "Last 30 Days"]:
-                    plot_end_date = max(plot_end_date, today)
-                
-                # Generate all dates within the determined plot range
-                date_range_str = [(plot_start_date + timedelta(days=x)).strftime('%Y-%m-%d')
-                                 for x in range((plot_end_date - plot_start_date).days + 1)]
-                
-                # Create a map for quick lookup of completion status
-                completion_map = {log[1]: log[2] for log in filtered_habit_logs}
-                
-                # Populate completion_values for the full date_range_str
-                completion_values = []
-                for date in date_range_str:
-                    completion_values.append(1 if completion_map.get(date) else 0) # 1 for completed, 0 for missed/no entry
-                
-            # Create plot
-            fig, ax = plt.subplots(figsize=(12, 6))
-            
-            # Use numerical indices for plotting, and set labels separately for both types
-            x_indices = range(len(date_range_str))
-
-            if chart_style == "Line Plot":
-                ax.plot(x_indices, completion_values, color='green',
-                           marker='o', linestyle='-', linewidth=2,
-                           markersize=8, label='Completed')
-                # Set x-axis ticks for line plot (can be sparse for long ranges)
-                tick_positions = list(range(0, len(date_range_str), max(1, len(date_range_str)//10)))
-                ax.set_xticks(tick_positions)
-                ax.set_xticklabels([date_range_str[i] for i in tick_positions], rotation=45, ha="right")
-            elif chart_style == "Bar Chart":
-                ax.bar(x_indices, completion_values, color='green', width=0.6, label='Completed')
-                # Set x-axis ticks for bar chart (usually one tick per bar)
-                ax.set_xticks(x_indices)
-                ax.set_xticklabels(date_range_str, rotation=45, ha="right")
-                # Adjust x-axis limits slightly for bar charts for better visual
-                ax.set_xlim(-0.5, len(date_range_str) - 0.5)
-
-            # Customize plot
-            ax.set_title(f'Habit Tracking: {habit_name}', pad=20, size=14)
-            ax.set_xlabel('Date', size=12)
-            ax.set_ylabel('Completion (0=Missed, 1=Completed)', size=12)
-            
-            # Set y-axis ticks
-            ax.set_yticks([0, 1])
-            ax.set_yticklabels(['Missed', 'Completed'])
-            
-            # Add grid
-            ax.grid(True, linestyle='--', alpha=0.7)
-            
-            # Add streak annotations if enabled
-            if show_streak_annotations and filtered_habit_logs:
-                # Calculate daily streaks for annotations based on the plotted data
-                current_streak = 0
-                for i, date_str in enumerate(date_range_str):
-                    is_completed = (completion_values[i] == 1) # Directly use completion_values
-                    if is_completed:
-                        current_streak += 1
-                    else:
-                        current_streak = 0 # Streak breaks on a miss or missing entry
-
-                    if current_streak > 0: # Only annotate non-zero streaks
-                        # Get the y-position for the annotation
-                        y_pos = completion_values[i]
-                        
-                        # Adjust y_offset based on chart type for better visual placement
-                        y_offset = 0.05 if chart_style == "Bar Chart" else 0.08
-
-                        ax.text(
-                            i, # x-position (index in date_range_str)
-                            y_pos + y_offset, # y-position above the point/bar
-                            f"🔥{current_streak}",
-                            ha='center', # Horizontal alignment: center
-                            va='bottom', # Vertical alignment: bottom of text is at y_pos + y_offset
-                            color='orange',
-                            fontweight='bold',
-                            fontsize=15,
-                            fontfamily=EMOJI_FONTS
-                        )
-
-            # Adjust layout
-            plt.tight_layout()
-            
             # Save plot
             plots_dir = PLOTS_DIR
             os.makedirs(plots_dir, exist_ok=True)
             
-            filename = f'habit_streak_{habit_name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-            filepath = os.path.join(plots_dir, filename)
-            
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()  # Clean up
+            filename = f'habit_streak_{habit_name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
+            filepath = save_figure(fig, os.path.join(plots_dir, filename), render_profile)
+            if register:
+                register_rendered_plot(filepath, logs, habit_name, chart_style, date_range)
             
             return filepath
             
     except Exception as e:
         print(f"Error creating visualization: {str(e)}")
-        return None
\ No newline at end of file
+        return None
+
+def visualize_dashboard(logs, habits, date_range="All Time", output="file", size_px=None):
+    """
+    Create the multi-habit dashboard.
+
+    output="file" saves a PNG in PLOTS_DIR and returns its path;
+    output="rgba" returns the chart rasterized at size_px as an RGBA array.
+    """
+    try:
+        with plt_lock:
+            if output == "rgba":
+                width, height = size_px or (1200, 600)
+                fig = build_dashboard_figure(logs, habits, date_range,
+                                             figsize=(width / SCREEN_DPI, height / SCREEN_DPI), dpi=SCREEN_DPI)
+                return figure_to_rgba(fig) if fig is not None else None
+
+            fig = build_dashboard_figure(logs, habits, date_range)
+            if fig is None:
+                return None
+
+            os.makedirs(PLOTS_DIR, exist_ok=True)
+            filename = f'{DASHBOARD_PREFIX}{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
+            filepath = os.path.join(PLOTS_DIR, filename)
+
+            fig.savefig(filepath, dpi=200, bbox_inches='tight')
+            register_plot(filepath, DASHBOARD_HABIT, date_range, "Dashboard",
+                          compute_data_hash(logs, None, date_range))
+            return filepath
+
+    except Exception as e:
+        print(f"Error creating dashboard: {str(e)}")
+        return None
+
+def benchmark_render_profiles(logs, habit_name, chart_style="Line Plot", date_range="All Time", repeats=3):
+    """
+    Time every render profile on one habit's chart.
+    Returns [(profile_name, format, best_save_seconds, file_size_bytes), ...].
+    The chart is built once per profile; only the encode (savefig) is timed.
+    Files go to a temporary directory and are not indexed.
+    """
+    import tempfile
+
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir, plt_lock:
+        for name, render_profile in RENDER_PROFILES.items():
+            fig = build_habit_figure(logs, habit_name, chart_style, True, date_range,
+                                     figsize=render_profile["figsize"])
+            if fig is None:
+                return []
+            best = None
+            for _ in range(repeats):
+                start_time = time.perf_counter()
+                filepath = save_figure(fig, os.path.join(temp_dir, name.lower()), render_profile)
+                elapsed = time.perf_counter() - start_time
+                best = elapsed if best is None else min(best, elapsed)
+            results.append((name, render_profile["format"], best, os.path.getsize(filepath)))
+    return results
+
+# Habits listed per summary page of the PDF report
+REPORT_SUMMARY_ROWS = 30
+
+def _draw_report_summary(fig, rows, date_range, page, num_pages):
+    """Draw one page of the report's summary table onto an empty figure."""
+    ax = fig.add_subplot()
+    ax.axis('off')
+    title = f'Habit Report ({date_range}) - generated {datetime.now().strftime("%Y-%m-%d %H:%M")}'
+    if num_pages > 1:
+        title += f' - summary {page}/{num_pages}'
+    ax.set_title(title, pad=20, size=14)
+    # Rows keep the same height whether the page is full or not
+    height = (len(rows) + 1) / (REPORT_SUMMARY_ROWS + 1)
+    table = ax.table(
+        cellText=rows,
+        colLabels=['Habit', 'Days', 'Completion', 'Current Streak', 'Best Streak'],
+        cellLoc='center',
+        bbox=[0, 1 - height, 1, height]
+    )
+    table.auto_set_font_size(False)
+    table.set_fontsize(10)
+
+def export_pdf_report(logs, habits, filepath, date_range="Last 30 Days", chart_style="Line Plot",
+                      show_streak_annotations=True):
+    """
+    Write a multi-page PDF: summary page(s) followed by one page per habit.
+    A single Agg figure is cleared and redrawn for every page, and pages are
+    streamed to disk as they are drawn, so memory does not grow with the
+    number of habits. Returns the number of pages written, or None on error.
+    """
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    try:
+        index = get_log_index(logs)
+
+        with plt_lock:
+            fig = Figure(figsize=(11.69, 8.27), dpi=100)  # A4 landscape
+            FigureCanvasAgg(fig)
+            pages = 0
+
+            with PdfPages(filepath) as pdf:
+                # Summary first: it only needs the daily series, not the charts
+                rows = []
+                for habit in habits:
+                    filtered = index.logs_for(habit, date_range)
+                    _, daily_values = _build_daily_series(filtered, date_range)
+                    rate, current, longest = _series_stats(daily_values) if filtered else (0.0, 0, 0)
+                    rows.append([habit, str(len(daily_values) if filtered else 0), f'{rate:.0%}', str(current), str(longest)])
+
+                summary_pages = max(1, -(-len(rows) // REPORT_SUMMARY_ROWS))
+                for page in range(summary_pages):
+                    chunk = rows[page * REPORT_SUMMARY_ROWS:(page + 1) * REPORT_SUMMARY_ROWS] or [['-'] * 5]
+                    _draw_report_summary(fig, chunk, date_range, page + 1, summary_pages)
+                    pdf.savefig(fig)
+                    fig.clear()
+                    pages += 1
+
+                for habit in habits:
+                    _draw_habit_chart(fig, index.logs_for(habit, date_range), habit, chart_style,
+                                      show_streak_annotations, date_range)
+                    pdf.savefig(fig)
+                    fig.clear()
+                    pages += 1
+
+                info = pdf.infodict()
+                info['Title'] = f'Habit Report ({date_range})'
+                info['Creator'] = 'HERALDEXX Habit Tracker'
+            return pages
+
+    except Exception as e:
+        print(f"Error creating PDF report: {str(e)}")
+        return None
+
+class LiveHabitChart:
+    """
+    A long-lived chart for embedding in the GUI (e.g. on a FigureCanvasTkAgg).
+
+    The figure is built once. Switching habit or date range updates the data,
+    limits and ticks in place and redraws; toggling today's completion only
+    restores the cached background and redraws the series artist (blitting).
+    """
+
+    def __init__(self, figsize=(8, 4), dpi=SCREEN_DPI):
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot()
+        self.line, = self.ax.plot([], [], color='green', marker='o', linestyle='-',
+                                  linewidth=2, markersize=4, animated=True)
+        self.ax.grid(True, linestyle='--', alpha=0.7)
+        # Fixed margins instead of tight_layout() so range switches skip a layout pass
+        self.figure.subplots_adjust(left=0.12, right=0.98, top=0.9, bottom=0.25)
+
+        self.habit_name = None
+        self.date_range = None
+        self.last_update_ms = 0.0
+        self._background = None
+        self._start_date = None
+        self._daily_values = np.zeros(0, dtype=np.int8)
+        self._draw_cid = None
+        self.attach(self.figure.canvas)
+
+    def attach(self, canvas):
+        """Use canvas (e.g. a FigureCanvasTkAgg) for drawing and blitting."""
+        if self._draw_cid is not None:
+            self.figure.canvas.mpl_disconnect(self._draw_cid)
+        self._background = None
+        self._draw_cid = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        """Cache everything except the animated series after each full draw."""
+        canvas = self.figure.canvas
+        self._background = canvas.copy_from_bbox(self.figure.bbox)
+        self.ax.draw_artist(self.line)
+
+    def set_data(self, logs, habit_name, date_range="All Time"):
+        """Show habit_name over date_range. Updates artists in place and schedules one full draw."""
+        start = time.perf_counter()
+        habit_logs = get_log_index(logs).logs_for(habit_name, date_range)
+        self.habit_name = habit_name
+        self.date_range = date_range
+        self._start_date, self._daily_values = _build_daily_series(habit_logs, date_range)
+
+        date_labels, values, granularity = _aggregate_series(self._start_date, self._daily_values)
+        self.line.set_data(np.arange(len(values)), values)
+
+        tick_positions = _tick_positions(len(date_labels))
+        self.ax.set_xlim(-0.5, max(len(values) - 0.5, 0.5))
+        self.ax.set_ylim(-0.1, 1.1)
+        self.ax.set_xticks(tick_positions)
+        self.ax.set_xticklabels(date_labels[tick_positions], rotation=45, ha="right")
+        if granularity == "daily":
+            self.ax.set_yticks([0, 1])
+            self.ax.set_yticklabels(['Missed', 'Completed'])
+            self.ax.set_title(f'{habit_name} ({date_range})', size=12)
+        else:
+            self.ax.set_yticks([0, 0.5, 1])
+            self.ax.set_yticklabels(['0%', '50%', '100%'])
+            self.ax.set_title(f'{habit_name} ({date_range}, {granularity} completion rate)', size=12)
+
+        self.last_update_ms = (time.perf_counter() - start) * 1000
+        # Axes changed, so one full draw is needed; it also refreshes the blit background
+        self.figure.canvas.draw_idle()
+
+    def update_day(self, date_str, completed):
+        """
+        Update a single day's completion. Blits when the day is already on the
+        chart; falls back to set_data-style redraw when the x range must grow.
+        Returns the update time in milliseconds.
+        """
+        start = time.perf_counter()
+        if self._start_date is None:
+            return 0.0
+
+        index = int((np.datetime64(date_str, 'D') - self._start_date).astype(int))
+        if not 0 <= index < len(self._daily_values):
+            return 0.0  # Outside the plotted range; caller should call set_data
+
+        self._daily_values[index] = 1 if completed else 0
+        _, values, _ = _aggregate_series(self._start_date, self._daily_values)
+        self.line.set_ydata(values)
+
+        canvas = self.figure.canvas
+        if self._background is None:
+            canvas.draw_idle()
+        else:
+            canvas.restore_region(self._background)
+            self.ax.draw_artist(self.line)
+            canvas.blit(self.figure.bbox)
+
+        self.last_update_ms = (time.perf_counter() - start) * 1000
+        return self.last_update_ms
+
+    def covers(self, date_str):
+        """True if date_str falls inside the currently plotted range."""
+        if self._start_date is None:
+            return False
+        index = int((np.datetime64(date_str, 'D') - self._start_date).astype(int))
+        return 0 <= index < len(self._daily_values)
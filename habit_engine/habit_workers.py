@@ -0,0 +1,166 @@
+# Runs chart rendering in a separate, pre-warmed worker process.
+# Agg rasterization and image encoding hold the GIL for most of a render, so a
+# render on a thread still stalls the Tk event loop; in a worker process it
+# only costs the GUI the time to unpickle the result.
+# Workers never touch the plot index: file renders return the path and the
+# GUI process registers it. Only the rendered habit's logs within the date
+# range are sent, so a job pickles (and the worker indexes) a few hundred logs
+# rather than the whole history.
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from colorama import Fore, Style
+
+# Render backends selectable in settings
+RENDER_BACKENDS = ["process", "thread"]
+
+def _init_worker():
+    """Import matplotlib and resolve fonts once when the worker starts."""
+    from habit_engine.habit_visualization import warm_up_fonts
+    warm_up_fonts()
+
+def _ping():
+    return os.getpid()
+
+def _render_rgba(logs, habit_name, chart_style, show_streak_annotations, date_range, size_px):
+    # Drawn directly rather than through visualize_habit_streak: the GUI process
+    # keeps the render cache, a second copy in the worker would only use memory
+    from habit_engine.habit_visualization import build_habit_figure, figure_to_rgba, plt_lock, SCREEN_DPI
+    width, height = size_px or (1200, 600)
+    with plt_lock:
+        fig = build_habit_figure(logs, habit_name, chart_style, show_streak_annotations, date_range,
+                                 figsize=(width / SCREEN_DPI, height / SCREEN_DPI), dpi=SCREEN_DPI)
+        return figure_to_rgba(fig) if fig is not None else None
+
+def _render_file(logs, habit_name, chart_style, show_streak_annotations, date_range, profile):
+    from habit_engine.habit_visualization import visualize_habit_streak
+    return visualize_habit_streak(logs, habit_name, chart_style=chart_style,
+                                  show_streak_annotations=show_streak_annotations, date_range=date_range,
+                                  profile=profile, register=False)
+
+def _logs_for_job(logs, habit_name, date_range):
+    """
+    The part of logs a worker needs to draw habit_name over date_range. If
+    nothing falls in the range the habit's full logs are sent, so the worker
+    still draws the empty range instead of reporting that there is no data.
+    """
+    from habit_engine.habit_visualization import get_log_index
+    index = get_log_index(logs)
+    return index.logs_for(habit_name, date_range) or index.logs_for(habit_name)
+
+class RenderPool:
+    """
+    A persistent ProcessPoolExecutor for chart renders. The worker is started
+    and warmed up in the background by start(), and restarted transparently
+    if it dies. Methods return concurrent.futures.Future objects.
+    """
+
+    def __init__(self, max_workers=1):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that runs Tk and other threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker
+                )
+            return self._executor
+
+    def start(self):
+        """Start the worker process(es) now so the first render does not pay for it."""
+        try:
+            for _ in range(self.max_workers):
+                self._get_executor().submit(_ping)
+        except Exception as e:
+            print(f"{Fore.LIGHTRED_EX}Error starting render worker: {e}{Style.RESET_ALL}")
+
+    def submit(self, fn, *args):
+        try:
+            return self._get_executor().submit(fn, *args)
+        except (BrokenProcessPool, RuntimeError):
+            # Worker died (or pool was shut down): start a fresh one and retry once
+            with self._lock:
+                self._executor = None
+            return self._get_executor().submit(fn, *args)
+
+    def render_rgba(self, logs, habit_name, chart_style, show_streak_annotations, date_range, size_px):
+        return self.submit(_render_rgba, _logs_for_job(logs, habit_name, date_range), habit_name, chart_style,
+                           show_streak_annotations, date_range, size_px)
+
+    def render_file(self, logs, habit_name, chart_style, show_streak_annotations, date_range, profile):
+        return self.submit(_render_file, _logs_for_job(logs, habit_name, date_range), habit_name, chart_style,
+                           show_streak_annotations, date_range, profile)
+
+    def shutdown(self, wait=True):
+        """Stop the worker(s), dropping queued renders. wait=True lets a running render finish first."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+def measure_stall(job, interval_ms=10):
+    """
+    Run job() on a background thread while the calling thread wakes up every
+    interval_ms, the way Tk's event loop services after() callbacks.
+    Returns (result, elapsed_seconds, max_stall_ms, total_stall_ms), where a
+    stall is how much later than scheduled a wake-up happened.
+    """
+    outcome = {}
+
+    def run():
+        outcome["result"] = job()
+
+    worker = threading.Thread(target=run, daemon=True)
+    start_time = time.perf_counter()
+    worker.start()
+    max_stall = total_stall = 0.0
+    while worker.is_alive():
+        tick = time.perf_counter()
+        time.sleep(interval_ms / 1000)
+        late = (time.perf_counter() - tick) * 1000 - interval_ms
+        if late > 0:
+            max_stall = max(max_stall, late)
+            total_stall += late
+    worker.join()
+    return outcome.get("result"), time.perf_counter() - start_time, max_stall, total_stall
+
+def benchmark_render_backends(logs, habit_name, chart_style="Line Plot", date_range="All Time", size_px=(1200, 600), repeats=3):
+    """
+    Render one habit's in-memory chart on a thread and in a pre-warmed worker
+    process, measuring how long the calling thread is stalled meanwhile.
+    Returns [(backend, best_render_seconds, worst_max_stall_ms, avg_total_stall_ms), ...].
+    """
+    from habit_engine.habit_visualization import warm_up_fonts
+
+    warm_up_fonts()
+    pool = RenderPool()
+    pool.submit(_ping).result()  # Worker started and warmed up before timing
+    jobs = {
+        "thread": lambda: _render_rgba(logs, habit_name, chart_style, True, date_range, size_px),
+        "process": lambda: pool.render_rgba(logs, habit_name, chart_style, True, date_range, size_px).result()
+    }
+    results = []
+    try:
+        for backend in RENDER_BACKENDS[::-1]:
+            best = worst_stall = total = 0.0
+            for attempt in range(repeats):
+                rgba, elapsed, max_stall, total_stall = measure_stall(jobs[backend])
+                if rgba is None:
+                    return []
+                best = elapsed if attempt == 0 else min(best, elapsed)
+                worst_stall = max(worst_stall, max_stall)
+                total += total_stall
+            results.append((backend, best, worst_stall, total / repeats))
+    finally:
+        pool.shutdown()
+    return results
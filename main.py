@@ -3,6 +3,7 @@
 from colorama import init, Fore, Style
 import time
 import platform
+import multiprocessing
 
 # Cross-platform console input handling
 if platform.system() == "Windows":
@@ -51,7 +52,19 @@ def getch():
 )
 
 # Only import visualization when needed
-from habit_engine.habit_visualization import visualize_habit_streak
+from habit_engine.habit_visualization import (
+    visualize_habit_streak,
+    visualize_dashboard,
+    export_pdf_report,
+    benchmark_render_profiles,
+    is_valid_date_range,
+    DATE_RANGES,
+    CHART_STYLES,
+    RENDER_PROFILES,
+    DEFAULT_RENDER_PROFILE
+)
+from habit_engine.habit_plots import apply_retention_settings
+from habit_engine.habit_workers import benchmark_render_backends
 
 init()
 
@@ -76,6 +89,12 @@ def wait_for_key():
         except (EOFError, KeyboardInterrupt):
             pass
 
+def report_retention(result):
+    """Print what the plot retention limits removed, if anything."""
+    deleted, freed = result
+    if deleted:
+        print(f"{Fore.LIGHTYELLOW_EX}\nPlot retention removed {deleted} old plot(s), {freed / (1024 * 1024):.1f} MB reclaimed.{Style.RESET_ALL}")
+
 def handle_program_exit(exit_code=0, message=None):
     """Handle program exit with optional message."""
     try:
@@ -111,8 +130,10 @@ def handle_program_exit(exit_code=0, message=None):
         time.sleep(2)
         sys.exit(exit_code)
 
-debug_print(f"{__app_name__} v{__version__} is running...")
-debug_print(f"{__copyright__}")
+# Chart render worker processes re-import this module; only announce the app once
+if multiprocessing.current_process().name == "MainProcess":
+    debug_print(f"{__app_name__} v{__version__} is running...")
+    debug_print(f"{__copyright__}")
 
 def run_gui_mode():
     """Run the application in GUI mode."""
@@ -139,6 +160,14 @@ def run_gui_mode():
     except Exception as e:
         handle_program_exit(1, f"\nUnexpected error in GUI mode: {str(e)}")
 
+def get_option_value(flag, default=None):
+    """Return the value following flag in sys.argv (e.g. --range "All Time"), or default."""
+    if flag in sys.argv:
+        idx = sys.argv.index(flag)
+        if idx + 1 < len(sys.argv):
+            return sys.argv[idx + 1]
+    return default
+
 def run_cli_mode():
     """Run the application in CLI mode."""
     try:
@@ -188,6 +217,9 @@ def run_cli_mode():
             elif sys.argv[1] in ['-p', '--plot']:
                 if not habits:
                     handle_program_exit(1, "\nNo habits found. Please set up habits first.")
+                profile = get_option_value('--profile', load_settings().get("render_profile", DEFAULT_RENDER_PROFILE))
+                if profile not in RENDER_PROFILES:
+                    handle_program_exit(1, f"\nInvalid render profile '{profile}'. Choose from: {', '.join(RENDER_PROFILES)}")
                 print(f"\n{Fore.LIGHTWHITE_EX}Available habits:{Style.RESET_ALL}")
                 for i, habit in enumerate(habits, 1):
                     print(f"{Fore.LIGHTMAGENTA_EX}{i}. {Fore.LIGHTBLUE_EX}{habit}{Style.RESET_ALL}")
@@ -201,9 +233,10 @@ def run_cli_mode():
                         if not habit_logs:
                             handle_program_exit(1, "\nNo tracking data found for this habit yet.")
                         
-                        print(f"\n{Fore.LIGHTCYAN_EX}Generating visualization...{Style.RESET_ALL}")
-                        plot_filename = visualize_habit_streak(daily_logs, habits[idx])
+                        print(f"\n{Fore.LIGHTCYAN_EX}Generating visualization ({profile} profile)...{Style.RESET_ALL}")
+                        plot_filename = visualize_habit_streak(daily_logs, habits[idx], profile=profile)
                         if plot_filename:
+                            report_retention(apply_retention_settings(load_settings(), protect=[plot_filename]))
                             path = os.path.abspath(PLOTS_DIR)
                             message = f"\nVisualization created successfully! Plot for '{habits[idx]}' is saved in {path}."
                             handle_program_exit(0, message)
@@ -217,6 +250,74 @@ def run_cli_mode():
                     handle_program_exit(message="\nVisualization cancelled by user.")
                 except Exception as e:
                     handle_program_exit(1, f"\nError creating visualization: {str(e)}")
+            elif sys.argv[1] in ['-d', '--dashboard']:
+                if not habits:
+                    handle_program_exit(1, "\nNo habits found. Please set up habits first.")
+                date_range = sys.argv[2] if len(sys.argv) > 2 else load_settings().get("chart_date_range", "All Time")
+                if not is_valid_date_range(date_range):
+                    handle_program_exit(1, f"\nInvalid date range '{date_range}'. Use {', '.join(DATE_RANGES)} or YYYY-MM-DD..YYYY-MM-DD")
+                print(f"\n{Fore.LIGHTCYAN_EX}Generating dashboard for {len(habits)} habit(s) ({date_range})...{Style.RESET_ALL}")
+                plot_filename = visualize_dashboard(daily_logs, habits, date_range)
+                if plot_filename:
+                    report_retention(apply_retention_settings(load_settings(), protect=[plot_filename]))
+                    handle_program_exit(0, f"\nDashboard created successfully! Saved as {os.path.abspath(plot_filename)}.")
+                handle_program_exit(1, "\nFailed to create dashboard.")
+            elif sys.argv[1] in ['--report']:
+                if len(sys.argv) < 3 or sys.argv[2].startswith('-'):
+                    handle_program_exit(1, "\nUsage: main.py --report out.pdf [--range \"Last 30 Days\"] [--style \"Line Plot\"]")
+                if not habits:
+                    handle_program_exit(1, "\nNo habits found. Please set up habits first.")
+                settings = load_settings()
+                report_path = os.path.abspath(sys.argv[2])
+                date_range = get_option_value('--range', settings.get("chart_date_range", "Last 30 Days"))
+                chart_style = get_option_value('--style', settings.get("chart_style", "Line Plot"))
+                if not is_valid_date_range(date_range):
+                    handle_program_exit(1, f"\nInvalid date range '{date_range}'. Use {', '.join(DATE_RANGES)} or YYYY-MM-DD..YYYY-MM-DD")
+                if chart_style not in CHART_STYLES:
+                    handle_program_exit(1, f"\nInvalid chart style '{chart_style}'. Choose from: {', '.join(CHART_STYLES)}")
+                print(f"\n{Fore.LIGHTCYAN_EX}Writing report for {len(habits)} habit(s) ({date_range})...{Style.RESET_ALL}")
+                pages = export_pdf_report(daily_logs, habits, report_path, date_range, chart_style,
+                                          settings.get("show_streak_annotations", True))
+                if pages:
+                    handle_program_exit(0, f"\nReport with {pages} page(s) saved as {report_path}.")
+                handle_program_exit(1, "\nFailed to create report.")
+            elif sys.argv[1] in ['--export-html']:
+                if len(sys.argv) < 3 or sys.argv[2].startswith('-'):
+                    handle_program_exit(1, "\nUsage: main.py --export-html DIR")
+                if not habits:
+                    handle_program_exit(1, "\nNo habits found. Please set up habits first.")
+                from habit_engine.habit_export import export_html_dashboard
+                out_dir = os.path.abspath(sys.argv[2])
+                result = export_html_dashboard(daily_logs, habits, out_dir)
+                if result:
+                    written, unchanged = result
+                    handle_program_exit(0, f"\nDashboard exported to {os.path.join(out_dir, 'index.html')} ({written} habit(s) updated, {unchanged} unchanged).")
+                handle_program_exit(1, "\nFailed to export HTML dashboard.")
+            elif sys.argv[1] in ['--benchmark-profiles']:
+                habit_name = sys.argv[2] if len(sys.argv) > 2 else next((h for h in habits if any(log[0] == h for log in daily_logs)), None)
+                if not habit_name:
+                    handle_program_exit(1, "\nNo tracking data found to benchmark with.")
+                print(f"\n{Fore.LIGHTCYAN_EX}Benchmarking render profiles on '{habit_name}'...{Style.RESET_ALL}\n")
+                results = benchmark_render_profiles(daily_logs, habit_name)
+                if not results:
+                    handle_program_exit(1, f"\nNo tracking data found for '{habit_name}'.")
+                print(f"{Fore.LIGHTWHITE_EX}{'Profile':<12}{'Format':<8}{'DPI':>5}{'Tight':>7}{'Save (ms)':>12}{'Size (KB)':>12}{Style.RESET_ALL}")
+                for name, image_format, seconds, size in results:
+                    render_profile = RENDER_PROFILES[name]
+                    print(f"{name:<12}{image_format:<8}{render_profile['dpi']:>5}{'yes' if render_profile['bbox_tight'] else 'no':>7}{seconds * 1000:>12.1f}{size / 1024:>12.1f}")
+                handle_program_exit()
+            elif sys.argv[1] in ['--benchmark-render-backends']:
+                habit_name = sys.argv[2] if len(sys.argv) > 2 else next((h for h in habits if any(log[0] == h for log in daily_logs)), None)
+                if not habit_name:
+                    handle_program_exit(1, "\nNo tracking data found to benchmark with.")
+                print(f"\n{Fore.LIGHTCYAN_EX}Measuring main-thread stalls while rendering '{habit_name}'...{Style.RESET_ALL}\n")
+                results = benchmark_render_backends(daily_logs, habit_name, load_settings().get("chart_style", "Line Plot"))
+                if not results:
+                    handle_program_exit(1, f"\nNo tracking data found for '{habit_name}'.")
+                print(f"{Fore.LIGHTWHITE_EX}{'Backend':<10}{'Render (ms)':>13}{'Longest stall (ms)':>20}{'Total stall (ms)':>18}{Style.RESET_ALL}")
+                for backend, seconds, max_stall, total_stall in results:
+                    print(f"{backend:<10}{seconds * 1000:>13.1f}{max_stall:>20.1f}{total_stall:>18.1f}")
+                handle_program_exit()
             elif sys.argv[1] in ['--cli']:
                 pass  # Continue with CLI mode
             elif sys.argv[1] in ['--gui']:
@@ -280,16 +381,28 @@ def display_help():
     
     print(f"\n{Fore.LIGHTMAGENTA_EX}Visualization:{Style.RESET_ALL}")
     print("  -p, --plot         Generate and view habit streak visualizations")
+    print("    [--profile NAME] Render profile: Print (default), Screen, Thumbnail or Vector")
+    print("  -d, --dashboard [RANGE]  Save a dashboard comparing all habits")
+    print("                     (RANGE: \"Last 7 Days\", \"Last 30 Days\", \"All Time\"")
+    print("                      or a custom YYYY-MM-DD..YYYY-MM-DD, either side may be empty)")
+    print("  --report FILE.pdf  Write a PDF report: summary page plus one page per habit")
+    print("    [--range RANGE]  Date range for the report (default: from settings)")
+    print("    [--style STYLE]  \"Line Plot\", \"Bar Chart\" or \"Calendar Heatmap\"")
+    print("  --export-html DIR  Export a static HTML dashboard (only changed habits are rewritten)")
     
     print(f"\n{Fore.LIGHTMAGENTA_EX}Development Options:{Style.RESET_ALL}")
     print("  --dev              Make core files writable for development")
     print("  --lock             Make core files read-only (default state)")
+    print("  --benchmark-profiles [HABIT]  Compare save time and file size of the render profiles")
+    print("  --benchmark-render-backends [HABIT]  Compare main-thread stalls of thread vs process rendering")
     
     print(f"\n{Fore.LIGHTMAGENTA_EX}Examples:{Style.RESET_ALL}")
     print("  python main.py                 # Start in GUI mode")
     print("  python main.py --cli           # Start in CLI mode")
     print("  python main.py -v-logs         # View tracking logs")
     print("  python main.py -p              # Generate visualizations")
+    print("  python main.py -d \"All Time\"   # Dashboard of all habits")
+    print("  python main.py --report weekly.pdf --range \"Last 7 Days\"  # PDF report")
     
     print(f"\n{Fore.LIGHTMAGENTA_EX}Notes:{Style.RESET_ALL}")
     print("  - For Windows executable, Data is stored in 'C:\\Users\\<username>\\.heraldexx-habit-tracker\\data'.")
@@ -304,6 +417,9 @@ def display_help():
     print(f"https://github.com/heraldexx/habit-tracker{Style.RESET_ALL}\n")
 
 if __name__ == "__main__": 
+    # Needed by the chart render worker process in frozen executables
+    multiprocessing.freeze_support()
+
     # Process "--cli" or "--gui" mode first
     cli_mode = False
     args_to_process = sys.argv[1:]  # Copy arguments list
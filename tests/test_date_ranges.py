@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from habit_engine.habit_visualization import (
+    LogIndex,
+    _build_daily_series,
+    _build_habit_matrix,
+    is_valid_date_range,
+    resolve_date_range,
+)
+
+
+def _days_from_today(days):
+    return (datetime.now().date() + timedelta(days=days)).isoformat()
+
+
+def test_open_range_starting_in_the_future_is_rejected():
+    date_range = f"{_days_from_today(30)}.."
+    assert not is_valid_date_range(date_range)
+    with pytest.raises(ValueError):
+        resolve_date_range(date_range)
+
+
+def test_open_range_starting_today_is_accepted():
+    assert resolve_date_range(f"{_days_from_today(0)}..") == (_days_from_today(0), None)
+
+
+def test_closed_future_range_gives_a_blank_series():
+    date_range = f"{_days_from_today(10)}..{_days_from_today(12)}"
+    start_date, values = _build_daily_series([], date_range)
+    assert str(start_date) == _days_from_today(10)
+    assert values.tolist() == [0, 0, 0]
+
+    start_date, matrix = _build_habit_matrix([], ["Read"], date_range)
+    assert matrix.shape == (1, 3)
+
+
+def test_log_index_skips_impossible_dates(capsys):
+    index = LogIndex([["Read", "2025-02-28", True], ["Read", "2025-02-30", True], ["Read", "2025-13-01", True]])
+    assert [log[1] for log in index.logs_for("Read", "All Time")] == ["2025-02-28"]
+    assert capsys.readouterr().out.count("invalid date format") == 2